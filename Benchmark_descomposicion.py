@@ -0,0 +1,85 @@
+import os
+import math
+import time
+import pandas as pd
+from pyomo.environ import value
+from pyomo.opt import SolverFactory
+from Funciones import *
+from Funciones_modelos import construir_modelo, agregar_F1
+from Funciones_descomposicion import resolver_benders
+
+# Compara el modelo F1 monolítico con la descomposición de Benders basada en
+# lógica (maestro de asistencia + subproblemas de escritorios por día) en
+# todas las instancias: FO, cota y tiempo hasta alcanzar la tolerancia.
+
+instancias = [f'instance{i}' for i in range(1, 11)]
+tiempo_limite = 3600 # Tiempo máximo por corrida en segundos
+tolerancia = 0.01 # 1% de tolerancia de optimalidad
+
+if __name__ == '__main__':
+    # Usar cbc como optimizador
+    solver = SolverFactory('cbc', executable='Optimizer\\Cbc-releases.2.10.12-windows-2022-msvs-v17-Release-x64\\bin\\cbc.exe')
+
+    resultados = []
+
+    for instancia in instancias:
+        inst = importar_data(os.path.join('instances', f'{instancia}.json'), imprimir=False)
+
+        # Modelo monolítico
+        inicio = time.perf_counter()
+        model = construir_modelo(inst, nombre='Universidad')
+        agregar_F1(model, inst)
+        solver.options['seconds'] = tiempo_limite
+        solver.options['ratio'] = tolerancia
+        resultado = solver.solve(model, tee=False)
+        tiempo = time.perf_counter() - inicio
+        fo = value(model.F1.distribucion_rule)
+        cota = resultado.problem.lower_bound
+        # CBC no reporta cota (None o infinita) si se detiene sin resolver la raíz o si es infactible
+        if cota is None or not math.isfinite(cota):
+            cota, gap = None, None
+        else:
+            gap = (fo - cota) / fo if fo else 0
+        resultados.append({
+            'Instancia': instancia,
+            'Metodo': 'monolitico',
+            'FO': fo,
+            'Cota': cota,
+            'Gap': gap,
+            'Iteraciones': None,
+            'Sin_escritorio': 0,
+            'Heuristico': False,
+            'Tiempo_optimo': round(tiempo, 2) if gap is not None and gap <= tolerancia else None,
+            'Tiempo_total': round(tiempo, 2),
+        })
+        print(resultados[-1])
+        del model
+
+        # Benders basado en lógica
+        benders = resolver_benders(inst, tiempo_limite, tolerancia=tolerancia, imprimir=False)
+        fo = benders['FO']
+        # Sin solución del maestro no hay FO con la cual medir el gap
+        if fo is None:
+            gap = None
+        else:
+            gap = (fo - benders['cota']) / fo if fo else 0
+        resultados.append({
+            'Instancia': instancia,
+            'Metodo': 'benders',
+            'FO': fo,
+            'Cota': benders['cota'],
+            'Gap': gap,
+            'Iteraciones': benders['iteraciones'],
+            'Sin_escritorio': len(benders['sin_escritorio']),
+            # Sin óptimo demostrado en los subproblemas la corrida es heurística
+            'Heuristico': not benders['optimo_demostrado'],
+            'Tiempo_optimo': round(benders['tiempo'], 2) if benders['optimo_demostrado'] else None,
+            'Tiempo_total': round(benders['tiempo'], 2),
+        })
+        print(resultados[-1])
+
+    df_benchmark = pd.DataFrame(resultados)
+    os.makedirs('Model_outputs', exist_ok=True)
+    df_benchmark.to_csv(os.path.join('Model_outputs', 'benchmark_descomposicion.csv'), index=False)
+
+    print(df_benchmark.pivot_table(index='Instancia', columns='Metodo', values=['FO', 'Tiempo_optimo'], sort=False))
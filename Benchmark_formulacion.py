@@ -0,0 +1,77 @@
+import os
+import math
+import time
+import pandas as pd
+from pyomo.environ import value, TransformationFactory
+from pyomo.opt import SolverFactory
+from Funciones import *
+from Funciones_modelos import construir_modelo, agregar_F1
+
+# Compara la formulación actual de F1 con la formulación fuerte (big-M de los datos,
+# cotas en J y P y desigualdades válidas) en todas las instancias:
+#   - brecha en la raíz: (FO - relajación lineal) / FO
+#   - tiempo hasta alcanzar 1% de gap
+
+# Usar cbc como optimizador
+solver = SolverFactory('cbc', executable='Optimizer\\Cbc-releases.2.10.12-windows-2022-msvs-v17-Release-x64\\bin\\cbc.exe')
+
+instancias = [f'instance{i}' for i in range(1, 11)]
+tiempo_limite = 3600 # Tiempo máximo por corrida en segundos
+tolerancia = 0.01 # 1% de tolerancia de optimalidad
+
+resultados = []
+
+for instancia in instancias:
+    inst = importar_data(os.path.join('instances', f'{instancia}.json'), imprimir=False)
+
+    for formulacion_fuerte in [False, True]:
+        inicio = time.perf_counter()
+        model = construir_modelo(inst, nombre='Universidad')
+        agregar_F1(model, inst, formulacion_fuerte=formulacion_fuerte)
+        tiempo_construccion = time.perf_counter() - inicio
+
+        # Relajación lineal (raíz sin cortes)
+        relajado = model.clone()
+        TransformationFactory('core.relax_integer_vars').apply_to(relajado)
+        solver.options.clear()
+        solver.solve(relajado, tee=False)
+        cota_raiz = value(relajado.F1.distribucion_rule)
+        del relajado
+
+        # Modelo entero
+        solver.options['seconds'] = tiempo_limite
+        solver.options['ratio'] = tolerancia
+        inicio = time.perf_counter()
+        resultado = solver.solve(model, tee=False)
+        tiempo_solucion = time.perf_counter() - inicio
+
+        fo = value(model.F1.distribucion_rule)
+        cota = resultado.problem.lower_bound
+        # CBC no reporta cota (None o infinita) si se detiene sin resolver la raíz o si es infactible
+        if cota is None or not math.isfinite(cota):
+            cota, gap = None, None
+        else:
+            gap = (fo - cota) / fo if fo else 0
+        brecha_raiz = (fo - cota_raiz) / fo if fo else 0
+
+        resultados.append({
+            'Instancia': instancia,
+            'Formulacion': 'fuerte' if formulacion_fuerte else 'actual',
+            'Tiempo_construccion': round(tiempo_construccion, 2),
+            'Cota_raiz': cota_raiz,
+            'FO': fo,
+            'Cota': cota,
+            'Gap': gap,
+            'Brecha_raiz': brecha_raiz,
+            'Tiempo_1pct': round(tiempo_solucion, 2) if gap is not None and gap <= tolerancia else None,
+            'Tiempo_total': round(tiempo_solucion, 2),
+        })
+        print(resultados[-1])
+
+        del model
+
+df_benchmark = pd.DataFrame(resultados)
+os.makedirs('Model_outputs', exist_ok=True)
+df_benchmark.to_csv(os.path.join('Model_outputs', 'benchmark_formulacion.csv'), index=False)
+
+print(df_benchmark.pivot_table(index='Instancia', columns='Formulacion', values=['Brecha_raiz', 'Tiempo_1pct'], sort=False))
@@ -0,0 +1,56 @@
+import os
+import time
+import pandas as pd
+from Funciones import *
+from Funciones_modelos import construir_modelo, agregar_F1, cargar_asignacion
+from Funciones_heuristica import heuristica_constructiva
+
+# Mide el tiempo de generación de los reportes (resumen, reuniones,
+# programacion_primario, programacion y preferencias) en todas las instancias:
+#   - por_reporte: cada reporte lee la solución del modelo por su cuenta
+#   - una_pasada: la solución se extrae una vez (tablas_solucion) y todos los
+#     reportes se derivan de esas tablas
+# El modelo se llena con la heurística constructiva, de modo que no se necesita CBC.
+
+instancias = [f'instance{i}' for i in range(1, 11)]
+repeticiones = 5 # Se reporta el mejor tiempo de las repeticiones
+
+def generar_reportes(model, inst):
+    E, D, T, G, Z, dz, dr, e_g, di, max, min = inst
+    resumen(E, D, T, Z, model, di, e_g)
+    reuniones(G, T, model, e_g, D, Z)
+    programacion_primario(model, G, T, e_g, D, Z)
+    programacion(model, E, D, T, Z, e_g)
+    preferencias(model, E, T, di)
+
+def medir(funcion):
+    tiempos = []
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        funcion()
+        tiempos.append(time.perf_counter() - inicio)
+    return min(tiempos)
+
+if __name__ == '__main__':
+    resultados = []
+    for instancia in instancias:
+        inst = importar_data(os.path.join('instances', f'{instancia}.json'), imprimir=False)
+        model = construir_modelo(inst, nombre='Universidad')
+        agregar_F1(model, inst)
+        cargar_asignacion(model, inst, heuristica_constructiva(inst))
+
+        por_reporte = medir(lambda: generar_reportes(model, inst))
+        una_pasada = medir(lambda: generar_reportes(tablas_solucion(model, inst.e_g), inst))
+
+        resultados.append({
+            'Instancia': instancia,
+            'Variables_X': len(model.X),
+            'Por_reporte': round(por_reporte, 4),
+            'Una_pasada': round(una_pasada, 4),
+            'Aceleracion': round(por_reporte / una_pasada, 2) if una_pasada else None,
+        })
+
+    df_resultados = pd.DataFrame(resultados)
+    print(df_resultados)
+    os.makedirs('Model_outputs', exist_ok=True)
+    df_resultados.to_csv(os.path.join('Model_outputs', 'benchmark_reportes.csv'), index=False)
@@ -1,266 +1,56 @@
 # import sys
 # import os
 # sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import os
 import pyomo
 from pyomo.environ import *
-from pyomo.opt import SolverFactory
 from Funciones import *
-from datetime import datetime
+from Funciones_despliegue import crear_trabajos, ejecutar_lote_planificado
+from Funciones_presupuesto import caracteristicas_instancia, leer_historial, proponer_tiempos, repartir_presupuesto
 
 
 
-# Usar cbc como optimizador
-solver = SolverFactory('cbc', executable='Optimizer\\Cbc-releases.2.10.12-windows-2022-msvs-v17-Release-x64\\bin\\cbc.exe')
-
 # instancias a correr
 ins = ['instance1', 'instance2', 'instance3', 'instance4', 'instance5']
-ins2 = ['instance6', 'instance7', 'instance8', 'instance9' 'instance10']
-
-for instancia in ins:
-    
-    # Ruta de la instancia JSON
- 
-    # Llamar a la función para importar datos
-    E, D, T, G, Z, dz, dr, e_g, di, max, min = importar_data(f'instances\\{instancia}.json', imprimir=False)
-
-    model = ConcreteModel(name='Universidad')
-    model.X = Var(E, D, T, Z, within=Binary, initialize = 0) # Si el colaborador e en el escritorio d asiste el dia d en la zona z
-    model.Y = Var(E, T, within=Binary, initialize = 0) # Si el colaborador e asiste el dia t
-    model.Z = Var(G, T, within=Binary, initialize = 0) # Si el grupo g tiene primario el dia t
-    model.J = Var(G, T, within=NonNegativeIntegers, initialize = 0) # Cantidad de zonas en las que está presente integrantes de cada grupo
-    model.P = Var(G, Z, T, within = Binary, initialize = 0) # Si el grupo g tiene presencia (al menos un colaborador) en la zona z
-
-    # Variables para penalizacion
-    model.Penalizacion = Var(E, within=Binary, initialize=0) # 1 si el colaborador asiste 1 dia, 0 si asiste 2
-    model.Penalizacion2 = Var(G, Z, T, within=Binary, initialize=0) # 1 si del grupo g en la zona z el dia t hay un solo colaborador, 0 EOC
-
-    # def satisfaccion_rule(model):
-    #     return sum(
-    #         model.X[e,d,t,z] * int(t in di[e])
-    #         for e in E
-    #         for d in D
-    #         for t in T
-    #         for z in Z
-    #     )
-    # model.satisfaccion = Objective(rule=satisfaccion_rule, sense=maximize)
-
-    # Funcion objetivo
-    def distribucion_rule(model):
-        return sum(model.J[g, t] for g in G for t in T) + sum(model.Penalizacion[e] for e in E) + sum(model.Penalizacion2[g, z, t] for g in G for z in Z for t in T)  # Minimizar la cantidad de zonas y penalizaciones
-    model.distribucion_rule = Objective(rule=distribucion_rule, sense=minimize)
-
-    #RESTRICCIONES
-    # Relación [X] con variable auxiliar Y
-    def dias_presencialidad(model, e, t):
-        return sum(model.X[e, d, t, z] for d in D for z in Z) == model.Y[e, t]
-    model.dias_presencialidad = Constraint(E, T, rule=dias_presencialidad)
-
-    # Días de presencialidad en el rango
-    def dias_min(model, e):
-        return sum(model.Y[e, t] for t in T) >= min - model.Penalizacion[e]
-    model.dias_min = Constraint(E, rule=dias_min)
-
-    def dias_max(model, e):
-        return sum(model.Y[e, t] for t in T) <= max
-    model.dias_max = Constraint(E, rule=dias_max)
-
-    # Asignar solo un escritorio si va dicho dia
-    def solo_un_escritorio(model, e, t):
-        return sum(model.X[e, d, t, z] for d in D for z in Z) <= 1
-    model.solo_un_escritorio = Constraint(E, T, rule=solo_un_escritorio)
-
-    # Cada colaborador debe estar en un escritorio de cumplas con sus caracteristicas
-    def colaborador_escritorio(model, e, d, t, z):
-        return model.X[e, d, t, z] <= int((d in dr[e]))
-    model.colaborador_escritorio = Constraint(E, D, T, Z, rule=colaborador_escritorio)
-
-    ###################################################################################################
-    # Un escritorio solo se le puede asignar a una persona
-    def escritorio_unico(model, d, t):
-        return sum(model.X[e, d, t, z] for e in E if d in dr[e] for z in Z if d in dz[z]) <= 1
-    model.escritorio_unico = Constraint(D, T, rule=escritorio_unico)
-
-    # No se debe asignar escritorios que no estan en esa zona #############################################
-    def no_esta_en_zona(model, e, d, t, z):
-        return model.X[e, d, t, z] <= int((d in dz[z]))
-    model.no_esta_en_zona = Constraint(E, D, T, Z, rule=no_esta_en_zona)
-    #######################################################################################################
-
-    # Cada grupo tiene grupo primario una vez
-    def grupo_primario(model, g):
-        return sum(model.Z[g, t] for t in T) == 1
-    model.grupo_primario = Constraint(G, rule=grupo_primario)
-
-    # Los integrantes de cada grupo deben asistir al primario
-    def asistencia_en_reunion(model, e, t, g):
-        if e in e_g[g]:
-            return model.Y[e, t] >= model.Z[g, t]
-        else:
-            return Constraint.Skip
-    model.asistencia_en_reunion = Constraint(E, T, G, rule=asistencia_en_reunion)
-
-    # No debe estar una persona "Sola" (Sola = no hay más colaboradores de su mismo equipo) en una zona
-    def sola(model, z, g, t):
-        return sum(model.X[e, d, t, z] for e in e_g[g] for d in dz[z]) >=  (model.P[g, z, t] * 2) - model.Penalizacion2[g, z, t]
-    model.sola = Constraint(Z, G, T, rule=sola)
-
-    def sola2(model, z, g, t):
-        return sum(model.X[e, d, t, z] for e in e_g[g] for d in dz[z]) <=  model.P[g, z, t] * 10000000000
-    model.sola2 = Constraint(Z, G, T, rule=sola2)
-
-    # Relacionar las variables J y P
-    def relacion_J_P(model, g, t):
-        return model.J[g, t] == sum(model.P[g, z, t] for z in Z)
-    model.relacion_J_P = Constraint(G, T, rule=relacion_J_P)
-
-    # Establecer límite de tiempo en segundos
-    solver.options['seconds'] = 3600  # Cambia este valor según tus necesidades
-
-    # Establecer tolerancia de optimalidad
-    solver.options['ratio'] = 0.01  # 1% de tolerancia de optimalidad
-    # Criterios de parada: tiempo máximo (en segundos) y tolerancia de optimalidad
-    solver.solve(
-        model,
-        tee=True,  # Muestra el log del solver
-    )
-
-    #########################################################################################
-
-    # Exportar modelo en pickle
-    
-    exportar_modelo(model, instancia)
-
-    # # Guardar la hora actual
-    # hora_actual = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-
-    # # Guardar la hora de finalización
-    # with open(f'Model_outputs\\hora_finalizacion_{instancia}.txt', 'w') as f:
-    #     f.write(hora_actual)
-
-    del model
-
-tiempo_maximo = 3600 # Tiempo máximo inicial en segundos (1 hora)
-for instancia in ins2:
-
-    # Llamar a la función para importar datos
-    E, D, T, G, Z, dz, dr, e_g, di, max, min = importar_data(f'instances\\{instancia}.json', imprimir=False)
-
-    model = ConcreteModel(name='Universidad')
-    model.X = Var(E, D, T, Z, within=Binary, initialize = 0) # Si el colaborador e en el escritorio d asiste el dia d en la zona z
-    model.Y = Var(E, T, within=Binary, initialize = 0) # Si el colaborador e asiste el dia t
-    model.Z = Var(G, T, within=Binary, initialize = 0) # Si el grupo g tiene primario el dia t
-    model.J = Var(G, T, within=NonNegativeIntegers, initialize = 0) # Cantidad de zonas en las que está presente integrantes de cada grupo
-    model.P = Var(G, Z, T, within = Binary, initialize = 0) # Si el grupo g tiene presencia (al menos un colaborador) en la zona z
-
-    # Variables para penalizacion
-    model.Penalizacion = Var(E, within=Binary, initialize=0) # 1 si el colaborador asiste 1 dia, 0 si asiste 2
-    model.Penalizacion2 = Var(G, Z, T, within=Binary, initialize=0) # 1 si del grupo g en la zona z el dia t hay un solo colaborador, 0 EOC
-
-    # def satisfaccion_rule(model):
-    #     return sum(
-    #         model.X[e,d,t,z] * int(t in di[e])
-    #         for e in E
-    #         for d in D
-    #         for t in T
-    #         for z in Z
-    #     )
-    # model.satisfaccion = Objective(rule=satisfaccion_rule, sense=maximize)
-
-    # Funcion objetivo
-    def distribucion_rule(model):
-        return sum(model.J[g, t] for g in G for t in T) + sum(model.Penalizacion[e] for e in E) + sum(model.Penalizacion2[g, z, t] for g in G for z in Z for t in T)  # Minimizar la cantidad de zonas y penalizaciones
-    model.distribucion_rule = Objective(rule=distribucion_rule, sense=minimize)
-
-    #RESTRICCIONES
-    # Relación [X] con variable auxiliar Y
-    def dias_presencialidad(model, e, t):
-        return sum(model.X[e, d, t, z] for d in D for z in Z) == model.Y[e, t]
-    model.dias_presencialidad = Constraint(E, T, rule=dias_presencialidad)
-
-    # Días de presencialidad en el rango
-    def dias_min(model, e):
-        return sum(model.Y[e, t] for t in T) >= min - model.Penalizacion[e]
-    model.dias_min = Constraint(E, rule=dias_min)
-
-    def dias_max(model, e):
-        return sum(model.Y[e, t] for t in T) <= max
-    model.dias_max = Constraint(E, rule=dias_max)
-
-    # Asignar solo un escritorio si va dicho dia
-    def solo_un_escritorio(model, e, t):
-        return sum(model.X[e, d, t, z] for d in D for z in Z) <= 1
-    model.solo_un_escritorio = Constraint(E, T, rule=solo_un_escritorio)
-
-    # Cada colaborador debe estar en un escritorio de cumplas con sus caracteristicas
-    def colaborador_escritorio(model, e, d, t, z):
-        return model.X[e, d, t, z] <= int((d in dr[e]))
-    model.colaborador_escritorio = Constraint(E, D, T, Z, rule=colaborador_escritorio)
-
-    ###################################################################################################
-    # Un escritorio solo se le puede asignar a una persona
-    def escritorio_unico(model, d, t):
-        return sum(model.X[e, d, t, z] for e in E if d in dr[e] for z in Z if d in dz[z]) <= 1
-    model.escritorio_unico = Constraint(D, T, rule=escritorio_unico)
-
-    # No se debe asignar escritorios que no estan en esa zona #############################################
-    def no_esta_en_zona(model, e, d, t, z):
-        return model.X[e, d, t, z] <= int((d in dz[z]))
-    model.no_esta_en_zona = Constraint(E, D, T, Z, rule=no_esta_en_zona)
-    #######################################################################################################
-
-    # Cada grupo tiene grupo primario una vez
-    def grupo_primario(model, g):
-        return sum(model.Z[g, t] for t in T) == 1
-    model.grupo_primario = Constraint(G, rule=grupo_primario)
-
-    # Los integrantes de cada grupo deben asistir al primario
-    def asistencia_en_reunion(model, e, t, g):
-        if e in e_g[g]:
-            return model.Y[e, t] >= model.Z[g, t]
-        else:
-            return Constraint.Skip
-    model.asistencia_en_reunion = Constraint(E, T, G, rule=asistencia_en_reunion)
-
-    # No debe estar una persona "Sola" (Sola = no hay más colaboradores de su mismo equipo) en una zona
-    def sola(model, z, g, t):
-        return sum(model.X[e, d, t, z] for e in e_g[g] for d in dz[z]) >=  (model.P[g, z, t] * 2) - model.Penalizacion2[g, z, t]
-    model.sola = Constraint(Z, G, T, rule=sola)
-
-    def sola2(model, z, g, t):
-        return sum(model.X[e, d, t, z] for e in e_g[g] for d in dz[z]) <=  model.P[g, z, t] * 10000000000
-    model.sola2 = Constraint(Z, G, T, rule=sola2)
-
-    # Relacionar las variables J y P
-    def relacion_J_P(model, g, t):
-        return model.J[g, t] == sum(model.P[g, z, t] for z in Z)
-    model.relacion_J_P = Constraint(G, T, rule=relacion_J_P)
-
-    # Establecer límite de tiempo en segundos
-    solver.options['seconds'] = tiempo_maximo  # Cambia este valor según tus necesidades
-
-    # Establecer tolerancia de optimalidad
-    solver.options['ratio'] = 0.01  # 1% de tolerancia de optimalidad
-    # Criterios de parada: tiempo máximo (en segundos) y tolerancia de optimalidad
-    solver.solve(
-        model,
-        tee=True,  # Muestra el log del solver
-    )
-
-    #########################################################################################
-
-    # Exportar modelo en pickle
-    
-    exportar_modelo(model, instancia)
-
-    # Guardar la hora actual
-    hora_actual = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-
-    # Guardar la hora de finalización
-    with open(f'Model_outputs\\hora_finalizacion_{instancia}.txt', 'w') as f:
-        f.write(hora_actual)
-
-    del model
-    tiempo_maximo += 1800 # Aumentar el tiempo máximo en 30 minutos para cada instancia
+ins2 = ['instance6', 'instance7', 'instance8', 'instance9', 'instance10']
+
+# Tiempo máximo en segundos: 1 hora para ins y, para ins2, 30 minutos más por cada instancia
+tiempo_maximo = {instancia: 3600 for instancia in ins}
+tiempo_maximo.update({instancia: 3600 + 1800 * i for i, instancia in enumerate(ins2)})
+
+# Variantes a correr: 'F1', 'F2' y/o 'epsilon'
+variantes = ['F1']
+
+# Con historial de corridas, los tiempos de cada variante se proponen para alcanzar el
+# gap objetivo dentro del presupuesto total (suma de los tiempos de todas las instancias),
+# repartido entre las variantes que se van a correr
+historial = os.path.join('Model_outputs', 'historial_tiempos.jsonl')
+presupuesto_total = sum(tiempo_maximo.values())
+if leer_historial(historial):
+    caracteristicas = {instancia: caracteristicas_instancia(importar_data(os.path.join('instances', f'{instancia}.json'), imprimir=False))
+                       for instancia in ins + ins2}
+    propuestos = {}
+    for variante, presupuesto in repartir_presupuesto(presupuesto_total, variantes).items():
+        propuesta = proponer_tiempos(caracteristicas, historial, presupuesto, gap_objetivo=0.01, variante=variante)
+        print(f'Tiempos propuestos ({variante}): {propuesta}')
+        propuestos.update({(instancia, variante): tiempo for instancia, tiempo in propuesta.items()})
+    tiempo_maximo = propuestos
+
+nucleos = None  # Núcleos a repartir entre los trabajos (None = todos los de la máquina)
+max_hilos = 8  # Máximo de threads de CBC por trabajo
+
+# Registro del lote: al correr de nuevo este script se omiten los trabajos completados y
+# los interrumpidos continúan desde su último incumbente. Para dar más tiempo a una
+# instancia ya terminada basta con subir su tiempo_maximo y correr de nuevo.
+registro = os.path.join('Model_outputs', 'registro_lote.json')
+intervalo = 600  # Segundos entre puntos de control del incumbente
+
+if __name__ == '__main__':
+    # Los trabajos se resuelven en paralelo (las instancias grandes con más threads
+    # de CBC) y cada uno guarda su solución y hora de finalización en Model_outputs*
+    # apenas termina
+    trabajos = crear_trabajos(ins + ins2, variantes, tiempo_maximo, tolerancia=0.01)
+    resultados = ejecutar_lote_planificado(trabajos, nucleos=nucleos, max_hilos=max_hilos, registro=registro, intervalo=intervalo, historial=historial)
 
 
 
@@ -269,38 +59,35 @@ for instancia in ins2:
 # instance = 'instance10'
 # carpeta = 'Model_outputs'
 
-# model = cargar_modelo(instance, carpeta)
+# solucion = cargar_solucion(instance, carpeta)
 
-# print(f'FO: {value(model.distribucion_rule)}')
+# print(f'FO: {solucion.objetivo}')
 
 
 # # Llamar a la función para importar datos
-# E, D, T, G, Z, dz, dr, e_g, di, max, min = importar_data(f'instances\\{instance}.json', imprimir=False)
+# inst = importar_data(f'instances\\{instance}.json', imprimir=False)
+# E, D, T, G, Z, dz, dr, e_g, di, max, min = inst
 
 
-# df_resumen = resumen(E, D, T, Z, model, di, e_g)
+# df_resumen = resumen(E, D, T, Z, solucion, di, e_g)
 
-# df_reuniones = reuniones(G, T, model, e_g, D, Z)
+# df_reuniones = reuniones(G, T, solucion, e_g, D, Z)
 
-# df_programacion_primario = programacion_primario(model, G, T, e_g, D, Z)
+# df_programacion_primario = programacion_primario(solucion, G, T, e_g, D, Z)
 
-# df_programacion = programacion(model, E, D, T, Z, e_g)
+# df_programacion = programacion(solucion, E, D, T, Z, e_g)
 
-# preferencias(model, E, T, di)
+# preferencias(solucion, E, T, di)
 
-# # Imprimir valores de penalizacion
+# # Imprimir valores de penalizacion (índices activos guardados en la solución)
 # print("Penalizaciones asociadas a que van un solo dia de la semana:")
-# for e in E:
-#     if model.Penalizacion[e].value > 0:
-#         print(f"Colaborador: {e} | grupo: {next((k for k, lista in e_g.items() if e in lista), None)}")
+# for e in solucion.Penalizacion:
+#     print(f"Colaborador: {e} | grupo: {inst.grupo(e)}")
 
 # print("\nPenalizaciones asociadas a que un grupo tiene un solo colaborador en una zona:")
 # # Imprimir valores de penalizacion2
-# for g in G:
-#     for z in Z:
-#         for t in T:
-#             if model.Penalizacion2[g, z, t].value > 0:
-#                 print(f"Grupo {g} en zona {z} el día {t} tiene penalización un colaborador solo")
+# for (g, z, t) in solucion.Penalizacion2:
+#     print(f"Grupo {g} en zona {z} el día {t} tiene penalización un colaborador solo")
 
 # print(f'E: {len(E)} | T: {len(T)} | Z: {len(Z)} | D: {len(D)} | G: {len(G)} | ')
 
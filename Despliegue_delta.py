@@ -0,0 +1,51 @@
+import os
+from Funciones import importar_data, cargar_solucion, exportar_solucion, programacion
+from Funciones_delta import reoptimizar_delta
+
+# Reoptimización incremental: la instancia nueva es una versión con pocos
+# cambios de una instancia ya resuelta (solución guardada con exportar_solucion).
+# instances/instance1_semana2.json es instance1 con los días preferidos de E3 y
+# E4 y los escritorios permitidos de E12 modificados. Si la solución de la
+# instancia anterior no existe (Model_F1.py la guarda), se resuelve primero F1
+# completo para crearla.
+
+instancia_anterior = 'instance1' # Instancia resuelta (instances/<nombre>.json y Model_outputs/solucion_<nombre>.npz)
+instancia_nueva = 'instance1_semana2' # Instancia modificada (instances/<nombre>.json)
+
+vecindario = 'grupos' # None, 'grupos' o 'zonas'
+tiempo_limite = 120 # Tiempo máximo del problema reducido en segundos
+tiempo_limite_base = 300 # Tiempo máximo de F1 completo si falta la solución anterior
+solver_path = 'Optimizer\\Cbc-releases.2.10.12-windows-2022-msvs-v17-Release-x64\\bin\\cbc.exe'
+
+if __name__ == '__main__':
+    for nombre in (instancia_anterior, instancia_nueva):
+        if not os.path.exists(os.path.join('instances', f'{nombre}.json')):
+            raise FileNotFoundError(f'No existe instances/{nombre}.json: la reoptimización delta necesita la instancia anterior y la nueva')
+
+    inst_anterior = importar_data(os.path.join('instances', f'{instancia_anterior}.json'), imprimir=False)
+    inst_nueva = importar_data(os.path.join('instances', f'{instancia_nueva}.json'), imprimir=False, verificar=True)
+
+    if not os.path.exists(os.path.join('Model_outputs', f'solucion_{instancia_anterior}.npz')):
+        from pyomo.opt import SolverFactory
+        from Funciones_modelos import construir_modelo, agregar_F1, solucion_entera
+
+        print(f'No existe Model_outputs/solucion_{instancia_anterior}.npz: se resuelve F1 de {instancia_anterior} ({tiempo_limite_base} s)')
+        model_base = construir_modelo(inst_anterior, nombre='Universidad')
+        agregar_F1(model_base, inst_anterior)
+        solver = SolverFactory('cbc', executable=solver_path)
+        solver.options['seconds'] = tiempo_limite_base
+        solver.options['ratio'] = 0.01
+        resultado = solver.solve(model_base, tee=False, load_solutions=False)
+        if not solucion_entera(resultado):
+            raise RuntimeError(f'CBC no encontró una solución entera de {instancia_anterior} en {tiempo_limite_base} s')
+        model_base.solutions.load_from(resultado)
+        exportar_solucion(model_base, instancia_anterior, 'Model_outputs', metadatos={'variante': 'F1', 'tiempo_limite': tiempo_limite_base})
+
+    asignacion = cargar_solucion(instancia_anterior, 'Model_outputs').asignacion()
+
+    model, cambios = reoptimizar_delta(inst_anterior, inst_nueva, asignacion, tiempo_limite, vecindario=vecindario, solver_path=solver_path)
+
+    os.makedirs('Model_outputs_delta', exist_ok=True)
+    df_programacion = programacion(model, inst_nueva.E, inst_nueva.D, inst_nueva.T, inst_nueva.Z, inst_nueva.e_g)
+    df_programacion.to_excel(os.path.join('Model_outputs_delta', f'programacion_{instancia_nueva}.xlsx'), index=False)
+    print(df_programacion)
@@ -0,0 +1,35 @@
+import os
+from datetime import datetime
+from Funciones import *
+from Funciones_descomposicion import resolver_descomposicion
+
+# Modelo F1 por descomposición: maestro (Y, Z, Penalizacion) y un subproblema
+# de escritorios por día resuelto en paralelo
+
+# instancias a correr
+instancias_a_correr = ['instance9', 'instance10']
+
+tiempo_maestro = 1800  # Tiempo máximo del maestro en segundos
+tiempo_dia = 300  # Tiempo máximo de cada subproblema diario en segundos
+
+if __name__ == '__main__':
+    os.makedirs('Model_outputs_descomposicion', exist_ok=True)
+
+    for instancia in instancias_a_correr:
+        inst = importar_data(os.path.join('instances', f'{instancia}.json'), imprimir=False)
+
+        resultado = resolver_descomposicion(inst, tiempo_maestro, tiempo_dia)
+
+        df_programacion = programacion_asignacion(resultado['X'], inst.e_g)
+
+        # Guardar resultados (solución compacta, ver exportar_solucion)
+        solucion = Solucion(resultado['X'], resultado['Y'], resultado['Z'], objetivo=resultado['FO'],
+                            metadatos={'variante': 'descomposicion', 'cota': resultado['cota'], 'sin_escritorio': resultado['sin_escritorio'],
+                                       'tiempo_maestro': tiempo_maestro, 'tiempo_dia': tiempo_dia})
+        exportar_solucion(solucion, instancia, 'Model_outputs_descomposicion')
+
+        # Guardar la hora de finalización
+        with open(os.path.join('Model_outputs_descomposicion', f'hora_finalizacion_{instancia}.txt'), 'w') as f:
+            f.write(datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+
+        print(f'{instancia} | FO: {resultado["FO"]} | Cota maestro: {resultado["cota"]}')
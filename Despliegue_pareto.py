@@ -0,0 +1,23 @@
+import os
+from Funciones_pareto import frontera_pareto
+
+# Frontera de Pareto satisfacción (F2) vs compacidad (F1) por epsilon restriccion
+
+# instancias a correr
+instancias_a_correr = ['instance1', 'instance2', 'instance3', 'instance4', 'instance5']
+
+# Niveles de satisfacción deseada (en Despliegue_epsilon se usa un solo nivel: 0.65)
+niveles = [0.5, 0.55, 0.6, 0.65, 0.7, 0.75, 0.8, 0.85, 0.9, 0.95, 1.0]
+
+tiempo_F2 = 300  # Tiempo máximo de F2 en segundos
+tiempo_punto = 600  # Tiempo máximo de cada punto de la frontera en segundos
+procesos = 1  # Procesos para repartir los puntos de la grilla
+
+if __name__ == '__main__':
+    os.makedirs('Model_outputs_pareto', exist_ok=True)
+
+    for instancia in instancias_a_correr:
+        df_pareto = frontera_pareto(instancia, niveles, tiempo_F2, tiempo_punto, procesos=procesos)
+        df_pareto.to_csv(os.path.join('Model_outputs_pareto', f'pareto_{instancia}.csv'), index=False)
+
+        print(df_pareto)
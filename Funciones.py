@@ -1,20 +1,31 @@
-def importar_data(instancia, imprimir=True):
+def importar_data(instancia, imprimir=True, verificar=False):
     import json
 
     '''
     Función para importar datos desde un archivo JSON para el modelo
     de optimizacion del reto ASOCIO 2025.
     
-    instancia: str
-        Ruta del archivo JSON que contiene los datos de la instancia.
+    instancia: str o dict
+        Ruta del archivo JSON que contiene los datos de la instancia, o el
+        diccionario ya cargado (mismo esquema que instances/*.json).
     
     imprimir: bool
         Si es True, imprime la información extraída para verificación.
+
+    verificar: bool
+        Si es True, corre analizar_instancia y lanza ValueError si la
+        instancia es infactible, antes de construir cualquier modelo.
+
+    Retorna un objeto Instancia, que también puede desempaquetarse como
+    E, D, T, G, Z, dz, dr, e_g, di, max, min.
     '''
 
     # Cargar el archivo JSON
-    with open(instancia, 'r') as file:
-        data = json.load(file)
+    if isinstance(instancia, dict):
+        data = instancia
+    else:
+        with open(instancia, 'r') as file:
+            data = json.load(file)
 
     # Extraer listas principales (Conjuntos)
     E = data['Employees']
@@ -28,8 +39,13 @@ def importar_data(instancia, imprimir=True):
     dr = data['Desks_E']
     e_g = data['Employees_G']
     di = data['Days_E']
-    max = 3
-    min = 2
+    # Días de presencialidad por horizonte (opcionales; por defecto una semana)
+    max = data.get('Max_Days', 3)
+    min = data.get('Min_Days', 2)
+
+    inst = Instancia(E, D, T, G, Z, dz, dr, e_g, di, max, min)
+    if verificar:
+        analizar_instancia(inst, imprimir=imprimir)
 
     if imprimir:
         # Mostrar información extraída para verificación
@@ -72,32 +88,504 @@ def importar_data(instancia, imprimir=True):
         print(f"Total de grupos: {len(G)}")
         print(f"Total de zonas: {len(Z)}")
     
-    return E, D, T, G, Z, dz, dr, e_g, di, max, min
+    return inst
 
-def exportar_modelo(model, nombre_instancia):
+class Instancia:
     '''
-    Función para exportar el modelo a un archivo pickle.
-    model: ConcreteModel
-        El modelo de optimización a exportar.
-    nombre_instancia: str
-        Nombre de la instancia para el archivo pickle.
+    Datos de una instancia con identificadores codificados como enteros
+    (posición en E, D, T, G y Z) y mapas inversos precalculados, para que
+    la construcción de los modelos y los reportes no recorran listas.
+    Conserva las listas y diccionarios originales y se puede desempaquetar
+    como la tupla E, D, T, G, Z, dz, dr, e_g, di, max, min.
+
+    zona_escritorio: array
+        Código de la zona de cada escritorio (-1 si no pertenece a ninguna).
+    grupo_colaborador: array
+        Código del grupo de cada colaborador (-1 si no pertenece a ninguno).
+    escritorios_colaborador: list of array
+        Códigos de los escritorios permitidos para cada colaborador.
+    colaboradores_escritorio: list of array
+        Códigos de los colaboradores que pueden usar cada escritorio.
+    mascara_dias: list
+        Bits de los días preferidos por cada colaborador (bit t = día T[t]),
+        como enteros de Python para horizontes de cualquier cantidad de días.
+    EDZ, edz_colaborador, edz_escritorio:
+        Combinaciones factibles (ver combinaciones_factibles).
+    edz_grupo_zona: dict
+        (g, z) -> [(e, d), ...] colaboradores del grupo g con escritorio en z.
     '''
-    import pickle
-    with open(f'Model_outputs\\model_{nombre_instancia}.pkl', 'wb') as f:
-        pickle.dump(model, f)
+    __slots__ = ('E', 'D', 'T', 'G', 'Z', 'dz', 'dr', 'e_g', 'di', 'max', 'min',
+                 'id_E', 'id_D', 'id_T', 'id_G', 'id_Z',
+                 'zona_escritorio', 'grupo_colaborador', 'escritorios_colaborador',
+                 'colaboradores_escritorio', 'mascara_dias',
+                 'EDZ', 'edz_colaborador', 'edz_escritorio', 'edz_grupo_zona')
+
+    def __init__(self, E, D, T, G, Z, dz, dr, e_g, di, max=3, min=2):
+        from array import array
+
+        self.E, self.D, self.T, self.G, self.Z = E, D, T, G, Z
+        self.dz, self.dr, self.e_g, self.di = dz, dr, e_g, di
+        self.max, self.min = max, min
+
+        self.id_E = {e: i for i, e in enumerate(E)}
+        self.id_D = {d: i for i, d in enumerate(D)}
+        self.id_T = {t: i for i, t in enumerate(T)}
+        self.id_G = {g: i for i, g in enumerate(G)}
+        self.id_Z = {z: i for i, z in enumerate(Z)}
+
+        self.zona_escritorio = array('i', [-1]) * len(D)
+        for z in Z:
+            for d in dz[z]:
+                self.zona_escritorio[self.id_D[d]] = self.id_Z[z]
+
+        self.grupo_colaborador = array('i', [-1]) * len(E)
+        for g in G:
+            for e in e_g[g]:
+                self.grupo_colaborador[self.id_E[e]] = self.id_G[g]
+
+        self.escritorios_colaborador = [array('i', (self.id_D[d] for d in dr[e])) for e in E]
+        colaboradores = [[] for _ in D]
+        for i, escritorios in enumerate(self.escritorios_colaborador):
+            for j in escritorios:
+                colaboradores[j].append(i)
+        self.colaboradores_escritorio = [array('i', c) for c in colaboradores]
+
+        self.mascara_dias = [0] * len(E)
+        for e in E:
+            mascara = 0
+            for t in di[e]:
+                mascara |= 1 << self.id_T[t]
+            self.mascara_dias[self.id_E[e]] = mascara
+
+        self.EDZ, self.edz_colaborador, self.edz_escritorio = combinaciones_factibles(E, Z, dz, dr)
+        self.edz_grupo_zona = {}
+        for (e, d, z) in self.EDZ:
+            g = self.grupo(e)
+            if g is not None:
+                self.edz_grupo_zona.setdefault((g, z), []).append((e, d))
+
+    def __iter__(self):
+        return iter((self.E, self.D, self.T, self.G, self.Z, self.dz, self.dr,
+                     self.e_g, self.di, self.max, self.min))
+
+    def grupo(self, e):
+        '''Grupo del colaborador e, o None si no pertenece a ninguno.'''
+        i = self.grupo_colaborador[self.id_E[e]]
+        return self.G[i] if i >= 0 else None
+
+    def zona(self, d):
+        '''Zona del escritorio d, o None si no pertenece a ninguna.'''
+        i = self.zona_escritorio[self.id_D[d]]
+        return self.Z[i] if i >= 0 else None
+
+    def prefiere(self, e, t):
+        '''True si t está entre los días preferidos del colaborador e.'''
+        return bool(self.mascara_dias[self.id_E[e]] >> self.id_T[t] & 1)
+
+    def combinaciones_grupo_zona(self, g, z):
+        '''Pares (e, d) de colaboradores del grupo g con escritorio permitido en la zona z.'''
+        return self.edz_grupo_zona.get((g, z), [])
+
+def combinaciones_factibles(E, Z, dz, dr):
+    '''
+    Función para construir las combinaciones (colaborador, escritorio, zona)
+    que pueden ocurrir en una solución: el escritorio d debe estar en la lista
+    de escritorios del colaborador (d in dr[e]) y pertenecer a la zona z
+    (d in dz[z]). Las variables de asignación se indexan solo sobre estas
+    combinaciones en lugar de E x D x Z.
+    E: list
+        Lista de colaboradores.
+    Z: list
+        Lista de zonas.
+    dz: dict
+        Diccionario que relaciona zonas con sus escritorios.
+    dr: dict
+        Diccionario que relaciona colaboradores con sus escritorios permitidos.
+
+    Retorna la lista EDZ de tuplas (e, d, z) y dos diccionarios auxiliares:
+    edz_colaborador[e] = [(d, z), ...] y edz_escritorio[d] = [(e, z), ...].
+    '''
+    zonas_escritorio = {}
+    for z in Z:
+        for d in dz[z]:
+            zonas_escritorio.setdefault(d, []).append(z)
+
+    EDZ = []
+    edz_colaborador = {e: [] for e in E}
+    edz_escritorio = {}
+    for e in E:
+        for d in dr[e]:
+            for z in zonas_escritorio.get(d, []):
+                EDZ.append((e, d, z))
+                edz_colaborador[e].append((d, z))
+                edz_escritorio.setdefault(d, []).append((e, z))
+
+    return EDZ, edz_colaborador, edz_escritorio
+
+def emparejamiento_bipartito(adyacencia, pareja=None, nodos=None):
+    '''
+    Emparejamiento bipartito máximo por caminos aumentantes (Kuhn), por
+    ejemplo colaboradores -> escritorios en un día.
+    adyacencia: dict
+        Nodo izquierdo -> lista de nodos derechos permitidos, en orden de
+        preferencia (se intentan primero los del inicio de la lista).
+    pareja: dict
+        Emparejamiento inicial nodo derecho -> nodo izquierdo. Se modifica y
+        se amplía, de modo que se puede llamar de nuevo con otra adyacencia
+        para emparejar a los nodos que quedaron libres.
+    nodos: list
+        Nodos izquierdos a emparejar, en orden (por defecto, todos).
+
+    Retorna el diccionario pareja (nodo derecho -> nodo izquierdo).
+    '''
+    if pareja is None:
+        pareja = {}
+    emparejados = set(pareja.values())
+
+    for u in (adyacencia if nodos is None else nodos):
+        if u in emparejados:
+            continue
+        visitados = set()
+        pila = [(u, iter(adyacencia.get(u, ())))]
+        camino = [] # Nodo derecho elegido en cada nivel de la pila
+        while pila:
+            actual, opciones = pila[-1]
+            for v in opciones:
+                if v in visitados:
+                    continue
+                visitados.add(v)
+                camino.append(v)
+                if v not in pareja:
+                    break
+                pila.append((pareja[v], iter(adyacencia.get(pareja[v], ()))))
+                break
+            else:
+                pila.pop()
+                if camino:
+                    camino.pop()
+                continue
+            if camino[-1] not in pareja:
+                # Camino aumentante: cada nodo de la pila toma el nodo derecho elegido
+                for (izquierdo, _), v in zip(pila, camino):
+                    pareja[v] = izquierdo
+                emparejados.add(u)
+                break
+
+    return pareja
+
+def conjunto_hall(adyacencia, pareja, u):
+    '''
+    Para un nodo izquierdo u que quedó libre en un emparejamiento máximo,
+    retorna el conjunto S de nodos izquierdos alcanzables desde u por caminos
+    alternantes y su vecindario N(S). Se cumple |N(S)| = |S| - 1 < |S|, es
+    decir, S viola la condición de Hall (por ejemplo, colaboradores que no
+    caben en los escritorios que tienen permitidos).
+    adyacencia: dict
+        Nodo izquierdo -> lista de nodos derechos permitidos.
+    pareja: dict
+        Emparejamiento máximo nodo derecho -> nodo izquierdo.
+    '''
+    S = {u}
+    vecinos = set()
+    pendientes = [u]
+    while pendientes:
+        x = pendientes.pop()
+        for v in adyacencia.get(x, ()):
+            if v in vecinos:
+                continue
+            vecinos.add(v)
+            y = pareja[v]
+            if y not in S:
+                S.add(y)
+                pendientes.append(y)
+    return S, vecinos
+
+def analizar_instancia(inst, variante='F1', estricto=True, imprimir=False):
+    '''
+    Verificaciones rápidas de condiciones necesarias de factibilidad, para
+    descartar una instancia antes de construir y resolver el modelo:
+        1. cada colaborador tiene al menos un escritorio utilizable (en
+           Desks_E y en alguna zona): sin escritorio no puede asistir ningún
+           día;
+        2. los días mínimos (min en F2; min - 1 en F1, por la penalización)
+           no superan max ni la cantidad de días;
+        3. cada grupo cabe en su día de reunión: emparejamiento bipartito de
+           sus integrantes con sus escritorios (condición de Hall); si no,
+           se reporta el conjunto de colaboradores que la viola;
+        4. capacidad por día: con nu el máximo de colaboradores que pueden
+           sentarse a la vez (emparejamiento de todos los colaboradores con
+           los escritorios), los días mínimos de todos y los integrantes de
+           todos los grupos deben caber en nu x días, y el grupo más grande
+           en nu.
+    Además reporta como advertencia (no impide la factibilidad, pero eleva
+    la FO de F1) los grupos que no caben en una sola zona.
+    inst: Instancia
+        Resultado de importar_data.
+    variante: str
+        'F1', 'F2' o 'epsilon' ('epsilon' se verifica como F1).
+    estricto: bool
+        Si es True, lanza ValueError cuando hay errores.
+
+    Retorna un diccionario con las listas 'errores' y 'advertencias' y el
+    'tiempo' del análisis en segundos.
+    '''
+    import time
+
+    inicio = time.perf_counter()
+    errores, advertencias = [], []
+    E, T, G = inst.E, inst.T, inst.G
+
+    # 1. Escritorios utilizables por colaborador
+    adyacencia = {e: list(dict.fromkeys(d for (d, z) in inst.edz_colaborador[e])) for e in E}
+    for e in E:
+        if not adyacencia[e]:
+            motivo = 'Desks_E vacío' if not inst.dr[e] else 'ninguno de sus escritorios pertenece a una zona'
+            errores.append(f'Colaborador {e} sin escritorio utilizable ({motivo})')
+
+    # 2. Rango de días
+    minimo = inst.min if variante == 'F2' else max(inst.min - 1, 0)
+    if minimo > inst.max:
+        errores.append(f'Días mínimos ({minimo}) mayores que los máximos ({inst.max})')
+    if minimo > len(T):
+        errores.append(f'Días mínimos ({minimo}) mayores que los días del horizonte ({len(T)})')
+    if G and inst.max < 1:
+        errores.append('Con max = 0 ningún grupo puede asistir a su reunión')
+
+    # 3. Condición de Hall por grupo en su día de reunión
+    for g in G:
+        integrantes = [e for e in inst.e_g[g] if adyacencia[e]]
+        pareja = emparejamiento_bipartito(adyacencia, nodos=integrantes)
+        if len(pareja) < len(integrantes):
+            emparejados = set(pareja.values())
+            u = next(e for e in integrantes if e not in emparejados)
+            S, vecinos = conjunto_hall({e: adyacencia[e] for e in integrantes}, pareja, u)
+            errores.append(f'Grupo {g}: los colaboradores {sorted(S)} comparten solo {len(vecinos)} escritorios {sorted(vecinos)} para la reunión')
+
+    # 4. Capacidad por día
+    # (se detiene al llenar todos los escritorios utilizables)
+    utilizables = len(inst.edz_escritorio)
+    pareja = {}
+    for e in E:
+        if len(pareja) == utilizables:
+            break
+        emparejamiento_bipartito(adyacencia, pareja, nodos=[e])
+    nu = len(pareja)
+    demanda = sum(minimo for e in E if adyacencia[e])
+    if demanda > nu * len(T):
+        errores.append(f'Los días mínimos suman {demanda} asistencias y caben a lo sumo {nu * len(T)} ({nu} por día)')
+    tamanos = {g: len(inst.e_g[g]) for g in G}
+    if tamanos and max(tamanos.values()) > nu:
+        g = max(tamanos, key=tamanos.get)
+        errores.append(f'El grupo {g} ({tamanos[g]} colaboradores) no cabe en un día ({nu} puestos simultáneos)')
+    if sum(tamanos.values()) > nu * len(T):
+        errores.append(f'Las reuniones suman {sum(tamanos.values())} asistencias y caben a lo sumo {nu * len(T)}')
+
+    # Advertencias: grupos que no caben en una sola zona
+    zonas_grupo = {}
+    for (g, z) in inst.edz_grupo_zona:
+        zonas_grupo.setdefault(g, []).append(z)
+    for g in G:
+        capacidad_zona = 0
+        for z in zonas_grupo.get(g, []):
+            if capacidad_zona == tamanos[g]:
+                break
+            combinaciones = inst.combinaciones_grupo_zona(g, z)
+            if min(len({e for (e, d) in combinaciones}), len({d for (e, d) in combinaciones})) <= capacidad_zona:
+                continue
+            adyacencia_zona = {}
+            for (e, d) in combinaciones:
+                adyacencia_zona.setdefault(e, []).append(d)
+            capacidad_zona = max(capacidad_zona, len(emparejamiento_bipartito(adyacencia_zona)))
+        if tamanos[g] > capacidad_zona:
+            advertencias.append(f'El grupo {g} ({tamanos[g]} colaboradores) no cabe en una sola zona (máximo {capacidad_zona})')
+
+    tiempo = time.perf_counter() - inicio
+    if imprimir:
+        print(f'Análisis de la instancia: {len(errores)} errores, {len(advertencias)} advertencias ({tiempo:.3f} s)')
+        for mensaje in errores:
+            print(f'  ERROR: {mensaje}')
+        for mensaje in advertencias:
+            print(f'  Advertencia: {mensaje}')
+
+    if estricto and errores:
+        raise ValueError('Instancia infactible: ' + '; '.join(errores))
+    return {'errores': errores, 'advertencias': advertencias, 'tiempo': tiempo}
+
+def _activos(model, nombre='X'):
+    '''
+    Función auxiliar que retorna los índices de la variable nombre ('X', 'Y'
+    o 'Z') que toman valor 1, recorriendo únicamente los índices existentes.
+    model puede ser el modelo resuelto o una Solucion.
+    '''
+    if isinstance(model, Solucion):
+        return getattr(model, nombre)
+    return [indice for indice, valor in model.component(nombre).extract_values().items() if valor is not None and valor > 0.5]
+
+def _asignaciones_activas(model):
+    '''
+    Función auxiliar que recorre únicamente los índices existentes de model.X
+    y retorna las tuplas (e, d, t, z) asignadas en la solución.
+    '''
+    return _activos(model, 'X')
 
 def cargar_modelo(nombre_instancia, nombre_carpeta):
-    import pickle
-    import os
     '''
-    Función para cargar un modelo desde un archivo pickle.
+    LEGADO: función para cargar un modelo desde un archivo pickle
+    (model_<instancia>.pkl) guardado por versiones anteriores. Ya no se
+    generan estos archivos: las soluciones se guardan con exportar_solucion
+    y se leen con cargar_solucion.
     nombre_instancia: str
         Nombre de la instancia para el archivo pickle.
     '''
+    import pickle
     with open(f'{nombre_carpeta}\\model_{nombre_instancia}.pkl', 'rb') as f:
         model = pickle.load(f)
     return model
 
+class Solucion:
+    '''
+    Solución compacta de un modelo resuelto: solo las asignaciones activas de
+    X, Y y Z, los valores no nulos de las penalizaciones y de J, el valor del
+    objetivo, el gap y metadatos de la corrida. Los reportes (resumen,
+    reuniones, preferencias, programacion_primario y programacion) la
+    aceptan en lugar del modelo.
+
+    X, Y, Z: list
+        Índices (e, d, t, z), (e, t) y (g, t) con valor 1.
+    Penalizacion, Penalizacion2: list
+        Índices e y (g, z, t) con valor 1 (vacías si F1 no está activo).
+    J: dict
+        (g, t) -> cantidad de zonas, solo valores no nulos.
+    metadatos: dict
+        Datos de la corrida (variante, tiempo, parámetros, etc.).
+    '''
+    __slots__ = ('X', 'Y', 'Z', 'Penalizacion', 'Penalizacion2', 'J', 'objetivo', 'gap', 'metadatos')
+
+    def __init__(self, X, Y, Z, Penalizacion=(), Penalizacion2=(), J=None, objetivo=None, gap=None, metadatos=None):
+        self.X, self.Y, self.Z = list(X), list(Y), list(Z)
+        self.Penalizacion, self.Penalizacion2 = list(Penalizacion), list(Penalizacion2)
+        self.J = dict(J) if J else {}
+        self.objetivo, self.gap = objetivo, gap
+        self.metadatos = dict(metadatos) if metadatos else {}
+
+    def asignacion(self):
+        '''Diccionario con X, Y y Z (mismo formato que extraer_asignacion).'''
+        return {'X': list(self.X), 'Y': list(self.Y), 'Z': list(self.Z)}
+
+def solucion_desde_modelo(model, gap=None, metadatos=None):
+    '''
+    Extrae la Solucion de un modelo resuelto (con el objetivo activo y, si el
+    bloque F1 está activo, sus penalizaciones y J).
+    '''
+    from pyomo.environ import Objective, value
+
+    objetivo = next(model.component_data_objects(Objective, active=True), None)
+    solucion = Solucion(_activos(model, 'X'), _activos(model, 'Y'), _activos(model, 'Z'),
+                        objetivo=value(objetivo) if objetivo is not None else None,
+                        gap=gap, metadatos=metadatos)
+
+    bloque = model.component('F1')
+    if bloque is not None and bloque.active:
+        solucion.Penalizacion = [e for e, var in bloque.Penalizacion.items() if var.value is not None and var.value > 0.5]
+        solucion.Penalizacion2 = [i for i, var in bloque.Penalizacion2.items() if var.value is not None and var.value > 0.5]
+        solucion.J = {i: round(var.value) for i, var in bloque.J.items() if var.value is not None and var.value > 0.5}
+    return solucion
+
+def exportar_solucion(solucion, nombre_instancia, nombre_carpeta='Model_outputs', gap=None, metadatos=None):
+    '''
+    Guarda la solución en <nombre_carpeta>/solucion_<nombre_instancia>.npz
+    (formato columnar comprimido de numpy, sin pickle): los índices se
+    guardan como códigos enteros sobre un vocabulario de nombres.
+    solucion: Solucion o ConcreteModel
+        Si es un modelo resuelto, se extrae con solucion_desde_modelo
+        usando gap y metadatos.
+
+    Retorna la ruta del archivo.
+    '''
+    import os
+    import json
+    import numpy as np
+
+    if not isinstance(solucion, Solucion):
+        solucion = solucion_desde_modelo(solucion, gap, metadatos)
+
+    columnas = {
+        'X': (solucion.X, 4),
+        'Y': (solucion.Y, 2),
+        'Z': (solucion.Z, 2),
+        'Penalizacion': ([(e,) for e in solucion.Penalizacion], 1),
+        'Penalizacion2': (solucion.Penalizacion2, 3),
+        'J': (list(solucion.J), 2),
+    }
+    nombres = sorted({nombre for tuplas, _ in columnas.values() for tupla in tuplas for nombre in tupla})
+    codigo = {nombre: i for i, nombre in enumerate(nombres)}
+
+    arreglos = {'nombres': np.array(nombres, dtype=str)}
+    for clave, (tuplas, ancho) in columnas.items():
+        arreglos[clave] = np.array([[codigo[n] for n in tupla] for tupla in tuplas], dtype=np.int32).reshape(-1, ancho)
+    arreglos['J_valor'] = np.array(list(solucion.J.values()), dtype=np.int32)
+    arreglos['metadatos'] = np.array(json.dumps({'objetivo': solucion.objetivo, 'gap': solucion.gap, 'metadatos': solucion.metadatos}))
+
+    os.makedirs(nombre_carpeta, exist_ok=True)
+    ruta = os.path.join(nombre_carpeta, f'solucion_{nombre_instancia}.npz')
+    np.savez_compressed(ruta, **arreglos)
+    return ruta
+
+def cargar_solucion(nombre_instancia, nombre_carpeta='Model_outputs'):
+    '''
+    Carga la Solucion guardada con exportar_solucion.
+    '''
+    import os
+    import json
+    import numpy as np
+
+    with np.load(os.path.join(nombre_carpeta, f'solucion_{nombre_instancia}.npz'), allow_pickle=False) as datos:
+        nombres = datos['nombres']
+
+        def decodificar(clave):
+            return [tuple(fila) for fila in nombres[datos[clave]].tolist()]
+
+        J = dict(zip(decodificar('J'), datos['J_valor'].tolist()))
+        resumen_corrida = json.loads(str(datos['metadatos']))
+        return Solucion(decodificar('X'), decodificar('Y'), decodificar('Z'),
+                        [e for (e,) in decodificar('Penalizacion')], decodificar('Penalizacion2'), J,
+                        resumen_corrida['objetivo'], resumen_corrida['gap'], resumen_corrida['metadatos'])
+
+def tablas_solucion(model, e_g=None):
+    '''
+    Extrae la solución en una sola pasada como tablas largas (DataFrames)
+    con solo las combinaciones activas; todos los reportes se derivan de
+    ellas. Los valores de X, Y y Z se leen en bloque (extract_values) una
+    vez por variable.
+    model: ConcreteModel, Solucion o dict
+        Modelo resuelto, Solucion o un resultado previo de esta función
+        (que se retorna sin cambios, para extraer una sola vez por corrida).
+    e_g: dict
+        Diccionario que relaciona Colaboradores con sus grupos.
+
+    Retorna un diccionario con:
+        'asignaciones': Empleado, Día, Zona, Escritorio y Grupo;
+        'asistencias': Empleado y Día;
+        'reuniones': Grupo y Día.
+    '''
+    import pandas as pd
+
+    if isinstance(model, dict):
+        return model
+    return {
+        'asignaciones': programacion_asignacion(_activos(model, 'X'), e_g or {}),
+        'asistencias': pd.DataFrame.from_records(_activos(model, 'Y'), columns=['Empleado', 'Día']),
+        'reuniones': pd.DataFrame.from_records(_activos(model, 'Z'), columns=['Grupo', 'Día']),
+    }
+
+def _ordenar(df, columnas_orden):
+    '''
+    Función auxiliar que ordena df según el orden de las listas originales:
+    columnas_orden es una lista de pares (columna, lista).
+    '''
+    claves = {f'_orden_{columna}': df[columna].map({v: i for i, v in enumerate(lista)}) for columna, lista in columnas_orden}
+    return df.assign(**claves).sort_values(list(claves), kind='stable').drop(columns=list(claves)).reset_index(drop=True)
+
 def resumen(E, D, T, Z, model, di, e_g):
     '''
     Función para generar un resumen de la eficiencia de los colaboradores,
@@ -110,7 +598,7 @@ def resumen(E, D, T, Z, model, di, e_g):
         Lista de días.
     Z: list
         Lista de zonas.
-    model: ConcreteModel
+    model: ConcreteModel, Solucion o tablas_solucion
         El modelo de optimización resuelto.
     di: dict
         Diccionario que relaciona Colaboradores con sus días preferidos.
@@ -118,58 +606,26 @@ def resumen(E, D, T, Z, model, di, e_g):
         Diccionario que relaciona Colaboradores con sus grupos.
     '''
     import pandas as pd
-    data_eficiencia = []
-
-    for e in E:
-        dias_asignados = [t for t in T if model.Y[e, t].value == 1]
-        dias_preferidos = di[e]
-        interseccion = set(dias_asignados).intersection(set(dias_preferidos))
-        eficiencia = len(interseccion) / len(dias_asignados) if dias_asignados else 0
-
-        data_eficiencia.append({
-            "Empleado": e,
-            "Días_Asignados": dias_asignados,
-            "Días_Preferidos": dias_preferidos,
-            "Eficiencia": round(eficiencia, 2)
-        })
-
-    df_eficiencia = pd.DataFrame(data_eficiencia)
-    # print("\n=== Eficiencia por colaborador ===")
-    # print(df_eficiencia)
-    
-    data_zonas = []
 
-    for e in E:
-        for t in T:
-            for d in D:
-                for z in Z:
-                    if model.X[e, d, t, z].value == 1:
-                        data_zonas.append({
-                            "Empleado": e,
-                            "Día": t,
-                            "Escritorio": d,
-                            "Zona": z
-                        })
-
-    df_zonas = pd.DataFrame(data_zonas)
-
-    # Crear lista de filas a partir del diccionario e_g
-    data_grupos = []
-
-    for grupo, empleados in e_g.items():
-        for empleado in empleados:
-            data_grupos.append({
-                'Grupo': grupo,
-                'Empleado': empleado
-            })
-
-    # Crear DataFrame
-    df_grupos = pd.DataFrame(data_grupos)
-
-
-    df_final = df_eficiencia.merge(df_grupos, on="Empleado", how="left")
-    df_final = df_final.merge(df_zonas.groupby("Empleado")["Zona"].unique().reset_index(), on="Empleado", how="left")
-    df_final.rename(columns={"Zona": "Zonas_Asignadas"}, inplace=True)
+    tablas = tablas_solucion(model, e_g)
+    df_preferidos = pd.DataFrame([(e, t) for e in E for t in di[e]], columns=['Empleado', 'Día'])
+    df_preferidos['Preferido'] = 1
+
+    # Días asignados (en el orden de T) y cuántos de ellos son preferidos
+    asistencias = _ordenar(tablas['asistencias'], [('Día', T)])
+    asistencias = asistencias.merge(df_preferidos, on=['Empleado', 'Día'], how='left').fillna({'Preferido': 0})
+    por_empleado = asistencias.groupby('Empleado', sort=False).agg(Días_Asignados=('Día', list), Preferidos=('Preferido', 'sum'))
+
+    df_final = pd.DataFrame({'Empleado': E})
+    df_final['Días_Asignados'] = [dias if isinstance(dias, list) else [] for dias in df_final['Empleado'].map(por_empleado['Días_Asignados'])]
+    df_final['Días_Preferidos'] = [di[e] for e in E]
+    asignados = df_final['Días_Asignados'].str.len()
+    preferidos = df_final['Empleado'].map(por_empleado['Preferidos']).fillna(0)
+    df_final['Eficiencia'] = (preferidos / asignados.where(asignados > 0)).fillna(0).round(2)
+
+    grupo = {empleado: g for g, empleados in e_g.items() for empleado in empleados}
+    df_final['Grupo'] = df_final['Empleado'].map(grupo)
+    df_final['Zonas_Asignadas'] = df_final['Empleado'].map(tablas['asignaciones'].groupby('Empleado')['Zona'].unique())
     return df_final
 
 def reuniones(G, T, model, e_g, D, Z):
@@ -180,7 +636,7 @@ def reuniones(G, T, model, e_g, D, Z):
         Lista de grupos.
     T: list
         Lista de días.
-    model: ConcreteModel
+    model: ConcreteModel, Solucion o tablas_solucion
         El modelo de optimización resuelto.
     e_g: dict
         Diccionario que relaciona Colaboradores con sus grupos.
@@ -190,32 +646,26 @@ def reuniones(G, T, model, e_g, D, Z):
         Lista de zonas.
     '''
     import pandas as pd
-    data_reuniones = []
 
-    for g in G:
-        for t in T:
-            if model.Z[g, t].value == 1:
-                zonas_grupo = set()  # para almacenar las zonas únicas en que se ubican
-                for e in e_g[g]:
-                    for d in D:
-                        for z in Z:
-                            if model.X[e, d, t, z].value == 1:
-                                zonas_grupo.add(z)
-                data_reuniones.append({
-                    "Grupo": g,
-                    "Día_Reunión": t,
-                    "Zonas_Asignadas": list(zonas_grupo),
-                    "Colaboradores_Grupo": e_g[g]
-                })
-
-    df_reuniones = pd.DataFrame(data_reuniones)
-    return df_reuniones
+    tablas = tablas_solucion(model, e_g)
+    df_reuniones = _ordenar(tablas['reuniones'], [('Grupo', G), ('Día', T)])
+
+    # Zonas únicas en que se ubican los integrantes de cada grupo el día de su reunión
+    zonas = df_reuniones.merge(tablas['asignaciones'][['Grupo', 'Día', 'Zona']], on=['Grupo', 'Día'])
+    zonas = zonas.groupby(['Grupo', 'Día'])['Zona'].unique()
+
+    return pd.DataFrame({
+        "Grupo": df_reuniones['Grupo'],
+        "Día_Reunión": df_reuniones['Día'],
+        "Zonas_Asignadas": [list(zonas.get((g, t), [])) for g, t in zip(df_reuniones['Grupo'], df_reuniones['Día'])],
+        "Colaboradores_Grupo": df_reuniones['Grupo'].map(e_g),
+    })
 
 def preferencias(model, E, T, di):
     '''
     Función para calcular el porcentaje de coincidencia entre los días asignados
     de presencialidad y las preferencias de los colaboradores.
-    model: ConcreteModel
+    model: ConcreteModel, Solucion o tablas_solucion
         El modelo de optimización resuelto.
     E: list
         Lista de colaboradores.
@@ -224,15 +674,13 @@ def preferencias(model, E, T, di):
     di: dict
         Diccionario que relaciona Colaboradores con sus días preferidos.
     '''
-    total_presencialidad = 0
-    preferencias_satisfechas = 0
+    import pandas as pd
 
-    for e in E:
-        for t in T:
-            if model.Y[e, t].value == 1:
-                total_presencialidad += 1
-                if t in di[e]:  # Si el día asignado está dentro de sus días preferidos
-                    preferencias_satisfechas += 1
+    asistencias = tablas_solucion(model)['asistencias']
+    df_preferidos = pd.DataFrame([(e, t) for e in E for t in di[e]], columns=['Empleado', 'Día'])
+
+    total_presencialidad = len(asistencias)
+    preferencias_satisfechas = len(asistencias.merge(df_preferidos, on=['Empleado', 'Día']))
 
     # Porcentaje de coincidencia
     if total_presencialidad > 0:
@@ -249,7 +697,7 @@ def programacion_primario(model, G, T, e_g, D, Z):
     '''
     Función para generar un DataFrame con la programación de reuniones,
     incluyendo los grupos, días, empleados, zonas y escritorios asignados.
-    model: ConcreteModel
+    model: ConcreteModel, Solucion o tablas_solucion
         El modelo de optimización resuelto.
     G: list
         Lista de grupos.
@@ -262,32 +710,21 @@ def programacion_primario(model, G, T, e_g, D, Z):
     Z: list
         Lista de zonas.
     '''
-    import pandas as pd
-    data_escritorios_reunion = []
+    tablas = tablas_solucion(model, e_g)
+    df_reuniones = _ordenar(tablas['reuniones'], [('Grupo', G), ('Día', T)])
 
-    for g in G:
-        for t in T:
-            if model.Z[g, t].value == 1:
-                for e in e_g[g]:
-                    for d in D:
-                        for z in Z:
-                            if model.X[e, d, t, z].value == 1:
-                                data_escritorios_reunion.append({
-                                    "Grupo": g,
-                                    "Día_Reunión": t,
-                                    "Empleado": e,
-                                    "Zona": z,
-                                    "Escritorio": d
-                                })
-
-    df_programacion_primario = pd.DataFrame(data_escritorios_reunion)
-    return df_programacion_primario
+    # Escritorio y zona de cada integrante el día de la reunión de su grupo
+    df_programacion_primario = df_reuniones.merge(tablas['asignaciones'], on=['Grupo', 'Día'])
+    integrantes = [e for g in G for e in e_g[g]]
+    df_programacion_primario = _ordenar(df_programacion_primario, [('Grupo', G), ('Día', T), ('Empleado', integrantes)])
+    df_programacion_primario = df_programacion_primario.rename(columns={"Día": "Día_Reunión"})
+    return df_programacion_primario[["Grupo", "Día_Reunión", "Empleado", "Zona", "Escritorio"]]
 
 def programacion(model, E, D, T, Z, e_g):
     '''
     Función para generar un DataFrame con la programación de los colaboradores,
     incluyendo los días, zonas y escritorios asignados.
-    model: ConcreteModel
+    model: ConcreteModel, Solucion o tablas_solucion
         El modelo de optimización resuelto.
     E: list
         Lista de colaboradores.
@@ -300,34 +737,22 @@ def programacion(model, E, D, T, Z, e_g):
     e_g: dict
         Diccionario que relaciona Colaboradores con sus grupos.
     '''
+    return tablas_solucion(model, e_g)['asignaciones'].copy()
+
+def programacion_asignacion(asignaciones, e_g):
+    '''
+    Genera el DataFrame de programación (mismas columnas que programacion) a
+    partir de una lista de tuplas (e, d, t, z), por ejemplo la asignación
+    'X' de la heurística constructiva.
+    asignaciones: list
+        Tuplas (colaborador, escritorio, día, zona) asignadas.
+    e_g: dict
+        Diccionario que relaciona Colaboradores con sus grupos.
+    '''
     import pandas as pd
-    programacion = []
 
-    for e in E:
-        for d in D:
-            for t in T:
-                for z in Z:
-                    if model.X[e, d, t, z].value == 1:
-                        programacion.append({
-                            "Empleado": e,
-                            "Día": t,
-                            "Zona": z,
-                            "Escritorio": d
-                        })
-    # Crear DataFrame
-    df_programacion = pd.DataFrame(programacion)
-    data_grupos = []
-    for grupo, empleados in e_g.items():
-        for empleado in empleados:
-            data_grupos.append({
-                'Grupo': grupo,
-                'Empleado': empleado
-            })
-
-    # Crear DataFrame
-    df_grupos = pd.DataFrame(data_grupos)
-    # Hacer merge con los grupos
-    if 'df_grupos' in locals():
-        df_programacion = df_programacion.merge(df_grupos, on="Empleado", how="left")
+    df_programacion = pd.DataFrame.from_records(asignaciones, columns=["Empleado", "Escritorio", "Día", "Zona"])
+    df_programacion = df_programacion[["Empleado", "Día", "Zona", "Escritorio"]]
+    grupo = {empleado: g for g, empleados in e_g.items() for empleado in empleados}
+    df_programacion["Grupo"] = df_programacion["Empleado"].map(grupo)
     return df_programacion
-
@@ -0,0 +1,150 @@
+'''
+Reoptimización incremental (modo delta) cuando una instancia cambia poco de
+una semana a otra: se comparan los datos nuevos con los de una instancia ya
+resuelta, se fijan todas las asignaciones que el cambio no toca y se
+resuelve solo el problema reducido (colaboradores afectados y, si se pide,
+un vecindario alrededor de ellos).
+'''
+
+SOLVER_PATH = 'Optimizer\\Cbc-releases.2.10.12-windows-2022-msvs-v17-Release-x64\\bin\\cbc.exe'
+
+def diferencias_instancia(anterior, nueva):
+    '''
+    Compara dos instancias (Instancia) y retorna un diccionario con:
+        colaboradores: colaboradores nuevos, eliminados o con cambios en
+            Days_E, Desks_E o grupo;
+        grupos: grupos con integrantes nuevos, eliminados o cambiados;
+        escritorios: escritorios nuevos, eliminados o que cambiaron de zona.
+    '''
+    colaboradores = set(anterior.E) ^ set(nueva.E)
+    for e in set(anterior.E) & set(nueva.E):
+        if set(anterior.di[e]) != set(nueva.di[e]) or set(anterior.dr[e]) != set(nueva.dr[e]) or anterior.grupo(e) != nueva.grupo(e):
+            colaboradores.add(e)
+
+    grupos = set(anterior.G) ^ set(nueva.G)
+    for g in set(anterior.G) & set(nueva.G):
+        if set(anterior.e_g[g]) != set(nueva.e_g[g]):
+            grupos.add(g)
+    for e in colaboradores:
+        for inst in (anterior, nueva):
+            if e in inst.id_E and inst.grupo(e) is not None:
+                grupos.add(inst.grupo(e))
+
+    escritorios = set(anterior.D) ^ set(nueva.D)
+    for d in set(anterior.D) & set(nueva.D):
+        if anterior.zona(d) != nueva.zona(d):
+            escritorios.add(d)
+
+    return {'colaboradores': colaboradores, 'grupos': grupos, 'escritorios': escritorios}
+
+def vecindario_delta(inst, asignacion, cambios, vecindario='grupos'):
+    '''
+    Colaboradores y grupos que se liberan en el problema reducido.
+    vecindario: str o None
+        None: solo los colaboradores cambiados (y los que usaban escritorios
+        cambiados); 'grupos': además todos los integrantes de los grupos
+        afectados; 'zonas': además todos los colaboradores asignados en las
+        zonas donde estaban los grupos afectados.
+
+    Retorna (colaboradores libres, grupos libres).
+    '''
+    libres = {e for e in cambios['colaboradores'] if e in inst.id_E}
+    grupos = {g for g in cambios['grupos'] if g in inst.id_G}
+
+    # Asignaciones que ya no existen en la instancia nueva
+    edz = set(inst.EDZ)
+    for (e, d, t, z) in asignacion['X']:
+        if d in cambios['escritorios'] or (e, d, z) not in edz:
+            if e in inst.id_E:
+                libres.add(e)
+
+    if vecindario in ('grupos', 'zonas'):
+        for g in grupos:
+            libres.update(inst.e_g[g])
+    if vecindario == 'zonas':
+        zonas = {z for (e, d, t, z) in asignacion['X'] if e in libres}
+        libres.update(e for (e, d, t, z) in asignacion['X'] if z in zonas and e in inst.id_E)
+
+    for e in libres:
+        if inst.grupo(e) is not None:
+            grupos.add(inst.grupo(e))
+    return libres, grupos
+
+def fijar_no_afectados(model, libres, grupos_libres, dias=None):
+    '''
+    Fija X, Y y Z (con sus valores actuales) de los colaboradores y grupos
+    que no están libres. Si se entregan dias, también se fijan las variables
+    de los demás días.
+    '''
+    for (e, d, t, z), var in model.X.items():
+        if e not in libres or (dias is not None and t not in dias):
+            var.fix()
+    for (e, t), var in model.Y.items():
+        if e not in libres or (dias is not None and t not in dias):
+            var.fix()
+    for (g, t), var in model.Z.items():
+        if g not in grupos_libres or (dias is not None and t not in dias):
+            var.fix()
+
+def reoptimizar_delta(inst_anterior, inst_nueva, asignacion, tiempo_limite=60, tolerancia=0.01, vecindario='grupos', epsilon=None, solver_path=SOLVER_PATH, imprimir=True):
+    '''
+    Reoptimiza F1 para inst_nueva a partir de la asignación de inst_anterior:
+        1. compara las instancias (diferencias_instancia);
+        2. fija las asignaciones no afectadas y libera el vecindario;
+        3. resuelve solo el problema reducido (las variables fijas salen del
+           problema que recibe CBC) partiendo de la asignación anterior.
+    asignacion: dict
+        Asignación anterior (ver extraer_asignacion en Funciones_modelos).
+    epsilon: float
+        Si se entrega, agrega la epsilon restriccion de satisfaccion.
+
+    Retorna el modelo resuelto y el diccionario de cambios, con las
+    llaves adicionales 'libres' y 'grupos_libres'.
+    '''
+    import time
+    from pyomo.opt import SolverFactory
+    from Funciones_modelos import construir_modelo, agregar_F1, agregar_epsilon, cargar_asignacion, usar_respaldo_heuristico, solucion_entera
+
+    inicio = time.perf_counter()
+    cambios = diferencias_instancia(inst_anterior, inst_nueva)
+    libres, grupos_libres = vecindario_delta(inst_nueva, asignacion, cambios, vecindario)
+    cambios.update({'libres': libres, 'grupos_libres': grupos_libres})
+
+    # Formulación fuerte: con X fija, el big-M de 10000000000 deja que CBC
+    # tome P ~ 1e-10 como 0 y reporte una FO que no corresponde a X
+    model = construir_modelo(inst_nueva, nombre='Universidad')
+    agregar_F1(model, inst_nueva, formulacion_fuerte=True)
+    if epsilon is not None:
+        agregar_epsilon(model, inst_nueva, epsilon)
+
+    # Solo asignaciones que siguen existiendo en la instancia nueva
+    edz = set(inst_nueva.EDZ)
+    vigente = {
+        'X': [(e, d, t, z) for (e, d, t, z) in asignacion['X'] if (e, d, z) in edz],
+        'Y': [i for i in asignacion['Y'] if i[0] in inst_nueva.id_E],
+        'Z': [i for i in asignacion['Z'] if i[0] in inst_nueva.id_G],
+    }
+    cargar_asignacion(model, inst_nueva, vigente)
+    fijar_no_afectados(model, libres, grupos_libres)
+
+    if imprimir:
+        print(f'Delta: {len(cambios["colaboradores"])} colaboradores cambiados | {len(libres)} de {len(inst_nueva.E)} colaboradores libres | {len(grupos_libres)} grupos libres')
+
+    solver = SolverFactory('cbc', executable=solver_path)
+    solver.options['seconds'] = tiempo_limite
+    solver.options['ratio'] = tolerancia
+    resultado = solver.solve(model, tee=imprimir, warmstart=True, load_solutions=False)
+    if solucion_entera(resultado):
+        model.solutions.load_from(resultado)
+    else:
+        # El problema reducido no tiene solución (o no se encontró a tiempo):
+        # se liberan las variables y se usa la heurística sobre la instancia nueva
+        print('Reoptimización delta sin solución; se usa la heurística constructiva')
+        model.X.unfix()
+        model.Y.unfix()
+        model.Z.unfix()
+        usar_respaldo_heuristico(model, inst_nueva)
+
+    if imprimir:
+        print(f'Reoptimización delta en {time.perf_counter() - inicio:.2f} s')
+    return model, cambios
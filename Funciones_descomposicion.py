@@ -0,0 +1,477 @@
+'''
+Descomposición por días del modelo F1 (intereses de la Universidad).
+
+Con la asistencia Y y los días de reunión Z fijos, la asignación de
+escritorios y zonas de cada día es independiente, y el objetivo de F1 (J, P
+y Penalizacion2 están indexados por t) también se separa por día. La
+solución se obtiene en dos niveles:
+    - Problema maestro: decide Y, Z y Penalizacion, con la presencia de cada
+      grupo por zona agregada (cantidad N[g, z, t] de integrantes en la zona,
+      sin escritorios), de modo que su objetivo es una cota inferior de F1.
+    - Subproblemas por día: con los asistentes del día fijos asignan
+      escritorios y zonas minimizando zonas por grupo y colaboradores solos.
+      Se resuelven en paralelo en un pool de procesos.
+
+resolver_benders itera entre ambos niveles (Benders basado en lógica): cada
+día se verifica primero con un emparejamiento bipartito si los asistentes
+caben en sus escritorios permitidos; si no, se agrega al maestro un corte de
+Hall, y si caben, el valor del subproblema del día vuelve al maestro como
+corte de optimalidad (no-good sobre los asistentes del día). El corte usa la
+cota inferior demostrada del subproblema, que solo coincide con su valor si
+CBC lo resolvió a optimalidad dentro del límite de tiempo; si no, la corrida
+se reporta como heurística.
+
+En Windows, el código que llama a resolver_descomposicion o resolver_benders debe estar dentro
+de un bloque if __name__ == '__main__' (requisito de multiprocessing).
+'''
+
+SOLVER_PATH = 'Optimizer\\Cbc-releases.2.10.12-windows-2022-msvs-v17-Release-x64\\bin\\cbc.exe'
+
+# Peso de un asistente sin escritorio en el subproblema del día (mayor que
+# cualquier cambio posible en zonas y penalizaciones)
+PESO_SIN_ESCRITORIO = 1000
+
+def construir_maestro(inst, epsilon=None):
+    '''
+    Construye el problema maestro: variables Y, Z, Penalizacion, presencia P,
+    Penalizacion2 y cantidad N de integrantes de cada grupo por zona y día.
+    epsilon: float
+        Si se entrega, agrega la epsilon restriccion de satisfaccion sobre Y
+        (equivalente a la de X, porque cada día asistido tiene un escritorio).
+    '''
+    from pyomo.environ import ConcreteModel, Var, Binary, NonNegativeIntegers, Objective, Constraint, minimize
+    from Funciones_modelos import cotas_grupo_zona
+
+    E, T, G, Z = inst.E, inst.T, inst.G, inst.Z
+    M = cotas_grupo_zona(inst)
+    ETG = [(e, t, inst.grupo(e)) for e in E if inst.grupo(e) is not None for t in T]
+    capacidad_zona = {z: len([d for d in inst.dz[z] if d in inst.edz_escritorio]) for z in Z}
+    colaboradores_gz = {(g, z): sorted({e for (e, d) in inst.combinaciones_grupo_zona(g, z)}) for g in G for z in Z}
+
+    model = ConcreteModel(name='Maestro')
+    model.Y = Var(E, T, within=Binary, initialize=0)
+    model.Z = Var(G, T, within=Binary, initialize=0)
+    model.Penalizacion = Var(E, within=Binary, initialize=0)
+    model.P = Var(G, Z, T, within=Binary, initialize=0)
+    model.Penalizacion2 = Var(G, Z, T, within=Binary, initialize=0)
+    model.N = Var(G, Z, T, within=NonNegativeIntegers, initialize=0, bounds=lambda m, g, z, t: (0, M[g, z]))
+
+    # Un colaborador sin escritorios permitidos no puede asistir
+    for e in E:
+        if not inst.edz_colaborador[e]:
+            for t in T:
+                model.Y[e, t].fix(0)
+
+    def distribucion_rule(model):
+        return sum(model.P[g, z, t] for g in G for z in Z for t in T) + sum(model.Penalizacion[e] for e in E) + sum(model.Penalizacion2[g, z, t] for g in G for z in Z for t in T)
+    model.distribucion_rule = Objective(rule=distribucion_rule, sense=minimize)
+
+    def dias_max(model, e):
+        return sum(model.Y[e, t] for t in T) <= inst.max
+    model.dias_max = Constraint(E, rule=dias_max)
+
+    def dias_min(model, e):
+        return sum(model.Y[e, t] for t in T) >= inst.min - model.Penalizacion[e]
+    model.dias_min = Constraint(E, rule=dias_min)
+
+    def grupo_primario(model, g):
+        return sum(model.Z[g, t] for t in T) == 1
+    model.grupo_primario = Constraint(G, rule=grupo_primario)
+
+    def asistencia_en_reunion(model, e, t, g):
+        return model.Y[e, t] >= model.Z[g, t]
+    model.asistencia_en_reunion = Constraint(ETG, rule=asistencia_en_reunion)
+
+    # Los asistentes de cada grupo se reparten entre las zonas
+    def reparto(model, g, t):
+        return sum(model.N[g, z, t] for z in Z) == sum(model.Y[e, t] for e in inst.e_g[g])
+    model.reparto = Constraint(G, T, rule=reparto)
+
+    # Solo pueden estar en z los asistentes con escritorio permitido en z
+    def reparto_permitido(model, g, z, t):
+        return model.N[g, z, t] <= sum(model.Y[e, t] for e in colaboradores_gz[g, z])
+    model.reparto_permitido = Constraint(G, Z, T, rule=reparto_permitido)
+
+    # Presencia y colaboradores solos (equivalentes a sola y sola2 de F1)
+    def sola(model, g, z, t):
+        return model.N[g, z, t] >= 2 * model.P[g, z, t] - model.Penalizacion2[g, z, t]
+    model.sola = Constraint(G, Z, T, rule=sola)
+
+    def sola2(model, g, z, t):
+        return model.N[g, z, t] <= M[g, z] * model.P[g, z, t]
+    model.sola2 = Constraint(G, Z, T, rule=sola2)
+
+    def penalizacion_presencia(model, g, z, t):
+        return model.Penalizacion2[g, z, t] <= model.P[g, z, t]
+    model.penalizacion_presencia = Constraint(G, Z, T, rule=penalizacion_presencia)
+
+    # Capacidad de escritorios por zona y por día
+    def capacidad_zona_rule(model, z, t):
+        return sum(model.N[g, z, t] for g in G) <= capacidad_zona[z]
+    model.capacidad_zona = Constraint(Z, T, rule=capacidad_zona_rule)
+
+    def capacidad_dia(model, t):
+        return sum(model.Y[e, t] for e in E) <= len(inst.edz_escritorio)
+    model.capacidad_dia = Constraint(T, rule=capacidad_dia)
+
+    if epsilon is not None:
+        def epsilon_restriccion(model):
+            return sum(model.Y[e, t] for e in E for t in T if inst.prefiere(e, t)) >= epsilon
+        model.epsilon_restriccion = Constraint(rule=epsilon_restriccion)
+
+    return model
+
+def resolver_dia(inst, t, asistentes, tiempo_limite, tolerancia=0.01, solver_path=SOLVER_PATH):
+    '''
+    Subproblema del día t: asigna escritorio y zona a cada asistente
+    minimizando la presencia de los grupos por zona y los colaboradores solos.
+    Un asistente sin escritorio posible queda sin asignar con un costo de
+    PESO_SIN_ESCRITORIO. Se ejecuta en un proceso del pool.
+
+    Retorna el día, la lista de tuplas (e, d, t, z) asignadas, el valor del
+    objetivo del día (zonas + colaboradores solos), la lista de asistentes
+    sin escritorio y la cota inferior demostrada del objetivo del día (igual
+    al valor si CBC demostró el óptimo con tolerancia 0).
+    '''
+    import math
+    from pyomo.environ import ConcreteModel, Var, Binary, Objective, Constraint, minimize, value
+    from pyomo.opt import SolverFactory, TerminationCondition
+    from Funciones_modelos import cotas_grupo_zona
+
+    G, Z = inst.G, inst.Z
+    M = cotas_grupo_zona(inst)
+    asistentes = set(asistentes)
+    EDZ = [(e, d, z) for (e, d, z) in inst.EDZ if e in asistentes]
+    escritorios = {}
+    for (e, d, z) in EDZ:
+        escritorios.setdefault(d, []).append((e, z))
+    grupo_zona = {}
+    for (e, d, z) in EDZ:
+        g = inst.grupo(e)
+        if g is not None:
+            grupo_zona.setdefault((g, z), []).append((e, d))
+
+    model = ConcreteModel(name=f'Dia_{t}')
+    model.X = Var(EDZ, within=Binary, initialize=0)
+    model.SinEscritorio = Var(sorted(asistentes), within=Binary, initialize=0)
+    model.P = Var(G, Z, within=Binary, initialize=0)
+    model.Penalizacion2 = Var(G, Z, within=Binary, initialize=0)
+
+    def distribucion_rule(model):
+        return sum(model.P[g, z] for g in G for z in Z) + sum(model.Penalizacion2[g, z] for g in G for z in Z) + PESO_SIN_ESCRITORIO * sum(model.SinEscritorio[e] for e in asistentes)
+    model.distribucion_rule = Objective(rule=distribucion_rule, sense=minimize)
+
+    # Cada asistente ocupa exactamente un escritorio
+    def un_escritorio(model, e):
+        return sum(model.X[e, d, z] for (d, z) in inst.edz_colaborador[e]) + model.SinEscritorio[e] == 1
+    model.un_escritorio = Constraint(sorted(asistentes), rule=un_escritorio)
+
+    def escritorio_unico(model, d):
+        return sum(model.X[e, d, z] for (e, z) in escritorios[d]) <= 1
+    model.escritorio_unico = Constraint(list(escritorios), rule=escritorio_unico)
+
+    def sola(model, g, z):
+        return sum(model.X[e, d, z] for (e, d) in grupo_zona.get((g, z), [])) >= 2 * model.P[g, z] - model.Penalizacion2[g, z]
+    model.sola = Constraint(G, Z, rule=sola)
+
+    def sola2(model, g, z):
+        return sum(model.X[e, d, z] for (e, d) in grupo_zona.get((g, z), [])) <= M[g, z] * model.P[g, z]
+    model.sola2 = Constraint(G, Z, rule=sola2)
+
+    solver = SolverFactory('cbc', executable=solver_path)
+    solver.options['seconds'] = tiempo_limite
+    solver.options['ratio'] = tolerancia
+    resultado = solver.solve(model, tee=False)
+
+    X = [(e, d, t, z) for (e, d, z), var in model.X.items() if var.value is not None and var.value > 0.5]
+    sin_escritorio = [e for e, var in model.SinEscritorio.items() if var.value is not None and var.value > 0.5]
+    objetivo = value(sum(model.P[g, z] for g in G for z in Z) + sum(model.Penalizacion2[g, z] for g in G for z in Z))
+
+    # Cota inferior demostrada: el objetivo es entero, así que se redondea hacia arriba
+    cota = resultado.problem.lower_bound
+    if resultado.solver.termination_condition == TerminationCondition.optimal and tolerancia == 0:
+        cota = objetivo
+    elif cota is None or not math.isfinite(cota):
+        cota = 0
+    else:
+        cota = max(0, min(objetivo, math.ceil(cota - 1e-6)))
+
+    return t, X, objetivo, sin_escritorio, cota
+
+def resolver_dias(inst, asistentes_dia, tiempo_dia, tolerancia=0.01, procesos=None, solver_path=SOLVER_PATH):
+    '''
+    Resuelve en paralelo los subproblemas de todos los días.
+    asistentes_dia: dict
+        Día -> lista de colaboradores que asisten.
+    procesos: int
+        Cantidad de procesos del pool (por defecto, uno por día sin superar
+        la cantidad de núcleos).
+
+    Retorna el diccionario día -> (X, objetivo, sin_escritorio, cota).
+    '''
+    import os
+    from concurrent.futures import ProcessPoolExecutor
+
+    if procesos is None:
+        procesos = min(len(asistentes_dia), os.cpu_count() or 1)
+
+    resultados = {}
+    with ProcessPoolExecutor(max_workers=procesos) as pool:
+        futuros = [
+            pool.submit(resolver_dia, inst, t, asistentes, tiempo_dia, tolerancia, solver_path)
+            for t, asistentes in asistentes_dia.items()
+        ]
+        for futuro in futuros:
+            t, X, objetivo, sin_escritorio, cota = futuro.result()
+            resultados[t] = (X, objetivo, sin_escritorio, cota)
+    return resultados
+
+def resolver_descomposicion(inst, tiempo_maestro, tiempo_dia, epsilon=None, tolerancia=0.01, procesos=None, solver_path=SOLVER_PATH, imprimir=True):
+    '''
+    Resuelve F1 en dos niveles: el problema maestro decide Y, Z y
+    Penalizacion y los subproblemas de cada día (en paralelo) asignan
+    escritorios y zonas.
+    tiempo_maestro: float
+        Límite de tiempo del maestro en segundos.
+    tiempo_dia: float
+        Límite de tiempo de cada subproblema en segundos.
+    epsilon: float
+        Mínimo de preferencias satisfechas (epsilon restriccion), opcional.
+
+    Retorna un diccionario con la asignación ('X', 'Y', 'Z', en el formato
+    de extraer_asignacion), 'sin_escritorio' (pares (e, t) que el maestro
+    asignó y no tienen escritorio), 'FO' (objetivo de F1 de la asignación) y
+    'cota' (cota inferior de F1 demostrada por CBC en el maestro, None si no
+    la reporta).
+    Lanza RuntimeError si el maestro no tiene solución entera (infactible,
+    por ejemplo con un epsilon demasiado alto, o sin incumbente en el
+    tiempo límite).
+    '''
+    import math
+    import time
+    from pyomo.opt import SolverFactory
+    from Funciones_modelos import solucion_entera
+
+    inicio = time.perf_counter()
+    maestro = construir_maestro(inst, epsilon)
+
+    solver = SolverFactory('cbc', executable=solver_path)
+    solver.options['seconds'] = tiempo_maestro
+    solver.options['ratio'] = tolerancia
+    resultado = solver.solve(maestro, tee=imprimir, load_solutions=False)
+    if not solucion_entera(resultado):
+        raise RuntimeError(f'CBC no encontró una solución entera del maestro en {tiempo_maestro} s ({resultado.solver.termination_condition})')
+    maestro.solutions.load_from(resultado)
+    tiempo_maestro_real = time.perf_counter() - inicio
+
+    # Cota inferior demostrada por CBC (no el objetivo del incumbente); el objetivo es entero
+    cota = resultado.problem.lower_bound
+    cota = math.ceil(cota - 1e-6) if cota is not None and math.isfinite(cota) else None
+
+    asistentes_dia = {t: [e for e in inst.E if maestro.Y[e, t].value is not None and maestro.Y[e, t].value > 0.5] for t in inst.T}
+    Zr = [(g, t) for g in inst.G for t in inst.T if maestro.Z[g, t].value is not None and maestro.Z[g, t].value > 0.5]
+
+    resultados = resolver_dias(inst, asistentes_dia, tiempo_dia, tolerancia, procesos, solver_path)
+
+    X = [x for t in inst.T for x in resultados[t][0]]
+    Y = [(e, t) for (e, d, t, z) in X]
+    sin_escritorio = [(e, t) for t in inst.T for e in resultados[t][2]]
+
+    # Penalizacion con la asistencia final (puede bajar si un asistente quedó sin escritorio)
+    dias = {e: 0 for e in inst.E}
+    for (e, t) in Y:
+        dias[e] += 1
+    penalizacion = sum(1 for e in inst.E if dias[e] < inst.min)
+    FO = sum(resultados[t][1] for t in inst.T) + penalizacion
+
+    if imprimir:
+        print(f'Maestro: {cota} en {tiempo_maestro_real:.2f} s | F1 por días: {FO} en {time.perf_counter() - inicio:.2f} s')
+        if sin_escritorio:
+            print(f'{len(sin_escritorio)} asistencias del maestro sin escritorio: {sin_escritorio}')
+
+    return {'X': X, 'Y': Y, 'Z': Zr, 'sin_escritorio': sin_escritorio, 'FO': FO, 'cota': cota}
+
+def cortes_hall(inst, asistentes):
+    '''
+    Verifica con un emparejamiento bipartito (Desks_E) si todos los
+    asistentes de un día pueden tener escritorio. Retorna la lista de cortes
+    de Hall violados: pares (S, cantidad) con S un conjunto de colaboradores
+    y cantidad = |N(S)| < |S| el número de escritorios que tienen
+    permitidos en conjunto, de modo que sum_{e en S} Y[e, t] <= cantidad
+    para todo día t. Lista vacía si el día es factible.
+    '''
+    from Funciones import emparejamiento_bipartito, conjunto_hall
+
+    adyacencia = {e: [d for (d, z) in inst.edz_colaborador[e]] for e in asistentes}
+    pareja = emparejamiento_bipartito(adyacencia, nodos=asistentes)
+    emparejados = set(pareja.values())
+
+    cortes = []
+    cubiertos = set()
+    for e in asistentes:
+        if e in emparejados or e in cubiertos:
+            continue
+        S, vecinos = conjunto_hall(adyacencia, pareja, e)
+        cubiertos |= S
+        cortes.append((frozenset(S), len(vecinos)))
+    return cortes
+
+def resolver_benders(inst, tiempo_limite, epsilon=None, tiempo_dia=60, tolerancia=0.01, max_iteraciones=100, procesos=None, solver_path=SOLVER_PATH, imprimir=True):
+    '''
+    Benders basado en lógica entre la asistencia (maestro) y la asignación de
+    escritorios (subproblemas por día). En cada iteración:
+        1. Se resuelve el maestro (construir_maestro) con una variable theta[t]
+           por día que estima las zonas y colaboradores solos del día.
+        2. Si los asistentes de algún día no caben en sus escritorios, se
+           agregan cortes de Hall para todos los días y se repite.
+        3. Si no, se resuelven los días en paralelo (resolver_dias) con
+           tolerancia 0; la cota inferior demostrada v del día con asistentes
+           A se agrega como corte
+           theta[t] >= v * (1 - sum_{e en A} (1 - Y[e, t]) - sum_{e fuera de A} Y[e, t]).
+           v es el valor del día solo si CBC demostró su óptimo en tiempo_dia;
+           si no, el corte es más débil pero sigue siendo válido.
+    Termina cuando la solución de los días alcanza la cota del maestro (con
+    la tolerancia), cuando ningún corte nuevo cambia el maestro, cuando el
+    maestro no tiene solución entera, al agotar tiempo_limite o
+    max_iteraciones. Los subproblemas nunca reciben más tiempo que el que
+    queda de tiempo_limite.
+    tiempo_limite: float
+        Tiempo total en segundos.
+    tiempo_dia: float
+        Límite de tiempo de cada subproblema en segundos.
+
+    Retorna el mismo diccionario que resolver_descomposicion con la mejor
+    solución encontrada: la de menos asistencias sin escritorio
+    ('sin_escritorio', que un subproblema deja si agota tiempo_dia) y luego
+    la de menor FO ('FO' None y listas vacías si el maestro no tuvo solución
+    entera en ninguna iteración). Agrega 'iteraciones', 'cortes_hall',
+    'cortes_optimalidad', 'tiempo' y 'optimo_demostrado' (False si la
+    corrida terminó sin cerrar la brecha con la cota o con asistentes sin
+    escritorio, es decir, si su resultado es heurístico).
+    '''
+    import math
+    import time
+    from pyomo.environ import Var, NonNegativeReals, Objective, Constraint, ConstraintList, minimize, value
+    from pyomo.opt import SolverFactory
+    from Funciones_modelos import solucion_entera
+
+    E, T, G, Z = inst.E, inst.T, inst.G, inst.Z
+    inicio = time.perf_counter()
+
+    maestro = construir_maestro(inst, epsilon)
+    maestro.theta = Var(T, within=NonNegativeReals, initialize=0)
+    def theta_agregado(model, t):
+        return model.theta[t] >= sum(model.P[g, z, t] + model.Penalizacion2[g, z, t] for g in G for z in Z)
+    maestro.theta_agregado = Constraint(T, rule=theta_agregado)
+    maestro.distribucion_rule.deactivate()
+    maestro.distribucion_benders = Objective(expr=sum(maestro.theta[t] for t in T) + sum(maestro.Penalizacion[e] for e in E), sense=minimize)
+    maestro.cortes_hall = ConstraintList()
+    maestro.cortes_optimalidad = ConstraintList()
+
+    solver = SolverFactory('cbc', executable=solver_path)
+    solver.options['ratio'] = tolerancia
+
+    vistos_hall = set()
+    valores_dia = {} # (t, asistentes) -> resultado del subproblema (se reutiliza entre iteraciones)
+    mejor = None
+    cota = 0
+    n_optimalidad = 0
+    optimo_demostrado = False
+
+    for iteracion in range(1, max_iteraciones + 1):
+        restante = tiempo_limite - (time.perf_counter() - inicio)
+        if restante <= 0:
+            break
+        solver.options['seconds'] = restante
+        resultado = solver.solve(maestro, tee=False, load_solutions=False)
+        # Sin solución entera (maestro infactible, por ejemplo con un epsilon
+        # demasiado alto, o sin incumbente en el tiempo restante) Y conserva
+        # valores anteriores que no cumplen sus restricciones
+        if not solucion_entera(resultado):
+            if imprimir:
+                print(f'Iteración {iteracion}: el maestro no tiene solución entera ({resultado.solver.termination_condition}); se termina')
+            break
+        maestro.solutions.load_from(resultado)
+        # Solo la cota demostrada por CBC (no el incumbente del maestro) es cota de F1
+        cota_maestro = resultado.problem.lower_bound
+        if cota_maestro is not None and math.isfinite(cota_maestro):
+            cota = max(cota, cota_maestro)
+
+        asistentes_dia = {t: [e for e in E if maestro.Y[e, t].value is not None and maestro.Y[e, t].value > 0.5] for t in T}
+
+        # Factibilidad de escritorios (Hall)
+        nuevos = []
+        for t in T:
+            for S, cantidad in cortes_hall(inst, asistentes_dia[t]):
+                if S not in vistos_hall:
+                    vistos_hall.add(S)
+                    nuevos.append((S, cantidad))
+        if nuevos:
+            for S, cantidad in nuevos:
+                for t in T:
+                    maestro.cortes_hall.add(sum(maestro.Y[e, t] for e in S) <= cantidad)
+            if imprimir:
+                print(f'Iteración {iteracion}: {len(nuevos)} cortes de Hall')
+            continue
+
+        # Subproblemas de los días que no se han resuelto con esos asistentes
+        pendientes = {t: A for t, A in asistentes_dia.items() if (t, frozenset(A)) not in valores_dia}
+        restante = tiempo_limite - (time.perf_counter() - inicio)
+        if pendientes and restante <= 0:
+            break
+        if pendientes:
+            for t, (X, objetivo, sin_escritorio, cota_dia) in resolver_dias(inst, pendientes, min(tiempo_dia, restante), 0, procesos, solver_path).items():
+                valores_dia[t, frozenset(pendientes[t])] = (X, objetivo, sin_escritorio, cota_dia)
+
+        # Asistencias del maestro que el subproblema no alcanzó a sentar (límite
+        # de tiempo del día): la solución solo es factible si no hay ninguna
+        X = [x for t in T for x in valores_dia[t, frozenset(asistentes_dia[t])][0]]
+        Y = [(e, t) for (e, d, t, z) in X]
+        sin_escritorio = [(e, t) for t in T for e in valores_dia[t, frozenset(asistentes_dia[t])][2]]
+        dias = {e: 0 for e in E}
+        for (e, t) in Y:
+            dias[e] += 1
+        penalizacion = sum(1 for e in E if dias[e] < inst.min)
+        FO = sum(valores_dia[t, frozenset(asistentes_dia[t])][1] for t in T) + penalizacion
+        # Una solución con todos sentados siempre reemplaza a una que deja asistentes sin escritorio
+        if mejor is None or (len(sin_escritorio), FO) < (len(mejor['sin_escritorio']), mejor['FO']):
+            mejor = {
+                'X': X,
+                'Y': Y,
+                'Z': [(g, t) for g in G for t in T if maestro.Z[g, t].value is not None and maestro.Z[g, t].value > 0.5],
+                'sin_escritorio': sin_escritorio,
+                'FO': FO,
+            }
+
+        if imprimir:
+            print(f'Iteración {iteracion}: cota {cota} | mejor FO {mejor["FO"]} | {time.perf_counter() - inicio:.2f} s')
+        if not mejor['sin_escritorio'] and mejor['FO'] - cota <= tolerancia * max(abs(mejor['FO']), 1):
+            optimo_demostrado = True
+            break
+
+        # Cortes de optimalidad en los días subestimados por el maestro, con
+        # la cota demostrada del subproblema (no su incumbente)
+        nuevos_optimalidad = 0
+        for t in T:
+            v = valores_dia[t, frozenset(asistentes_dia[t])][3]
+            if v > value(maestro.theta[t]) + 1e-6:
+                A = set(asistentes_dia[t])
+                maestro.cortes_optimalidad.add(
+                    maestro.theta[t] >= v * (1 - sum(1 - maestro.Y[e, t] for e in A) - sum(maestro.Y[e, t] for e in E if e not in A))
+                )
+                n_optimalidad += 1
+                nuevos_optimalidad += 1
+
+        # Sin cortes nuevos el maestro repetiría la misma solución: algún
+        # subproblema no se demostró óptimo y la brecha no se puede cerrar
+        if nuevos_optimalidad == 0:
+            if imprimir:
+                print(f'Iteración {iteracion}: subproblemas sin óptimo demostrado; se termina con una solución heurística')
+            break
+
+    if mejor is None:
+        mejor = {'X': [], 'Y': [], 'Z': [], 'sin_escritorio': [], 'FO': None}
+    mejor.update({'cota': cota, 'iteraciones': iteracion, 'cortes_hall': len(vistos_hall),
+                  'cortes_optimalidad': n_optimalidad, 'tiempo': time.perf_counter() - inicio,
+                  'optimo_demostrado': optimo_demostrado})
+    return mejor
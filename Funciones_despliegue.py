@@ -0,0 +1,494 @@
+'''
+Ejecución en lote de instancias y variantes de modelo (F1, F2 y epsilon) en
+un pool de procesos, en lugar de resolverlas una tras otra. Cada trabajo
+escribe su modelo resuelto y su hora de finalización en la carpeta
+Model_outputs* correspondiente apenas termina.
+
+Con un registro (JSON escrito de forma atómica) el lote se puede reanudar:
+se omiten los trabajos completados y los interrumpidos continúan desde su
+último incumbente, guardado en un punto de control (JSON) por trabajo.
+
+ejecutar_lote_planificado reparte además los núcleos de la máquina entre los
+trabajos simultáneos según la dificultad estimada de cada instancia.
+
+En Windows, el código que llama a ejecutar_lote o ejecutar_lote_planificado
+debe estar dentro de un bloque if __name__ == '__main__' (requisito de
+multiprocessing).
+'''
+
+SOLVER_PATH = 'Optimizer\\Cbc-releases.2.10.12-windows-2022-msvs-v17-Release-x64\\bin\\cbc.exe'
+
+# Carpeta de resultados de cada variante
+CARPETAS = {
+    'F1': 'Model_outputs',
+    'F2': 'Model_outputs_F2',
+    'epsilon': 'Model_outputs_epsilon',
+}
+
+def crear_trabajos(instancias, variantes, tiempo_limite, tolerancia=0.01, satisfaccion_deseada=0.65):
+    '''
+    Crea la lista de trabajos (instancia, variante) del lote.
+    instancias: list
+        Nombres de las instancias (archivo instances/<nombre>.json).
+    variantes: list
+        Variantes a resolver: 'F1', 'F2' y/o 'epsilon' (F2 y luego F1 con
+        epsilon restriccion sobre el mismo modelo).
+    tiempo_limite: float o dict
+        Límite de tiempo en segundos, igual para todos, por instancia o por
+        (instancia, variante).
+    '''
+    trabajos = []
+    for instancia in instancias:
+        for variante in variantes:
+            if variante not in CARPETAS:
+                raise ValueError(f'Variante desconocida: {variante}')
+            if not isinstance(tiempo_limite, dict):
+                limite = tiempo_limite
+            elif (instancia, variante) in tiempo_limite:
+                limite = tiempo_limite[instancia, variante]
+            else:
+                limite = tiempo_limite[instancia]
+            trabajos.append({
+                'instancia': instancia,
+                'variante': variante,
+                'tiempo_limite': limite,
+                'tolerancia': tolerancia,
+                'satisfaccion_deseada': satisfaccion_deseada,
+            })
+    return trabajos
+
+def _guardar_resultado(model, carpeta, instancia, gap=None, metadatos=None, logs=None):
+    '''
+    Guarda la solución compacta del modelo resuelto (ver exportar_solucion),
+    la telemetría de CBC de sus tramos (logs, ver combinar_logs_cbc) y la
+    hora de finalización en la carpeta.
+    '''
+    import os
+    from datetime import datetime
+    from Funciones import exportar_solucion
+    from Funciones_modelos import combinar_logs_cbc, guardar_telemetria
+
+    os.makedirs(carpeta, exist_ok=True)
+    exportar_solucion(model, instancia, carpeta, gap, metadatos)
+    if logs:
+        guardar_telemetria(combinar_logs_cbc(logs), carpeta, instancia)
+
+    hora_actual = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    with open(os.path.join(carpeta, f'hora_finalizacion_{instancia}.txt'), 'w') as f:
+        f.write(hora_actual)
+    return hora_actual
+
+def _escribir_atomico(ruta, contenido):
+    '''
+    Escribe contenido (bytes) en ruta de forma atómica: primero en un archivo
+    temporal de la misma carpeta y luego lo reemplaza, de modo que una
+    interrupción nunca deja el archivo a medio escribir.
+    '''
+    import os
+    import tempfile
+
+    carpeta = os.path.dirname(ruta) or '.'
+    os.makedirs(carpeta, exist_ok=True)
+    descriptor, temporal = tempfile.mkstemp(dir=carpeta, suffix='.tmp')
+    try:
+        with os.fdopen(descriptor, 'wb') as f:
+            f.write(contenido)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporal, ruta)
+    except BaseException:
+        if os.path.exists(temporal):
+            os.remove(temporal)
+        raise
+
+def leer_registro(ruta):
+    '''
+    Lee el registro del lote (JSON): clave del trabajo -> estado, parámetros,
+    salida y resultados. Retorna un diccionario vacío si no existe.
+    '''
+    import os
+    import json
+
+    if not os.path.exists(ruta):
+        return {}
+    with open(ruta, 'r') as f:
+        return json.load(f)
+
+def guardar_registro(registro, ruta):
+    '''
+    Guarda el registro del lote de forma atómica.
+    '''
+    import json
+
+    _escribir_atomico(ruta, json.dumps(registro, indent=2, ensure_ascii=False).encode('utf-8'))
+
+def clave_trabajo(trabajo):
+    '''Clave del trabajo en el registro: instancia|variante.'''
+    return f"{trabajo['instancia']}|{trabajo['variante']}"
+
+def ruta_punto_control(trabajo):
+    '''Archivo con la última solución entera (incumbente) del trabajo.'''
+    import os
+
+    return os.path.join(CARPETAS[trabajo['variante']], f"punto_control_{trabajo['instancia']}.json")
+
+def leer_punto_control(ruta):
+    '''
+    Lee el punto de control de un trabajo (JSON): etapa, incumbente, tiempo
+    usado, gap y epsilon. Los índices de la asignación vuelven a ser tuplas.
+    '''
+    import json
+
+    with open(ruta, 'r') as f:
+        control = json.load(f)
+    if control['asignacion'] is not None:
+        control['asignacion'] = {nombre: [tuple(indice) for indice in indices] for nombre, indices in control['asignacion'].items()}
+    return control
+
+def guardar_punto_control(control, ruta):
+    '''
+    Guarda el punto de control de un trabajo de forma atómica.
+    '''
+    import json
+
+    _escribir_atomico(ruta, json.dumps(control, ensure_ascii=False).encode('utf-8'))
+
+def _resolver_por_tramos(solver, model, inst, tiempo_limite, tolerancia, asignacion, guardar, tiempo=0, intervalo=None, gap=None, curva=None, logs=None):
+    '''
+    Resuelve el modelo hasta completar tiempo_limite segundos (contando los
+    tiempo segundos ya usados) en tramos de intervalo segundos. Al final de
+    cada tramo guarda el incumbente con guardar(asignacion, tiempo, gap) y el
+    siguiente tramo parte de él como solución inicial. Retorna la asignación,
+    el tiempo acumulado y el gap. Si se entrega la lista curva, le agrega los
+    puntos (segundos, gap) del log de CBC; si se entrega la lista logs, le
+    agrega los pares (inicio del tramo, leer_log_cbc) de cada tramo.
+    '''
+    import os
+    import time
+    import tempfile
+    from pyomo.opt import TerminationCondition
+    from Funciones_modelos import extraer_asignacion, cargar_asignacion, leer_log_cbc, solucion_entera
+    from Funciones_presupuesto import curva_gap
+
+    if asignacion is not None:
+        cargar_asignacion(model, inst, asignacion)
+
+    while tiempo < tiempo_limite:
+        tramo = tiempo_limite - tiempo if intervalo is None else min(intervalo, tiempo_limite - tiempo)
+        solver.options['seconds'] = tramo
+
+        descriptor, ruta_log = tempfile.mkstemp(suffix='.log')
+        os.close(descriptor)
+        inicio = time.perf_counter()
+        resultado = solver.solve(model, tee=False, warmstart=asignacion is not None, load_solutions=False, logfile=ruta_log)
+        log = leer_log_cbc(ruta_log)
+        os.remove(ruta_log)
+        if curva is not None:
+            curva.extend(curva_gap(log['curva'], tiempo))
+        if logs is not None:
+            logs.append((tiempo, log))
+        tiempo += time.perf_counter() - inicio
+
+        if solucion_entera(resultado):
+            model.solutions.load_from(resultado)
+            asignacion = extraer_asignacion(model)
+            cota_inferior, cota_superior = resultado.problem.lower_bound, resultado.problem.upper_bound
+            if cota_inferior is not None and cota_superior is not None:
+                gap = abs(cota_superior - cota_inferior) / max(abs(cota_superior), abs(cota_inferior), 1e-9)
+        guardar(asignacion, tiempo, gap)
+
+        condicion = resultado.solver.termination_condition
+        if condicion in (TerminationCondition.optimal, TerminationCondition.infeasible) or (gap is not None and gap <= tolerancia):
+            break
+    return asignacion, tiempo, gap
+
+def ejecutar_trabajo(trabajo, hilos=1, solver_path=SOLVER_PATH, reanudar=False, intervalo=None):
+    '''
+    Resuelve un trabajo del lote en el proceso actual con CBC usando hilos
+    threads y guarda el resultado. Retorna un resumen del trabajo.
+    reanudar: bool
+        Si es True y existe el punto de control del trabajo, continúa desde
+        su incumbente (como solución inicial) con el tiempo restante.
+    intervalo: float
+        Cada cuántos segundos se guarda el incumbente en el punto de control
+        (None: solo al final de cada modelo).
+    Si CBC no encuentra una solución entera se usa la heurística
+    constructiva; lanza RuntimeError (el trabajo queda con error en el
+    registro) si F2 no asigna días presenciales o si la heurística no es
+    factible (ver usar_respaldo_heuristico).
+    '''
+    import os
+    from pyomo.environ import value
+    from pyomo.opt import SolverFactory
+    from Funciones import importar_data
+    from Funciones_modelos import construir_modelo, agregar_F1, agregar_F2, agregar_epsilon, retirar_bloque, cumple_epsilon, extraer_asignacion, usar_respaldo_heuristico
+    from Funciones_presupuesto import caracteristicas_instancia
+
+    instancia, variante = trabajo['instancia'], trabajo['variante']
+    inst = importar_data(os.path.join('instances', f'{instancia}.json'), imprimir=False, verificar=True)
+    ruta_control = ruta_punto_control(trabajo)
+
+    # Punto de control: etapa ('F2' o 'F1'), incumbente, tiempo usado y epsilon
+    control = {'etapa': 'F1' if variante == 'F1' else 'F2', 'asignacion': None, 'tiempo': 0, 'gap': None, 'epsilon': None}
+    if reanudar and os.path.exists(ruta_control):
+        control = leer_punto_control(ruta_control)
+        print(f"{instancia} ({variante}): se reanuda la etapa {control['etapa']} con {control['tiempo']:.0f} s usados")
+
+    def guardar(asignacion, tiempo, gap):
+        control.update({'asignacion': asignacion, 'tiempo': tiempo, 'gap': gap})
+        guardar_punto_control(control, ruta_control)
+
+    solver = SolverFactory('cbc', executable=solver_path)
+    solver.options['ratio'] = trabajo['tolerancia']
+    solver.options['threads'] = hilos
+
+    curva = []
+    logs = []
+    if control['etapa'] == 'F2':
+        model = construir_modelo(inst, nombre='Colaboradores')
+        agregar_F2(model, inst)
+        asignacion, tiempo, gap = _resolver_por_tramos(solver, model, inst, trabajo['tiempo_limite'], trabajo['tolerancia'],
+                                                       control['asignacion'], guardar, control['tiempo'], intervalo, control['gap'], curva, logs)
+        # Sin incumbente de CBC las variables conservan su valor inicial (0)
+        if asignacion is None:
+            usar_respaldo_heuristico(model, inst)
+            asignacion = extraer_asignacion(model)
+        fo = value(model.F2.satisfaccion)
+
+        if variante == 'epsilon':
+            # La etapa F2 se guarda con su propio nombre en la carpeta de epsilon
+            # para no sobrescribir la salida de un trabajo F2 de la misma instancia
+            _guardar_resultado(model, CARPETAS['epsilon'], f'{instancia}_F2', gap,
+                               {'instancia': instancia, 'variante': 'epsilon', 'etapa': 'F2', 'tiempo': tiempo, 'hilos': hilos}, logs)
+            logs = []
+
+            # Epsilon a partir de la solución de F2 (ver Despliegue_epsilon)
+            asistencias = [(e, t) for (e, t), var in model.Y.items() if var.value is not None and var.value > 0.5]
+            if not asistencias:
+                raise RuntimeError(f'{instancia}: la solución de F2 no asigna días presenciales, no hay epsilon que fijar')
+            preferencias_satisfechas = sum(1 for (e, t) in asistencias if inst.prefiere(e, t))
+            epsilon = round(len(asistencias) * trabajo['satisfaccion_deseada'], 0)
+            print(f'{instancia}: preferencias satisfechas F2 = {preferencias_satisfechas} | epsilon = {epsilon}')
+
+            # La etapa F1 parte de la solución de F2 solo si cumple la epsilon restriccion
+            # (con el redondeo de epsilon puede faltarle una preferencia satisfecha)
+            if not cumple_epsilon(inst, asignacion, epsilon):
+                print(f'{instancia}: la solución de F2 no cumple epsilon, F1 parte sin solución inicial')
+                asignacion = None
+            control.update({'etapa': 'F1', 'epsilon': epsilon})
+            guardar(asignacion, 0, None)
+            retirar_bloque(model, 'F2')
+    else:
+        model = construir_modelo(inst, nombre='Universidad')
+
+    if control['etapa'] == 'F1':
+        agregar_F1(model, inst)
+        if control['epsilon'] is not None:
+            agregar_epsilon(model, inst, control['epsilon'])
+        curva = []
+        asignacion, tiempo, gap = _resolver_por_tramos(solver, model, inst, trabajo['tiempo_limite'], trabajo['tolerancia'],
+                                                       control['asignacion'], guardar, control['tiempo'], intervalo, control['gap'], curva, logs)
+        # Sin incumbente de CBC se usa la heurística constructiva, solo si cumple epsilon
+        if asignacion is None:
+            usar_respaldo_heuristico(model, inst, control['epsilon'])
+        fo = value(model.F1.distribucion_rule)
+
+    hora = _guardar_resultado(model, CARPETAS[variante], instancia, gap,
+                              {'variante': variante, 'tiempo': tiempo, 'hilos': hilos, 'tiempo_limite': trabajo['tiempo_limite'], 'tolerancia': trabajo['tolerancia']}, logs)
+
+    return {
+        'instancia': instancia,
+        'variante': variante,
+        'hilos': hilos,
+        'FO': fo,
+        'gap': gap,
+        'tiempo': round(tiempo, 2),
+        'hora_finalizacion': hora,
+        'caracteristicas': caracteristicas_instancia(inst),
+        'curva': curva,
+    }
+
+def preparar_trabajos(trabajos, registro):
+    '''
+    Decide con el registro qué trabajos correr y cuáles reanudar:
+        - completado con el mismo o menor límite de tiempo, o dentro de la
+          tolerancia: se omite;
+        - completado con un límite de tiempo mayor: continúa desde su
+          incumbente con el tiempo adicional;
+        - en curso o con error (el lote se interrumpió): se reanuda desde su
+          último incumbente.
+    Retorna la lista de pares (trabajo, reanudar).
+    '''
+    preparados = []
+    for trabajo in trabajos:
+        entrada = registro.get(clave_trabajo(trabajo))
+        if entrada is None:
+            preparados.append((trabajo, False))
+            continue
+        if entrada['estado'] == 'completado':
+            gap = entrada.get('gap')
+            if trabajo['tiempo_limite'] <= entrada['parametros']['tiempo_limite'] or (gap is not None and gap <= trabajo['tolerancia']):
+                print(f"Omitido (completado): {trabajo['instancia']} ({trabajo['variante']})")
+                continue
+        preparados.append((trabajo, True))
+    return preparados
+
+def _registrar_terminado(registro, ruta, historial, trabajo, resultado):
+    '''
+    Marca el trabajo como completado en el registro y agrega la corrida al
+    historial de tiempos (ver Funciones_presupuesto), si se entregan.
+    '''
+    from Funciones_presupuesto import registrar_corrida
+
+    campos = {k: v for k, v in resultado.items() if k not in ('curva', 'caracteristicas')}
+    _actualizar_registro(registro, ruta, trabajo, estado='completado', **campos)
+    if historial is not None:
+        registrar_corrida(historial, trabajo['instancia'], trabajo['variante'], resultado['caracteristicas'],
+                          resultado['curva'], trabajo['tiempo_limite'], resultado['gap'], resultado['tiempo'])
+
+def _actualizar_registro(registro, ruta, trabajo, **campos):
+    '''
+    Actualiza la entrada del trabajo en el registro y lo guarda (si hay ruta).
+    '''
+    from datetime import datetime
+
+    entrada = registro.setdefault(clave_trabajo(trabajo), {})
+    entrada.update(campos)
+    entrada['parametros'] = trabajo
+    entrada['salida'] = CARPETAS[trabajo['variante']]
+    entrada['punto_control'] = ruta_punto_control(trabajo)
+    entrada['actualizado'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    if ruta is not None:
+        guardar_registro(registro, ruta)
+
+def ejecutar_lote(trabajos, procesos=None, hilos=1, solver_path=SOLVER_PATH, registro=None, intervalo=None, historial=None):
+    '''
+    Ejecuta los trabajos en paralelo en un pool de procesos.
+    procesos: int
+        Trabajos simultáneos (por defecto, núcleos disponibles / hilos).
+    hilos: int
+        Threads de CBC por trabajo.
+    registro: str
+        Ruta del registro JSON del lote. Si se entrega, se registra el estado
+        de cada trabajo y, al correr de nuevo el lote, se omiten los
+        completados y se reanudan los interrumpidos (ver preparar_trabajos).
+    intervalo: float
+        Segundos entre puntos de control del incumbente de cada trabajo.
+    historial: str
+        Ruta del historial de corridas (características y curva gap vs
+        tiempo) que usa proponer_tiempos en Funciones_presupuesto.
+
+    Retorna la lista de resúmenes en el orden en que terminan los trabajos.
+    '''
+    import os
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    if procesos is None:
+        procesos = max(1, (os.cpu_count() or 1) // hilos)
+
+    estado = leer_registro(registro) if registro is not None else {}
+    resultados = []
+    with ProcessPoolExecutor(max_workers=procesos) as pool:
+        futuros = {}
+        for trabajo, reanudar in preparar_trabajos(trabajos, estado):
+            futuros[pool.submit(ejecutar_trabajo, trabajo, hilos, solver_path, reanudar, intervalo)] = trabajo
+            _actualizar_registro(estado, registro, trabajo, estado='en_curso')
+        for futuro in as_completed(futuros):
+            trabajo = futuros[futuro]
+            try:
+                resultados.append(futuro.result())
+                _registrar_terminado(estado, registro, historial, trabajo, resultados[-1])
+                print(f"Terminado: {trabajo['instancia']} ({trabajo['variante']}) | FO: {resultados[-1]['FO']} | gap: {resultados[-1]['gap']} | {resultados[-1]['tiempo']} s")
+            except Exception as error:
+                _actualizar_registro(estado, registro, trabajo, estado='error', error=str(error))
+                print(f'Error en {trabajo["instancia"]} ({trabajo["variante"]}): {error}')
+    return resultados
+
+def dificultad_instancia(instancia):
+    '''
+    Dificultad estimada de una instancia: tamaño E x D x Z, leído del JSON
+    sin construir la Instancia.
+    '''
+    import os
+    import json
+
+    with open(os.path.join('instances', f'{instancia}.json'), 'r') as file:
+        data = json.load(file)
+    return len(data['Employees']) * len(data['Desks']) * len(data['Zones'])
+
+def asignar_hilos(dificultad, dificultad_restante, nucleos, libres, max_hilos):
+    '''
+    Threads de CBC para un trabajo que inicia: su parte de los núcleos
+    proporcional a su dificultad frente a la de todos los trabajos que faltan
+    por terminar (pendientes y en curso), entre 1 y el mínimo de max_hilos y
+    los núcleos libres.
+    '''
+    parte = round(nucleos * dificultad / dificultad_restante) if dificultad_restante else 1
+    return max(1, min(parte, max_hilos, libres))
+
+def ejecutar_lote_planificado(trabajos, nucleos=None, max_hilos=8, solver_path=SOLVER_PATH, registro=None, intervalo=None, historial=None):
+    '''
+    Ejecuta los trabajos repartiendo los núcleos entre los CBC simultáneos
+    para reducir el tiempo total del lote:
+        - los trabajos se inician de mayor a menor dificultad (E x D x Z, el
+          doble para la variante epsilon, que resuelve dos modelos);
+        - cada trabajo recibe threads según su dificultad frente a lo que
+          falta por resolver (asignar_hilos) y los trabajos pequeños ocupan
+          los núcleos que quedan;
+        - cuando un trabajo termina, sus núcleos se asignan a los siguientes,
+          que reciben más threads a medida que quedan menos trabajos.
+    Nunca hay más threads en uso que núcleos.
+    nucleos: int
+        Núcleos a usar (por defecto, todos).
+    max_hilos: int
+        Máximo de threads de CBC por trabajo.
+    registro, intervalo, historial:
+        Registro del lote, puntos de control e historial (ver ejecutar_lote).
+
+    Retorna la lista de resúmenes en el orden en que terminan los trabajos.
+    '''
+    import os
+    from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+
+    if nucleos is None:
+        nucleos = os.cpu_count() or 1
+
+    dificultades = {}
+    for trabajo in trabajos:
+        if trabajo['instancia'] not in dificultades:
+            dificultades[trabajo['instancia']] = dificultad_instancia(trabajo['instancia'])
+    def dificultad(trabajo):
+        return dificultades[trabajo['instancia']] * (2 if trabajo['variante'] == 'epsilon' else 1)
+
+    estado = leer_registro(registro) if registro is not None else {}
+    reanudar = {}
+    for trabajo, continuar in preparar_trabajos(trabajos, estado):
+        reanudar[clave_trabajo(trabajo)] = continuar
+    pendientes = sorted((t for t in trabajos if clave_trabajo(t) in reanudar), key=dificultad, reverse=True)
+    en_curso = {} # futuro -> (trabajo, hilos)
+    libres = nucleos
+    resultados = []
+
+    with ProcessPoolExecutor(max_workers=nucleos) as pool:
+        while pendientes or en_curso:
+            while pendientes and libres > 0:
+                restante = sum(dificultad(t) for t in pendientes) + sum(dificultad(t) for t, h in en_curso.values())
+                trabajo = pendientes.pop(0)
+                hilos = asignar_hilos(dificultad(trabajo), restante, nucleos, libres, max_hilos)
+                en_curso[pool.submit(ejecutar_trabajo, trabajo, hilos, solver_path, reanudar[clave_trabajo(trabajo)], intervalo)] = (trabajo, hilos)
+                _actualizar_registro(estado, registro, trabajo, estado='en_curso')
+                libres -= hilos
+                print(f'Iniciado: {trabajo["instancia"]} ({trabajo["variante"]}) con {hilos} threads | núcleos libres: {libres}')
+
+            terminados, _ = wait(en_curso, return_when=FIRST_COMPLETED)
+            for futuro in terminados:
+                trabajo, hilos = en_curso.pop(futuro)
+                libres += hilos
+                try:
+                    resultados.append(futuro.result())
+                    _registrar_terminado(estado, registro, historial, trabajo, resultados[-1])
+                    print(f"Terminado: {trabajo['instancia']} ({trabajo['variante']}) | FO: {resultados[-1]['FO']} | gap: {resultados[-1]['gap']} | {resultados[-1]['tiempo']} s")
+                except Exception as error:
+                    _actualizar_registro(estado, registro, trabajo, estado='error', error=str(error))
+                    print(f'Error en {trabajo["instancia"]} ({trabajo["variante"]}): {error}')
+    return resultados
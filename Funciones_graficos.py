@@ -0,0 +1,157 @@
+'''
+Reportes gráficos y en Excel de la programación.
+
+Los mapas de calor por día (Empleado x Escritorio, con la zona anotada en
+cada celda asignada) se dibujan en un pool de procesos y se anotan en bloque
+con el arreglo annot de seaborn, con un tamaño de figura que crece con la
+cantidad de filas y columnas. El libro de Excel se escribe por filas con
+xlsxwriter en modo de memoria constante. renderizar_todo genera ambos para
+cada solución guardada (solucion_<instancia>.npz) en las carpetas
+Model_outputs*.
+
+En Windows, el código que llama a estas funciones con procesos > 1 debe
+estar dentro de un bloque if __name__ == '__main__' (requisito de
+multiprocessing).
+'''
+import os
+
+CARPETA_GRAFICOS = 'graficos_programacion'
+
+def graficar_dia(df_dia, dia, ruta):
+    '''
+    Dibuja y guarda en ruta el mapa de calor de un día: una fila por
+    empleado, una columna por escritorio y la zona escrita en las celdas
+    asignadas. Retorna la ruta.
+    '''
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
+    pivot_table = df_dia.pivot_table(index="Empleado", columns="Escritorio", values="Zona", aggfunc='first')
+    filas, columnas = pivot_table.shape
+
+    # La figura crece con la tabla para que las etiquetas sigan siendo legibles
+    ancho = max(10, 0.35 * columnas + 2)
+    alto = max(6, 0.25 * filas + 2)
+    fuente = 8 if max(filas, columnas) <= 60 else 6
+
+    fig, ax = plt.subplots(figsize=(ancho, alto))
+    sns.heatmap(pivot_table.isna(), cbar=False, cmap="Greys", linewidths=0.5, linecolor='gray',
+                annot=pivot_table.fillna('').to_numpy(), fmt='', annot_kws={'fontsize': fuente},
+                xticklabels=True, yticklabels=True, ax=ax)
+    ax.tick_params(labelsize=fuente)
+    ax.set_title(f"Asignaciones - Día: {dia}")
+    ax.set_xlabel("Escritorio")
+    ax.set_ylabel("Empleado")
+    fig.tight_layout()
+    fig.savefig(ruta)
+    plt.close(fig)
+    return ruta
+
+def graficar_programacion(df_programacion, dias, carpeta=CARPETA_GRAFICOS, procesos=None, pool=None):
+    '''
+    Genera un mapa de calor por día (programacion_dia_<dia>.png) en la
+    carpeta, en paralelo con procesos procesos (por defecto, uno por día;
+    1 para dibujar en serie).
+    dias: list
+        Días en el orden deseado; se omiten los días sin asignaciones.
+    pool: ProcessPoolExecutor
+        Pool existente a usar en lugar de crear uno (ver renderizar_todo).
+
+    Retorna la lista de rutas generadas (o de futuros, si se entrega pool).
+    '''
+    os.makedirs(carpeta, exist_ok=True)
+    tareas = []
+    for dia in dias:
+        df_dia = df_programacion[df_programacion["Día"] == dia]
+        if not df_dia.empty:
+            tareas.append((df_dia, dia, os.path.join(carpeta, f"programacion_dia_{dia}.png")))
+
+    if pool is not None:
+        return [pool.submit(graficar_dia, *tarea) for tarea in tareas]
+    if procesos == 1 or len(tareas) <= 1:
+        return [graficar_dia(*tarea) for tarea in tareas]
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=procesos or len(tareas)) as pool:
+        futuros = [pool.submit(graficar_dia, *tarea) for tarea in tareas]
+        return [futuro.result() for futuro in futuros]
+
+def escribir_excel(df_programacion, dias, ruta):
+    '''
+    Escribe una hoja por día con las filas de df_programacion. Con xlsxwriter
+    el libro se escribe fila por fila en modo de memoria constante; si no
+    está instalado, se usa el escritor de pandas con openpyxl.
+    '''
+    import pandas as pd
+
+    try:
+        import xlsxwriter
+    except ImportError:
+        with pd.ExcelWriter(ruta, engine="openpyxl") as excel_writer:
+            for dia in dias:
+                df_dia = df_programacion[df_programacion["Día"] == dia]
+                if not df_dia.empty:
+                    df_dia.to_excel(excel_writer, sheet_name=dia, index=False)
+        return ruta
+
+    # pandas escribe por columnas, lo que no es compatible con constant_memory:
+    # las filas se escriben directamente y en orden
+    libro = xlsxwriter.Workbook(ruta, {'constant_memory': True})
+    columnas = list(df_programacion.columns)
+    for dia in dias:
+        df_dia = df_programacion[df_programacion["Día"] == dia]
+        if df_dia.empty:
+            continue
+        hoja = libro.add_worksheet(dia)
+        hoja.write_row(0, 0, columnas)
+        for i, fila in enumerate(df_dia.itertuples(index=False, name=None), start=1):
+            hoja.write_row(i, 0, ['' if pd.isna(valor) else valor for valor in fila])
+    libro.close()
+    return ruta
+
+def renderizar_instancia(instancia, carpeta_solucion, carpeta_salida=CARPETA_GRAFICOS, procesos=None, pool=None):
+    '''
+    Genera el Excel y los mapas de calor de la solución guardada
+    <carpeta_solucion>/solucion_<instancia>.npz en
+    <carpeta_salida>/<carpeta_solucion>/<instancia>/.
+    '''
+    from Funciones import importar_data, cargar_solucion, programacion
+
+    # Las etapas intermedias (p. ej. solucion_<instancia>_F2.npz) guardan en
+    # sus metadatos el nombre de la instancia de origen
+    solucion = cargar_solucion(instancia, carpeta_solucion)
+    origen = solucion.metadatos.get('instancia', instancia)
+    inst = importar_data(os.path.join('instances', f'{origen}.json'), imprimir=False)
+    df_programacion = programacion(solucion, inst.E, inst.D, inst.T, inst.Z, inst.e_g)
+
+    carpeta = os.path.join(carpeta_salida, os.path.basename(os.path.normpath(carpeta_solucion)), instancia)
+    os.makedirs(carpeta, exist_ok=True)
+    escribir_excel(df_programacion, inst.T, os.path.join(carpeta, 'programacion_completa.xlsx'))
+    return graficar_programacion(df_programacion, inst.T, carpeta, procesos, pool)
+
+def renderizar_todo(patron='Model_outputs*', carpeta_salida=CARPETA_GRAFICOS, procesos=None):
+    '''
+    Renderiza todas las soluciones (solucion_<instancia>.npz) de las carpetas
+    que cumplen el patrón. Los Excel se escriben en el proceso principal
+    mientras los días de todas las instancias se dibujan en un mismo pool de
+    procesos procesos. Retorna el diccionario (carpeta, instancia) -> rutas
+    de los gráficos.
+    '''
+    import glob
+    from concurrent.futures import ProcessPoolExecutor
+
+    futuros = {}
+    with ProcessPoolExecutor(max_workers=procesos) as pool:
+        for carpeta in sorted(glob.glob(patron)):
+            for ruta in sorted(glob.glob(os.path.join(carpeta, 'solucion_*.npz'))):
+                instancia = os.path.basename(ruta)[len('solucion_'):-len('.npz')]
+                futuros[carpeta, instancia] = renderizar_instancia(instancia, carpeta, carpeta_salida, pool=pool)
+
+        resultado = {}
+        for (carpeta, instancia), pendientes in futuros.items():
+            resultado[carpeta, instancia] = [futuro.result() for futuro in pendientes]
+            print(f'{carpeta}/{instancia}: {len(resultado[carpeta, instancia])} gráficos')
+    return resultado
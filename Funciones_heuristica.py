@@ -0,0 +1,161 @@
+'''
+Heurística constructiva para obtener en milisegundos una programación
+factible sin llamar al solver. Sirve como solución inicial (MIP start) de
+los modelos F1 y F2 y como respaldo cuando el solver agota el tiempo sin
+encontrar una solución entera.
+
+La asignación se retorna con el mismo formato que extraer_asignacion
+(listas de índices de X, Y y Z con valor 1), de modo que se puede cargar en
+un modelo con cargar_asignacion o convertir en DataFrame con
+programacion_asignacion.
+'''
+
+def zona_preferida_grupo(inst):
+    '''
+    Zona en la que cada grupo tiene más escritorios permitidos para sus
+    integrantes (None si el grupo no tiene escritorios). La heurística
+    intenta ubicar a todo el grupo en esa zona.
+    '''
+    zonas = {}
+    for g in inst.G:
+        escritorios = {z: len({d for (e, d) in inst.combinaciones_grupo_zona(g, z)}) for z in inst.Z}
+        z = max(inst.Z, key=lambda z: escritorios[z]) if inst.Z else None
+        zonas[g] = z if z is not None and escritorios[z] > 0 else None
+    return zonas
+
+def _emparejar_dia(inst, asistentes, zona_grupo, pareja=None, reunidos=()):
+    '''
+    Asigna escritorios a los asistentes de un día: primero solo con
+    escritorios de la zona preferida de su grupo y luego con todos los
+    permitidos (los de la zona preferida primero), por caminos aumentantes.
+    Los integrantes de los grupos que se reúnen ese día (reunidos) se ubican
+    primero y, si quedan en su zona preferida, no salen de ella al completar,
+    salvo que así queden menos asistentes con escritorio.
+    Retorna el emparejamiento escritorio -> colaborador.
+    '''
+    from Funciones import emparejamiento_bipartito
+
+    restringida = {}
+    completa = {}
+    for e in asistentes:
+        z_g = zona_grupo.get(inst.grupo(e))
+        propios = [d for (d, z) in inst.edz_colaborador[e] if z == z_g]
+        otros = [d for (d, z) in inst.edz_colaborador[e] if z != z_g and d not in propios]
+        restringida[e] = propios
+        completa[e] = propios + otros
+
+    pareja = emparejamiento_bipartito(restringida, pareja, nodos=[e for e in asistentes if e in reunidos])
+    pareja = emparejamiento_bipartito(restringida, pareja, nodos=asistentes)
+    libre = emparejamiento_bipartito(completa, dict(pareja), nodos=asistentes)
+    if not reunidos:
+        return libre
+
+    # Con los reunidos fijos en su zona, mientras no quede nadie más sin escritorio
+    fija = dict(completa)
+    for e in set(pareja.values()).intersection(reunidos):
+        fija[e] = restringida[e]
+    pareja = emparejamiento_bipartito(fija, pareja, nodos=asistentes)
+    return pareja if len(pareja) >= len(libre) else libre
+
+def heuristica_constructiva(inst, completar_preferidos=True, imprimir=False):
+    '''
+    Construye una programación en tres pasos:
+        1. Día de reunión (Z) de cada grupo, del más grande al más pequeño: el
+           día con más integrantes que lo prefieren sin superar la cantidad de
+           escritorios.
+        2. Días de asistencia (Y): el día de reunión y días preferidos (Days_E)
+           menos cargados hasta completar el mínimo; si faltan, días no
+           preferidos. Con completar_preferidos se agregan días preferidos
+           hasta el máximo.
+        3. Escritorios (X) de cada día por emparejamiento bipartito sobre
+           Desks_E y Desks_Z, agrupando a cada grupo en su zona preferida (el
+           día de reunión, el grupo se ubica antes que los demás asistentes).
+           Un día sin escritorio disponible (que no sea de reunión) se mueve
+           a otro día con cupo.
+    inst: Instancia
+        Resultado de importar_data.
+    completar_preferidos: bool
+        Si es True, asigna días preferidos adicionales hasta inst.max.
+    imprimir: bool
+        Si es True, imprime las asistencias que quedaron sin escritorio.
+
+    Retorna un diccionario con las listas 'X', 'Y' y 'Z' y la lista
+    'sin_escritorio' de pares (e, t) que no pudieron asignarse.
+    '''
+    E, T, G = inst.E, inst.T, inst.G
+    capacidad = len(inst.edz_escritorio) # Escritorios utilizables por día
+    zona_grupo = zona_preferida_grupo(inst)
+
+    # 1. Día de reunión de cada grupo
+    carga = {t: 0 for t in T}
+    reunion = {}
+    for g in sorted(G, key=lambda g: -len(inst.e_g[g])):
+        miembros = inst.e_g[g]
+        candidatos = [t for t in T if carga[t] + len(miembros) <= capacidad] or list(T)
+        t = max(candidatos, key=lambda t: (sum(inst.prefiere(e, t) for e in miembros), -carga[t]))
+        reunion[g] = t
+        carga[t] += len(miembros)
+
+    # 2. Días de asistencia: primero los colaboradores con menos días preferidos
+    dias = {e: set() for e in E}
+    obligatorios = {e: set() for e in E}
+    for g in G:
+        for e in inst.e_g[g]:
+            obligatorios[e].add(reunion[g])
+            dias[e].add(reunion[g])
+
+    # Primero todos hasta el mínimo y después, con el cupo restante, días
+    # preferidos hasta el máximo
+    orden = sorted(E, key=lambda e: bin(inst.mascara_dias[inst.id_E[e]]).count('1'))
+    pasadas = [(inst.min, True)] + ([(inst.max, False)] if completar_preferidos else [])
+    for limite, permitir_otros in pasadas:
+        for e in orden:
+            if not inst.edz_colaborador[e]:
+                continue
+            preferidos = sorted((t for t in T if inst.prefiere(e, t) and t not in dias[e]), key=lambda t: carga[t])
+            otros = sorted((t for t in T if not inst.prefiere(e, t) and t not in dias[e]), key=lambda t: carga[t])
+            for t in preferidos + (otros if permitir_otros else []):
+                if len(dias[e]) >= limite:
+                    break
+                if carga[t] < capacidad:
+                    dias[e].add(t)
+                    carga[t] += 1
+
+    # 3. Escritorios de cada día
+    parejas = {}
+    for t in T:
+        asistentes = [e for e in E if t in dias[e]]
+        reunidos = {e for g in G if reunion[g] == t for e in inst.e_g[g]}
+        parejas[t] = _emparejar_dia(inst, asistentes, zona_grupo, reunidos=reunidos)
+
+    # Reubicar las asistencias sin escritorio que no son de reunión
+    sin_escritorio = []
+    for t in T:
+        asignados = set(parejas[t].values())
+        for e in [e for e in E if t in dias[e] and e not in asignados]:
+            dias[e].discard(t)
+            carga[t] -= 1
+            if t in obligatorios[e]:
+                sin_escritorio.append((e, t))
+                continue
+            if len(dias[e]) >= inst.min:
+                continue
+            alternativas = sorted((t2 for t2 in T if t2 != t and t2 not in dias[e]), key=lambda t2: (not inst.prefiere(e, t2), carga[t2]))
+            for t2 in alternativas:
+                parejas[t2] = _emparejar_dia(inst, [e], zona_grupo, parejas[t2])
+                if e in parejas[t2].values():
+                    dias[e].add(t2)
+                    carga[t2] += 1
+                    break
+            else:
+                sin_escritorio.append((e, t))
+
+    zona_escritorio = {(e, d): z for (e, d, z) in inst.EDZ}
+    X = [(e, d, t, zona_escritorio[e, d]) for t in T for d, e in parejas[t].items() if t in dias[e]]
+    Y = [(e, t) for (e, d, t, z) in X]
+    Zr = [(g, reunion[g]) for g in G]
+
+    if imprimir and sin_escritorio:
+        print(f'Heurística: {len(sin_escritorio)} asistencias sin escritorio: {sin_escritorio}')
+
+    return {'X': X, 'Y': Y, 'Z': Zr, 'sin_escritorio': sin_escritorio}
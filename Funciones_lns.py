@@ -0,0 +1,189 @@
+'''
+Búsqueda en vecindarios grandes (LNS) para instancias que el modelo
+monolítico no alcanza a resolver (miles de colaboradores).
+
+El modelo F1 (con la epsilon restriccion de satisfaccion, si se pide) se
+construye una sola vez. En cada iteración se fijan X, Y y Z con la mejor
+solución conocida salvo en un vecindario (algunos grupos, una zona o un día),
+se resuelve ese sub-MIP con CBC partiendo de la solución actual y se acepta
+si no empeora la función objetivo. El vecindario de cada iteración se elige
+por ruleta con pesos que se ajustan según los resultados (LNS adaptativo) y
+su tamaño crece si CBC lo resuelve antes del límite y decrece si no.
+'''
+
+SOLVER_PATH = 'Optimizer\\Cbc-releases.2.10.12-windows-2022-msvs-v17-Release-x64\\bin\\cbc.exe'
+
+VECINDARIOS = ('grupos', 'zona', 'dia')
+
+# Puntajes de la ruleta: mejora, igual y sin solución o peor
+PUNTAJES = {'mejora': 3.0, 'igual': 1.0, 'falla': 0.0}
+
+def elegir_vecindario(inst, asignacion, tipo, tamano, aleatorio):
+    '''
+    Colaboradores, grupos y días libres del vecindario tipo, con al menos
+    tamano colaboradores (o todos si no alcanzan):
+        'grupos': integrantes de grupos elegidos al azar;
+        'zona': colaboradores asignados en zonas elegidas al azar y los
+            grupos completos entre ellos;
+        'dia': colaboradores asignados un día elegido al azar, en zonas
+            elegidas al azar; solo se libera ese día.
+
+    Retorna (libres, grupos_libres, dias), con dias = None si se liberan
+    todos los días.
+    '''
+    libres, grupos, dias = set(), set(), None
+
+    if tipo == 'grupos':
+        for g in aleatorio.sample(list(inst.G), len(inst.G)):
+            if len(libres) >= tamano:
+                break
+            grupos.add(g)
+            libres.update(inst.e_g[g])
+        return libres, grupos, dias
+
+    if tipo == 'dia':
+        dias = {aleatorio.choice(list(inst.T))}
+    por_zona = {}
+    for (e, d, t, z) in asignacion['X']:
+        if dias is None or t in dias:
+            por_zona.setdefault(z, set()).add(e)
+    zonas = list(por_zona)
+    for z in aleatorio.sample(zonas, len(zonas)):
+        if len(libres) >= tamano:
+            break
+        libres.update(por_zona[z])
+
+    # Un grupo solo puede cambiar de día de reunión si todos sus integrantes están libres
+    grupos = {g for g in inst.G if inst.e_g[g] and all(e in libres for e in inst.e_g[g])}
+    return libres, grupos, dias
+
+def busqueda_lns(inst, tiempo_limite, asignacion=None, epsilon=None, tiempo_iteracion=60, tamano=100, tolerancia=0.01, semilla=0, reaccion=0.2, solver_path=SOLVER_PATH, registro=None, imprimir=True):
+    '''
+    Mejora una programación con LNS adaptativo minimizando F1.
+    inst: Instancia
+        Resultado de importar_data.
+    tiempo_limite: float
+        Tiempo total de la búsqueda en segundos.
+    asignacion: dict
+        Programación factible inicial (ver extraer_asignacion en
+        Funciones_modelos). Por defecto, la heurística constructiva; si deja
+        asistencias sin escritorio (sin_escritorio) se lanza ValueError.
+    epsilon: float
+        Si se entrega, agrega la epsilon restriccion de satisfaccion; la
+        programación inicial debe cumplirla (la heurística constructiva no
+        la considera), si no se lanza ValueError.
+    tiempo_iteracion: float
+        Límite de tiempo de CBC en cada sub-MIP.
+    tamano: int
+        Colaboradores libres iniciales por vecindario.
+    reaccion: float
+        Peso de cada resultado nuevo en los pesos de la ruleta.
+    registro: str
+        Ruta de un CSV con una fila por iteración (iteracion, segundos,
+        vecindario, libres, FO, mejor FO, estado de CBC).
+
+    Retorna el modelo con la mejor programación cargada y la lista de
+    iteraciones.
+    '''
+    import csv
+    import time
+    import random
+    from pyomo.environ import value
+    from pyomo.opt import SolverFactory, TerminationCondition
+    from Funciones_modelos import construir_modelo, agregar_F1, agregar_epsilon, cargar_asignacion, extraer_asignacion, solucion_entera, cumple_epsilon
+    from Funciones_heuristica import heuristica_constructiva
+    from Funciones_delta import fijar_no_afectados
+
+    inicio = time.perf_counter()
+    aleatorio = random.Random(semilla)
+
+    # Formulación fuerte: con el big-M de 10000000000 CBC acepta P ~ 1e-10
+    # como 0 dentro de su tolerancia de integralidad y el sub-MIP reporta una
+    # FO que no corresponde a X
+    model = construir_modelo(inst, nombre='Universidad')
+    agregar_F1(model, inst, formulacion_fuerte=True)
+    if epsilon is not None:
+        agregar_epsilon(model, inst, epsilon)
+
+    if asignacion is None:
+        asignacion = heuristica_constructiva(inst)
+    if asignacion.get('sin_escritorio'):
+        raise ValueError(f"La programación inicial deja {len(asignacion['sin_escritorio'])} asistencias sin escritorio: entregue en asignacion una programación factible")
+    if epsilon is not None and not cumple_epsilon(inst, asignacion, epsilon):
+        raise ValueError(f'La programación inicial no cumple epsilon = {epsilon:.0f}: entregue en asignacion una programación que lo cumpla')
+    mejor = {nombre: list(asignacion[nombre]) for nombre in ('X', 'Y', 'Z')}
+    cargar_asignacion(model, inst, mejor)
+    mejor_fo = value(model.F1.distribucion_rule)
+    if imprimir:
+        print(f'LNS: FO inicial = {mejor_fo}')
+
+    solver = SolverFactory('cbc', executable=solver_path)
+    solver.options['ratio'] = tolerancia
+
+    pesos = {tipo: 1.0 for tipo in VECINDARIOS}
+    tamanos = {tipo: tamano for tipo in VECINDARIOS}
+    iteraciones = []
+    iteracion = 0
+    while time.perf_counter() - inicio < tiempo_limite:
+        iteracion += 1
+        restante = tiempo_limite - (time.perf_counter() - inicio)
+        tipo = aleatorio.choices(VECINDARIOS, weights=[pesos[t] for t in VECINDARIOS])[0]
+        libres, grupos_libres, dias = elegir_vecindario(inst, mejor, tipo, tamanos[tipo], aleatorio)
+
+        model.X.unfix()
+        model.Y.unfix()
+        model.Z.unfix()
+        cargar_asignacion(model, inst, mejor)
+        fijar_no_afectados(model, libres, grupos_libres, dias)
+
+        solver.options['seconds'] = max(1, min(tiempo_iteracion, restante))
+        resultado = solver.solve(model, tee=False, warmstart=True, load_solutions=False)
+        condicion = resultado.solver.termination_condition
+
+        fo = None
+        if solucion_entera(resultado):
+            model.solutions.load_from(resultado)
+            fo = value(model.F1.distribucion_rule)
+
+        if fo is not None and fo < mejor_fo - 1e-6:
+            resultado_iteracion = 'mejora'
+            mejor_fo = fo
+            mejor = extraer_asignacion(model)
+        elif fo is not None and fo <= mejor_fo + 1e-6:
+            resultado_iteracion = 'igual'
+            mejor = extraer_asignacion(model)
+        else:
+            resultado_iteracion = 'falla'
+
+        # Pesos de la ruleta y tamaño del vecindario
+        pesos[tipo] = max(0.1, (1 - reaccion) * pesos[tipo] + reaccion * PUNTAJES[resultado_iteracion])
+        if condicion == TerminationCondition.optimal:
+            tamanos[tipo] = min(len(inst.E), int(tamanos[tipo] * 1.2) + 1)
+        else:
+            tamanos[tipo] = max(1, int(tamanos[tipo] * 0.8))
+
+        segundos = time.perf_counter() - inicio
+        iteraciones.append({
+            'Iteracion': iteracion,
+            'Segundos': round(segundos, 2),
+            'Vecindario': tipo,
+            'Libres': len(libres),
+            'FO': fo,
+            'Mejor_FO': mejor_fo,
+            'Estado': str(condicion),
+        })
+        if imprimir:
+            print(f'Iteración {iteracion} ({segundos:.0f} s): {tipo} con {len(libres)} libres | FO = {fo} | mejor = {mejor_fo} | {resultado_iteracion}')
+
+    model.X.unfix()
+    model.Y.unfix()
+    model.Z.unfix()
+    cargar_asignacion(model, inst, mejor)
+
+    if registro is not None and iteraciones:
+        with open(registro, 'w', newline='') as f:
+            escritor = csv.DictWriter(f, fieldnames=list(iteraciones[0]))
+            escritor.writeheader()
+            escritor.writerows(iteraciones)
+
+    return model, iteraciones
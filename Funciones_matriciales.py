@@ -0,0 +1,374 @@
+'''
+Generador matricial de los modelos F1, F2 y epsilon. Construye directamente
+desde la Instancia las matrices dispersas de restricciones (COO -> CSR) con
+NumPy/SciPy, sin pasar por las expresiones de Pyomo, y permite escribir el
+problema en formato MPS o resolverlo en memoria con scipy.optimize.milp (HiGHS).
+
+Las columnas se ordenan por bloques: X (combinaciones factibles x días), Y, Z
+y, si la variante es F1, J, P, Penalizacion y Penalizacion2. Las filas
+siguen las mismas restricciones (y con el mismo significado) que
+construir_modelo, agregar_F2, agregar_F1 y agregar_epsilon.
+'''
+
+class ModeloMatricial:
+    '''
+    Modelo lineal entero en forma matricial:
+        min/max c x  s.a.  fila_lb <= A x <= fila_ub,  var_lb <= x <= var_ub, x entero
+    bloques: dict
+        Nombre de la variable -> (inicio, forma) dentro del vector x.
+    sentido: str
+        'min' o 'max'. c siempre se guarda en el sentido original.
+    '''
+    __slots__ = ('inst', 'variante', 'c', 'A', 'fila_lb', 'fila_ub', 'var_lb', 'var_ub',
+                 'bloques', 'sentido', 'x')
+
+    def __init__(self, inst, variante):
+        self.inst = inst
+        self.variante = variante
+        self.x = None
+
+    def columnas(self, nombre):
+        '''Índices de las columnas del bloque nombre con la forma de sus índices.'''
+        import numpy as np
+        inicio, forma = self.bloques[nombre]
+        return inicio + np.arange(int(np.prod(forma))).reshape(forma)
+
+    def valores(self, nombre):
+        '''Valores de la solución para el bloque nombre con la forma de sus índices.'''
+        import numpy as np
+        inicio, forma = self.bloques[nombre]
+        return self.x[inicio:inicio + int(np.prod(forma))].reshape(forma)
+
+    def objetivo(self):
+        '''Valor de la función objetivo en la solución cargada.'''
+        return float(self.c @ self.x)
+
+class _Filas:
+    '''
+    Acumulador de filas en formato COO.
+    '''
+    def __init__(self):
+        self.filas, self.columnas, self.coeficientes = [], [], []
+        self.lb, self.ub = [], []
+        self.n = 0
+
+    def agregar(self, cantidad, filas, columnas, coeficientes, lb, ub):
+        import numpy as np
+        self.filas.append(self.n + np.asarray(filas, dtype=np.int64))
+        self.columnas.append(np.asarray(columnas, dtype=np.int64))
+        self.coeficientes.append(np.broadcast_to(np.asarray(coeficientes, dtype=float), np.shape(columnas)).ravel())
+        self.lb.append(np.broadcast_to(np.asarray(lb, dtype=float), (cantidad,)))
+        self.ub.append(np.broadcast_to(np.asarray(ub, dtype=float), (cantidad,)))
+        self.n += cantidad
+
+    def matriz(self, n_columnas):
+        '''
+        Retorna A (CSR), lb y ub eliminando las filas vacías, que equivalen a
+        las restricciones que construir_modelo omite con Constraint.Skip.
+        '''
+        import numpy as np
+        from scipy.sparse import coo_matrix
+
+        filas = np.concatenate(self.filas)
+        columnas = np.concatenate(self.columnas)
+        coeficientes = np.concatenate(self.coeficientes)
+        lb = np.concatenate(self.lb)
+        ub = np.concatenate(self.ub)
+
+        usadas = np.zeros(self.n, dtype=bool)
+        usadas[filas] = True
+        nuevo_indice = np.cumsum(usadas) - 1
+
+        A = coo_matrix((coeficientes, (nuevo_indice[filas], columnas)), shape=(int(usadas.sum()), n_columnas)).tocsr()
+        A.sum_duplicates()
+        return A, lb[usadas], ub[usadas]
+
+def construir_matrices(inst, variante='F1', epsilon=None, formulacion_fuerte=False):
+    '''
+    Construye el modelo matricial de una instancia.
+    inst: Instancia
+        Resultado de importar_data.
+    variante: str
+        'F2' (satisfacción de los colaboradores) o 'F1' (zonas por grupo).
+    epsilon: float
+        Si no es None, agrega la epsilon restriccion de satisfacción.
+    formulacion_fuerte: bool
+        Solo para F1, igual que en agregar_F1.
+    '''
+    import numpy as np
+
+    E, D, T, G, Z = inst.E, inst.D, inst.T, inst.G, inst.Z
+    nE, nD, nT, nG, nZ = len(E), len(D), len(T), len(G), len(Z)
+    inf = np.inf
+
+    # Combinaciones factibles codificadas como enteros
+    K = len(inst.EDZ)
+    e_c = np.fromiter((inst.id_E[e] for (e, d, z) in inst.EDZ), dtype=np.int64, count=K)
+    d_c = np.fromiter((inst.id_D[d] for (e, d, z) in inst.EDZ), dtype=np.int64, count=K)
+    z_c = np.fromiter((inst.id_Z[z] for (e, d, z) in inst.EDZ), dtype=np.int64, count=K)
+    g_c = np.asarray(inst.grupo_colaborador, dtype=np.int64)[e_c]
+    # Días preferidos por colaborador (la máscara de bits no cabe en int64 con más de 63 días)
+    prefiere = np.zeros((nE, nT), dtype=bool)
+    for e in E:
+        prefiere[inst.id_E[e], [inst.id_T[t] for t in inst.di[e]]] = True
+    grupo_e = np.asarray(inst.grupo_colaborador, dtype=np.int64)
+
+    modelo = ModeloMatricial(inst, variante)
+    bloques = {}
+    n = 0
+    def bloque(nombre, forma):
+        nonlocal n
+        bloques[nombre] = (n, forma)
+        n += int(np.prod(forma))
+    bloque('X', (K, nT))
+    bloque('Y', (nE, nT))
+    bloque('Z', (nG, nT))
+    if variante == 'F1':
+        bloque('J', (nG, nT))
+        bloque('P', (nG, nZ, nT))
+        bloque('Penalizacion', (nE,))
+        bloque('Penalizacion2', (nG, nZ, nT))
+    modelo.bloques = bloques
+
+    X = modelo.columnas('X')
+    Y = modelo.columnas('Y')
+    Zv = modelo.columnas('Z')
+    kk, tt = np.meshgrid(np.arange(K), np.arange(nT), indexing='ij')
+    kk, tt = kk.ravel(), tt.ravel()
+    x_cols = X[kk, tt]
+    preferido = prefiere[e_c[kk], tt]
+
+    filas = _Filas()
+
+    # Relación [X] con variable auxiliar Y: sum X[e, ., t, .] - Y[e, t] = 0
+    filas.agregar(nE * nT,
+                  np.concatenate([e_c[kk] * nT + tt, np.arange(nE * nT)]),
+                  np.concatenate([x_cols, Y.ravel()]),
+                  np.concatenate([np.ones(K * nT), -np.ones(nE * nT)]), 0, 0)
+
+    # Días de presencialidad máximos
+    filas.agregar(nE, np.repeat(np.arange(nE), nT), Y.ravel(), 1, -inf, inst.max)
+
+    # Asignar solo un escritorio si va dicho dia
+    filas.agregar(nE * nT, e_c[kk] * nT + tt, x_cols, 1, -inf, 1)
+
+    # Un escritorio solo se le puede asignar a una persona
+    filas.agregar(nD * nT, d_c[kk] * nT + tt, x_cols, 1, -inf, 1)
+
+    # Cada grupo tiene grupo primario una vez
+    filas.agregar(nG, np.repeat(np.arange(nG), nT), Zv.ravel(), 1, 1, 1)
+
+    # Los integrantes de cada grupo deben asistir al primario: Y[e, t] - Z[g(e), t] >= 0
+    con_grupo = np.flatnonzero(grupo_e >= 0)
+    ee, tt2 = np.meshgrid(con_grupo, np.arange(nT), indexing='ij')
+    ee, tt2 = ee.ravel(), tt2.ravel()
+    r = np.arange(len(ee))
+    filas.agregar(len(ee), np.concatenate([r, r]),
+                  np.concatenate([Y[ee, tt2], Zv[grupo_e[ee], tt2]]),
+                  np.concatenate([np.ones(len(ee)), -np.ones(len(ee))]), 0, inf)
+
+    c = np.zeros(n)
+    var_lb = np.zeros(n)
+    var_ub = np.ones(n)
+
+    if variante == 'F2':
+        # Funcion objetivo: Maximizar la satisfacción de los empleados
+        c[x_cols[preferido]] = 1
+        modelo.sentido = 'max'
+        filas.agregar(nE, np.repeat(np.arange(nE), nT), Y.ravel(), 1, inst.min, inf)
+    else:
+        J = modelo.columnas('J')
+        P = modelo.columnas('P')
+        Pen = modelo.columnas('Penalizacion')
+        Pen2 = modelo.columnas('Penalizacion2')
+        c[J.ravel()] = 1
+        c[Pen] = 1
+        c[Pen2.ravel()] = 1
+        modelo.sentido = 'min'
+        var_ub[J.ravel()] = inf
+
+        # Días de presencialidad en el rango: sum Y + Penalizacion >= min
+        filas.agregar(nE, np.concatenate([np.repeat(np.arange(nE), nT), np.arange(nE)]),
+                      np.concatenate([Y.ravel(), Pen]), 1, inst.min, inf)
+
+        # Big-M por grupo y zona
+        if formulacion_fuerte:
+            colaboradores_gz = np.zeros((nG, nZ), dtype=np.int64)
+            pares = np.unique(np.stack([g_c, z_c, e_c])[:, g_c >= 0], axis=1)
+            np.add.at(colaboradores_gz, (pares[0], pares[1]), 1)
+            escritorios_z = np.array([len(inst.dz[z]) for z in Z], dtype=np.int64)
+            M = np.minimum(colaboradores_gz, escritorios_z[None, :])
+        else:
+            M = np.full((nG, nZ), 10000000000, dtype=float)
+
+        # Filas (g, z, t) con las X de los integrantes del grupo en la zona
+        x_grupo = g_c[kk] >= 0
+        fila_gzt = (g_c[kk] * nZ + z_c[kk]) * nT + tt
+        gg, zz, tt3 = np.meshgrid(np.arange(nG), np.arange(nZ), np.arange(nT), indexing='ij')
+        gg, zz, tt3 = gg.ravel(), zz.ravel(), tt3.ravel()
+        r = np.arange(nG * nZ * nT)
+
+        # sola: sum X - 2 P + Penalizacion2 >= 0
+        filas.agregar(nG * nZ * nT,
+                      np.concatenate([fila_gzt[x_grupo], r, r]),
+                      np.concatenate([x_cols[x_grupo], P.ravel(), Pen2.ravel()]),
+                      np.concatenate([np.ones(x_grupo.sum()), -2 * np.ones(len(r)), np.ones(len(r))]), 0, inf)
+
+        # sola2: sum X - M P <= 0
+        filas.agregar(nG * nZ * nT,
+                      np.concatenate([fila_gzt[x_grupo], r]),
+                      np.concatenate([x_cols[x_grupo], P.ravel()]),
+                      np.concatenate([np.ones(x_grupo.sum()), -M[gg, zz].astype(float)]), -inf, 0)
+
+        # Relacionar las variables J y P: J - sum P = 0
+        r2 = np.arange(nG * nT)
+        filas.agregar(nG * nT,
+                      np.concatenate([r2, gg * nT + tt3]),
+                      np.concatenate([J.ravel(), P.ravel()]),
+                      np.concatenate([np.ones(len(r2)), -np.ones(len(r))]), 0, 0)
+
+        if formulacion_fuerte:
+            # Cotas de J, P y Penalizacion2
+            zonas_g = (M > 0).sum(axis=1)
+            tam_g = np.array([len(inst.e_g[g]) for g in G], dtype=np.int64)
+            var_ub[J] = np.minimum(zonas_g, tam_g)[:, None]
+            sin_escritorios = np.repeat((M == 0)[:, :, None], nT, axis=2)
+            var_ub[P[sin_escritorios]] = 0
+            var_ub[Pen2[sin_escritorios]] = 0
+
+            # Presencia del colaborador en z obliga la presencia del grupo: sum_d X - P <= 0
+            ez, fila_ez = np.unique(e_c[kk][x_grupo] * nZ + z_c[kk][x_grupo], return_inverse=True)
+            fila_ezt = fila_ez * nT + tt[x_grupo]
+            r3 = np.arange(len(ez) * nT)
+            e_ez, z_ez = ez // nZ, ez % nZ
+            filas.agregar(len(ez) * nT,
+                          np.concatenate([fila_ezt, r3]),
+                          np.concatenate([x_cols[x_grupo], P[grupo_e[np.repeat(e_ez, nT)], np.repeat(z_ez, nT), np.tile(np.arange(nT), len(ez))]]),
+                          np.concatenate([np.ones(x_grupo.sum()), -np.ones(len(r3))]), -inf, 0)
+
+            # Presencia solo si algún integrante con escritorio en z asiste: P - sum Y <= 0
+            tiene_integrantes = M[gg, zz] > 0
+            fila_y = (grupo_e[e_ez][:, None] * nZ + z_ez[:, None]) * nT + np.arange(nT)[None, :]
+            filas.agregar(nG * nZ * nT,
+                          np.concatenate([r[tiene_integrantes], fila_y.ravel()]),
+                          np.concatenate([P.ravel()[tiene_integrantes], Y[np.repeat(e_ez, nT), np.tile(np.arange(nT), len(ez))]]),
+                          np.concatenate([np.ones(tiene_integrantes.sum()), -np.ones(len(ez) * nT)]), -inf, 0)
+
+            # El día del primario el grupo está presente en al menos una zona: sum P - Z >= 0
+            grupos_no_vacios = np.repeat(tam_g > 0, nT)
+            p_no_vacios = np.repeat(tam_g > 0, nZ * nT)
+            filas.agregar(nG * nT,
+                          np.concatenate([(gg * nT + tt3)[p_no_vacios], r2[grupos_no_vacios]]),
+                          np.concatenate([P.ravel()[p_no_vacios], Zv.ravel()[grupos_no_vacios]]),
+                          np.concatenate([np.ones(p_no_vacios.sum()), -np.ones(grupos_no_vacios.sum())]), 0, inf)
+
+            # Solo se penaliza una zona en la que el grupo está presente: Penalizacion2 - P <= 0
+            filas.agregar(nG * nZ * nT, np.concatenate([r, r]),
+                          np.concatenate([Pen2.ravel(), P.ravel()]),
+                          np.concatenate([np.ones(len(r)), -np.ones(len(r))]), -inf, 0)
+
+    if epsilon is not None:
+        filas.agregar(1, np.zeros(preferido.sum(), dtype=np.int64), x_cols[preferido], 1, epsilon, inf)
+
+    modelo.c = c
+    modelo.var_lb = var_lb
+    modelo.var_ub = var_ub
+    modelo.A, modelo.fila_lb, modelo.fila_ub = filas.matriz(n)
+    return modelo
+
+def escribir_mps(modelo, ruta):
+    '''
+    Escribe el modelo en formato MPS libre. Todas las variables son enteras.
+    Si el sentido es 'max' se escribe el objetivo con signo contrario
+    (CBC y la mayoría de solvers asumen minimización en MPS).
+    '''
+    import numpy as np
+
+    A = modelo.A.tocsc()
+    c = -modelo.c if modelo.sentido == 'max' else modelo.c
+    lb, ub = modelo.fila_lb, modelo.fila_ub
+
+    lineas = ['NAME ' + modelo.variante, 'ROWS', ' N  obj']
+    tipos = np.where(lb == ub, 'E', np.where(np.isinf(lb), 'L', 'G'))
+    lineas.extend(f' {tipo}  R{i}' for i, tipo in enumerate(tipos))
+
+    lineas.append('COLUMNS')
+    lineas.append("    MARKER  'MARKER'  'INTORG'")
+    for j in range(A.shape[1]):
+        inicio, fin = A.indptr[j], A.indptr[j + 1]
+        if c[j] != 0:
+            lineas.append(f'    C{j}  obj  {c[j]:.12g}')
+        for i, v in zip(A.indices[inicio:fin], A.data[inicio:fin]):
+            lineas.append(f'    C{j}  R{i}  {v:.12g}')
+        if c[j] == 0 and inicio == fin:
+            lineas.append(f'    C{j}  obj  0')
+    lineas.append("    MARKER  'MARKER'  'INTEND'")
+
+    lineas.append('RHS')
+    rhs = np.where(tipos == 'L', ub, lb)
+    lineas.extend(f'    rhs  R{i}  {v:.12g}' for i, v in enumerate(rhs) if v != 0)
+
+    rango = (tipos == 'G') & np.isfinite(ub)
+    if rango.any():
+        lineas.append('RANGES')
+        lineas.extend(f'    rng  R{i}  {ub[i] - lb[i]:.12g}' for i in np.flatnonzero(rango))
+
+    lineas.append('BOUNDS')
+    for j, (l, u) in enumerate(zip(modelo.var_lb, modelo.var_ub)):
+        if l == u:
+            lineas.append(f' FX bnd  C{j}  {l:.12g}')
+        elif l == 0 and u == 1:
+            lineas.append(f' BV bnd  C{j}')
+        elif np.isinf(u):
+            lineas.append(f' LO bnd  C{j}  {l:.12g}')
+            lineas.append(f' PL bnd  C{j}')
+        else:
+            lineas.append(f' LO bnd  C{j}  {l:.12g}')
+            lineas.append(f' UP bnd  C{j}  {u:.12g}')
+    lineas.append('ENDATA')
+
+    with open(ruta, 'w') as f:
+        f.write('\n'.join(lineas))
+        f.write('\n')
+
+def resolver_matricial(modelo, tiempo_limite, tolerancia=0.01):
+    '''
+    Resuelve el modelo en memoria con scipy.optimize.milp (HiGHS), sin
+    escribir archivos. Carga la solución en modelo.x y retorna el resultado
+    de milp (status, fun, mip_gap, ...), con fun en el sentido original.
+    '''
+    import numpy as np
+    from scipy.optimize import milp, LinearConstraint, Bounds
+
+    signo = -1 if modelo.sentido == 'max' else 1
+    resultado = milp(
+        signo * modelo.c,
+        integrality=np.ones(len(modelo.c)),
+        bounds=Bounds(modelo.var_lb, modelo.var_ub),
+        constraints=LinearConstraint(modelo.A, modelo.fila_lb, modelo.fila_ub),
+        options={'time_limit': tiempo_limite, 'mip_rel_gap': tolerancia, 'disp': True},
+    )
+    if resultado.x is not None:
+        modelo.x = np.round(resultado.x)
+        resultado.fun = modelo.objetivo()
+    return resultado
+
+def programacion_matricial(modelo):
+    '''
+    Genera el DataFrame de programacion() (Empleado, Día, Zona, Escritorio,
+    Grupo) a partir de la solución cargada en el modelo matricial.
+    '''
+    import numpy as np
+    import pandas as pd
+
+    inst = modelo.inst
+    k, t = np.nonzero(modelo.valores('X') > 0.5)
+    filas = [inst.EDZ[i] for i in k]
+    df_programacion = pd.DataFrame({
+        "Empleado": [e for (e, d, z) in filas],
+        "Día": [inst.T[j] for j in t],
+        "Zona": [z for (e, d, z) in filas],
+        "Escritorio": [d for (e, d, z) in filas],
+    })
+    df_programacion["Grupo"] = [inst.grupo(e) for e in df_programacion["Empleado"]]
+    return df_programacion
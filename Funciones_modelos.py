@@ -1,210 +1,863 @@
-def resolver_modelo_F2(instance, tiempo_limite, tolerancia=0.01, solver_path ='Optimizer\\Cbc-releases.2.10.12-windows-2022-msvs-v17-Release-x64\\bin\\cbc.exe'):
+def construir_modelo(inst, nombre='Colaboradores'):
     '''
-    Resuelve el modelo que optimiza los intereses de los colaboradores
+    Construye el núcleo común de los modelos F1 y F2 una sola vez por instancia:
+    variables X, Y, Z y las restricciones de presencialidad y de reuniones.
+    Los objetivos y la epsilon restriccion se agregan como bloques con
+    agregar_F2, agregar_F1 y agregar_epsilon, y se retiran con retirar_bloque.
+    inst: Instancia
+        Resultado de importar_data.
+    nombre: str
+        Nombre del ConcreteModel.
     '''
-    from Funciones import importar_data
-    import pyomo
-    from pyomo.environ import ConcreteModel, Var, Binary, Objective, maximize, Constraint
-    from pyomo.opt import SolverFactory
-
-    solver = SolverFactory('cbc', executable=solver_path)
-    instancia = f'instances\\{instance}.json'
+    from pyomo.environ import ConcreteModel, Var, Binary, Constraint
 
-    E, D, T, G, Z, dz, dr, e_g, di, max, min = importar_data(instancia, imprimir=False)
+    E, D, T, G = inst.E, inst.D, inst.T, inst.G
+    edz_colaborador, edz_escritorio = inst.edz_colaborador, inst.edz_escritorio
+    EDTZ = [(e, d, t, z) for (e, d, z) in inst.EDZ for t in T]
+    # Solo los pares (colaborador, grupo) existentes, en lugar de E x T x G
+    ETG = [(e, t, inst.grupo(e)) for e in E if inst.grupo(e) is not None for t in T]
 
-    model = ConcreteModel(name='Colaboradores')
-    model.X = Var(E, D, T, Z, within=Binary, initialize=0)
-    model.Y = Var(E, T, within=Binary, initialize=0)
-    model.Z = Var(G, T, within=Binary, initialize=0)
-
-    def satisfaccion_rule(model):
-        return sum(
-            model.X[e, d, t, z] * int(t in di[e])
-            for e in E
-            for d in D
-            for t in T
-            for z in Z
-        )
-    model.satisfaccion = Objective(rule=satisfaccion_rule, sense=maximize)
+    model = ConcreteModel(name=nombre)
+    model.X = Var(EDTZ, within=Binary, initialize=0) # Si el colaborador e en el escritorio d asiste el dia d en la zona z
+    model.Y = Var(E, T, within=Binary, initialize=0) # Si el colaborador e asiste el dia t
+    model.Z = Var(G, T, within=Binary, initialize=0) # Si el grupo g tiene primario el dia t
 
+    #RESTRICCIONES
+    # Relación [X] con variable auxiliar Y
     def dias_presencialidad(model, e, t):
-        return sum(model.X[e, d, t, z] for d in D for z in Z) == model.Y[e, t]
+        return sum(model.X[e, d, t, z] for (d, z) in edz_colaborador[e]) == model.Y[e, t]
     model.dias_presencialidad = Constraint(E, T, rule=dias_presencialidad)
 
-    def dias_min(model, e):
-        return sum(model.Y[e, t] for t in T) >= min
-    model.dias_min = Constraint(E, rule=dias_min)
-
     def dias_max(model, e):
-        return sum(model.Y[e, t] for t in T) <= max
+        return sum(model.Y[e, t] for t in T) <= inst.max
     model.dias_max = Constraint(E, rule=dias_max)
 
+    # Asignar solo un escritorio si va dicho dia
     def solo_un_escritorio(model, e, t):
-        return sum(model.X[e, d, t, z] for d in D for z in Z) <= 1
+        if not edz_colaborador[e]:
+            return Constraint.Skip
+        return sum(model.X[e, d, t, z] for (d, z) in edz_colaborador[e]) <= 1
     model.solo_un_escritorio = Constraint(E, T, rule=solo_un_escritorio)
 
-    def colaborador_escritorio(model, e, d, t, z):
-        return model.X[e, d, t, z] <= int((d in dr[e]))
-    model.colaborador_escritorio = Constraint(E, D, T, Z, rule=colaborador_escritorio)
-
+    # Un escritorio solo se le puede asignar a una persona
     def escritorio_unico(model, d, t):
-        return sum(model.X[e, d, t, z] for e in E if d in dr[e] for z in Z if d in dz[z]) <= 1
+        if d not in edz_escritorio:
+            return Constraint.Skip
+        return sum(model.X[e, d, t, z] for (e, z) in edz_escritorio[d]) <= 1
     model.escritorio_unico = Constraint(D, T, rule=escritorio_unico)
 
-    def no_esta_en_zona(model, e, d, t, z):
-        return model.X[e, d, t, z] <= int((d in dz[z]))
-    model.no_esta_en_zona = Constraint(E, D, T, Z, rule=no_esta_en_zona)
-
+    # Cada grupo tiene grupo primario una vez
     def grupo_primario(model, g):
         return sum(model.Z[g, t] for t in T) == 1
     model.grupo_primario = Constraint(G, rule=grupo_primario)
 
+    # Los integrantes de cada grupo deben asistir al primario
     def asistencia_en_reunion(model, e, t, g):
-        if e in e_g[g]:
-            return model.Y[e, t] >= model.Z[g, t]
-        else:
-            return Constraint.Skip
-    model.asistencia_en_reunion = Constraint(E, T, G, rule=asistencia_en_reunion)
+        return model.Y[e, t] >= model.Z[g, t]
+    model.asistencia_en_reunion = Constraint(ETG, rule=asistencia_en_reunion)
 
-    solver.options['seconds'] = tiempo_limite
-    solver.options['ratio'] = tolerancia
+    return model
 
-    solver.solve(model, tee=True)
+def _bloque_existente(model, nombre):
+    '''
+    Reactiva y retorna el bloque nombre si ya fue agregado al modelo, o None.
+    '''
+    bloque = model.component(nombre)
+    if bloque is not None:
+        bloque.activate()
+    return bloque
 
-    total_presencialidad = 0 # Asignaciones totales de presencialidad
-    preferencias_satisfechas = 0 # Maximo preferencias satisfechas
+def agregar_F2(model, inst):
+    '''
+    Agrega al modelo el bloque F2 (intereses de los colaboradores): objetivo de
+    maximizar los días asignados que coinciden con las preferencias y mínimo
+    de días de presencialidad estricto.
+    '''
+    from pyomo.environ import Block, Objective, Constraint, maximize
 
-    for e in E:
-        for t in T:
-            if model.Y[e, t].value == 1:
-                total_presencialidad += 1
-                if t in di[e]:  # Si el día asignado está dentro de sus días preferidos
-                    preferencias_satisfechas += 1
+    if _bloque_existente(model, 'F2') is not None:
+        return model.F2
 
-    # Porcentaje de coincidencia
-    if total_presencialidad > 0:
-        porcentaje = 100 * preferencias_satisfechas / total_presencialidad
-    else:
-        porcentaje = 0
+    E, T = inst.E, inst.T
+
+    model.F2 = Block()
+
+    # Funcion objetivo: Maximizar la satisfacción de los empleados
+    def satisfaccion_rule(b):
+        return sum(
+            model.X[e, d, t, z]
+            for (e, d, z) in inst.EDZ
+            for t in T
+            if inst.prefiere(e, t)
+        )
+    model.F2.satisfaccion = Objective(rule=satisfaccion_rule, sense=maximize)
+
+    def dias_min(b, e):
+        return sum(model.Y[e, t] for t in T) >= inst.min
+    model.F2.dias_min = Constraint(E, rule=dias_min)
 
-    return preferencias_satisfechas, porcentaje
+    return model.F2
 
-def resolver_modelo_F1(instance, satisfaccion_deseada, porcentaje, preferencias_satisfechas, tiempo_limite, tolerancia=0.01, solver_path='Optimizer\\Cbc-releases.2.10.12-windows-2022-msvs-v17-Release-x64\\bin\\cbc.exe'):
+def agregar_F1(model, inst, formulacion_fuerte=False):
     '''
-    Resuelve el modelo que optimiza los intereses de la Universidad con epsilon restriccion de 
-    satisfaccion de los colaboradores
+    Agrega al modelo el bloque F1 (intereses de la Universidad): variables de
+    presencia por zona y penalizaciones, objetivo de minimizar la cantidad de
+    zonas por grupo y las restricciones que lo relacionan con X.
+    formulacion_fuerte: bool
+        Si es True, usa big-M calculados con los datos en lugar de 10000000000,
+        cotas explícitas para J y P y desigualdades válidas que relacionan P
+        con X, Y y Z. La relajación lineal es mucho más ajustada y el valor
+        óptimo no cambia.
     '''
-    from Funciones import importar_data, programacion
-    import pyomo
-    from pyomo.environ import ConcreteModel, Var, Binary, Objective, Constraint, NonNegativeIntegers, minimize
-    from pyomo.opt import SolverFactory
+    from pyomo.environ import Block, Var, Binary, NonNegativeIntegers, Objective, Constraint, minimize
 
-    # Calculo del epsilon
-    epsilon = round((preferencias_satisfechas / (porcentaje/100)) * satisfaccion_deseada, 0)
-    
-    # Configuracion de solver
-    solver = SolverFactory('cbc', executable=solver_path)
-    instancia = f'instances\\{instance}.json'
+    bloque = model.component('F1')
+    if bloque is not None:
+        if bloque.formulacion_fuerte == formulacion_fuerte:
+            bloque.activate()
+            return bloque
+        model.del_component(bloque)
 
-    # Llamar a la función para importar datos
-    E, D, T, G, Z, dz, dr, e_g, di, max, min = importar_data(instancia, imprimir=False)
+    E, T, G, Z = inst.E, inst.T, inst.G, inst.Z
 
-    model = ConcreteModel(name='Universidad')
-    model.X = Var(E, D, T, Z, within=Binary, initialize = 0) # Si el colaborador e en el escritorio d asiste el dia d en la zona z
-    model.Y = Var(E, T, within=Binary, initialize = 0) # Si el colaborador e asiste el dia t
-    model.Z = Var(G, T, within=Binary, initialize = 0) # Si el grupo g tiene primario el dia t
-    model.J = Var(G, T, within=NonNegativeIntegers, initialize = 0) # Cantidad de zonas en las que está presente integrantes de cada grupo
-    model.P = Var(G, Z, T, within = Binary, initialize = 0) # Si el grupo g tiene presencia (al menos un colaborador) en la zona z
+    model.F1 = Block()
+    b = model.F1
+    b.formulacion_fuerte = formulacion_fuerte
+    b.J = Var(G, T, within=NonNegativeIntegers, initialize = 0) # Cantidad de zonas en las que está presente integrantes de cada grupo
+    b.P = Var(G, Z, T, within = Binary, initialize = 0) # Si el grupo g tiene presencia (al menos un colaborador) en la zona z
 
     # Variables para penalizacion
-    model.Penalizacion = Var(E, within=Binary, initialize=0) # 1 si el colaborador asiste 1 dia, 0 si asiste 2
-    model.Penalizacion2 = Var(G, Z, T, within=Binary, initialize=0) # 1 si del grupo g en la zona z el dia t hay un solo colaborador, 0 EOC
-
+    b.Penalizacion = Var(E, within=Binary, initialize=0) # 1 si el colaborador asiste 1 dia, 0 si asiste 2
+    b.Penalizacion2 = Var(G, Z, T, within=Binary, initialize=0) # 1 si del grupo g en la zona z el dia t hay un solo colaborador, 0 EOC
 
     # Funcion objetivo
-    def distribucion_rule(model):
-        return sum(model.J[g, t] for g in G for t in T) + sum(model.Penalizacion[e] for e in E) + sum(model.Penalizacion2[g, z, t] for g in G for z in Z for t in T)  # Minimizar la cantidad de zonas y penalizaciones
-    model.distribucion_rule = Objective(rule=distribucion_rule, sense=minimize)
-
-    #RESTRICCIONES
-    # Relación [X] con variable auxiliar Y
-    def dias_presencialidad(model, e, t):
-        return sum(model.X[e, d, t, z] for d in D for z in Z) == model.Y[e, t]
-    model.dias_presencialidad = Constraint(E, T, rule=dias_presencialidad)
+    def distribucion_rule(b):
+        return sum(b.J[g, t] for g in G for t in T) + sum(b.Penalizacion[e] for e in E) + sum(b.Penalizacion2[g, z, t] for g in G for z in Z for t in T)  # Minimizar la cantidad de zonas y penalizaciones
+    b.distribucion_rule = Objective(rule=distribucion_rule, sense=minimize)
 
     # Días de presencialidad en el rango
-    def dias_min(model, e):
-        return sum(model.Y[e, t] for t in T) >= min - model.Penalizacion[e]
-    model.dias_min = Constraint(E, rule=dias_min)
+    def dias_min(b, e):
+        return sum(model.Y[e, t] for t in T) >= inst.min - b.Penalizacion[e]
+    b.dias_min = Constraint(E, rule=dias_min)
 
-    def dias_max(model, e):
-        return sum(model.Y[e, t] for t in T) <= max
-    model.dias_max = Constraint(E, rule=dias_max)
+    # Big-M por grupo y zona (ver cotas_grupo_zona)
+    if formulacion_fuerte:
+        M = cotas_grupo_zona(inst)
+    else:
+        M = {(g, z): 10000000000 for g in G for z in Z}
 
-    # Asignar solo un escritorio si va dicho dia
-    def solo_un_escritorio(model, e, t):
-        return sum(model.X[e, d, t, z] for d in D for z in Z) <= 1
-    model.solo_un_escritorio = Constraint(E, T, rule=solo_un_escritorio)
+    # No debe estar una persona "Sola" (Sola = no hay más colaboradores de su mismo equipo) en una zona
+    def sola(b, z, g, t):
+        return sum(model.X[e, d, t, z] for (e, d) in inst.combinaciones_grupo_zona(g, z)) >=  (b.P[g, z, t] * 2) - b.Penalizacion2[g, z, t]
+    b.sola = Constraint(Z, G, T, rule=sola)
 
-    # Cada colaborador debe estar en un escritorio de cumplas con sus caracteristicas
-    def colaborador_escritorio(model, e, d, t, z):
-        return model.X[e, d, t, z] <= int((d in dr[e]))
-    model.colaborador_escritorio = Constraint(E, D, T, Z, rule=colaborador_escritorio)
+    def sola2(b, z, g, t):
+        return sum(model.X[e, d, t, z] for (e, d) in inst.combinaciones_grupo_zona(g, z)) <=  b.P[g, z, t] * M[g, z]
+    b.sola2 = Constraint(Z, G, T, rule=sola2)
 
-    ###################################################################################################
-    # Un escritorio solo se le puede asignar a una persona
-    def escritorio_unico(model, d, t):
-        return sum(model.X[e, d, t, z] for e in E if d in dr[e] for z in Z if d in dz[z]) <= 1
-    model.escritorio_unico = Constraint(D, T, rule=escritorio_unico)
+    # Relacionar las variables J y P
+    def relacion_J_P(b, g, t):
+        return b.J[g, t] == sum(b.P[g, z, t] for z in Z)
+    b.relacion_J_P = Constraint(G, T, rule=relacion_J_P)
 
-    # No se debe asignar escritorios que no estan en esa zona #############################################
-    def no_esta_en_zona(model, e, d, t, z):
-        return model.X[e, d, t, z] <= int((d in dz[z]))
-    model.no_esta_en_zona = Constraint(E, D, T, Z, rule=no_esta_en_zona)
-    #######################################################################################################
+    if formulacion_fuerte:
+        agregar_desigualdades_validas_F1(model, inst, M)
 
-    # Cada grupo tiene grupo primario una vez
-    def grupo_primario(model, g):
-        return sum(model.Z[g, t] for t in T) == 1
-    model.grupo_primario = Constraint(G, rule=grupo_primario)
+    return b
 
-    # Los integrantes de cada grupo deben asistir al primario
-    def asistencia_en_reunion(model, e, t, g):
-        if e in e_g[g]:
-            return model.Y[e, t] >= model.Z[g, t]
-        else:
+def cotas_grupo_zona(inst):
+    '''
+    Cota de colaboradores del grupo g en la zona z por día: nunca hay más que
+    colaboradores del grupo con escritorio permitido en z, ni más que
+    escritorios en z. Retorna el diccionario (g, z) -> cota.
+    '''
+    M = {}
+    for g in inst.G:
+        for z in inst.Z:
+            colaboradores_gz = {e for (e, d) in inst.combinaciones_grupo_zona(g, z)}
+            M[g, z] = min(len(colaboradores_gz), len(inst.dz[z]))
+    return M
+
+def agregar_desigualdades_validas_F1(model, inst, M):
+    '''
+    Cotas y desigualdades válidas de la formulación fuerte de F1.
+    M: dict
+        Big-M por (grupo, zona) calculado con los datos.
+    '''
+    from pyomo.environ import Constraint
+
+    b = model.F1
+    T, G, Z = inst.T, inst.G, inst.Z
+
+    # Cotas: un grupo no puede estar en más zonas que integrantes tiene ni que
+    # zonas alcanzables; P y Penalizacion2 son 0 donde el grupo no tiene escritorios
+    for g in G:
+        zonas_g = [z for z in Z if M[g, z] > 0]
+        for t in T:
+            b.J[g, t].setub(min(len(zonas_g), len(inst.e_g[g])))
+            for z in Z:
+                if M[g, z] == 0:
+                    b.P[g, z, t].fix(0)
+                    b.Penalizacion2[g, z, t].fix(0)
+
+    # Cada colaborador en la zona z obliga la presencia de su grupo en z
+    ETZ = sorted({(e, t, z) for (e, d, z) in inst.EDZ for t in T if inst.grupo(e) is not None})
+    def presencia_colaborador(b, e, t, z):
+        return sum(model.X[e, d, t, z2] for (d, z2) in inst.edz_colaborador[e] if z2 == z) <= b.P[inst.grupo(e), z, t]
+    b.presencia_colaborador = Constraint(ETZ, rule=presencia_colaborador)
+
+    # Solo hay presencia del grupo en z si alguno de sus integrantes con escritorio en z asiste
+    def presencia_asistencia(b, g, z, t):
+        colaboradores_gz = {e for (e, d) in inst.combinaciones_grupo_zona(g, z)}
+        if not colaboradores_gz:
             return Constraint.Skip
-    model.asistencia_en_reunion = Constraint(E, T, G, rule=asistencia_en_reunion)
+        return b.P[g, z, t] <= sum(model.Y[e, t] for e in colaboradores_gz)
+    b.presencia_asistencia = Constraint(G, Z, T, rule=presencia_asistencia)
 
-    # No debe estar una persona "Sola" (Sola = no hay más colaboradores de su mismo equipo) en una zona
-    def sola(model, z, g, t):
-        return sum(model.X[e, d, t, z] for e in e_g[g] for d in dz[z]) >=  (model.P[g, z, t] * 2) - model.Penalizacion2[g, z, t]
-    model.sola = Constraint(Z, G, T, rule=sola)
+    # El día del primario el grupo está presente en al menos una zona
+    def presencia_reunion(b, g, t):
+        if not inst.e_g[g]:
+            return Constraint.Skip
+        return sum(b.P[g, z, t] for z in Z) >= model.Z[g, t]
+    b.presencia_reunion = Constraint(G, T, rule=presencia_reunion)
 
-    def sola2(model, z, g, t):
-        return sum(model.X[e, d, t, z] for e in e_g[g] for d in dz[z]) <=  model.P[g, z, t] * 10000000000
-    model.sola2 = Constraint(Z, G, T, rule=sola2)
+    # Solo se penaliza una zona en la que el grupo está presente
+    def penalizacion_presencia(b, g, z, t):
+        return b.Penalizacion2[g, z, t] <= b.P[g, z, t]
+    b.penalizacion_presencia = Constraint(G, Z, T, rule=penalizacion_presencia)
 
-    # Relacionar las variables J y P
-    def relacion_J_P(model, g, t):
-        return model.J[g, t] == sum(model.P[g, z, t] for z in Z)
-    model.relacion_J_P = Constraint(G, T, rule=relacion_J_P)
+def agregar_epsilon(model, inst, epsilon):
+    '''
+    Agrega (o actualiza) la epsilon restriccion de satisfaccion de los
+    colaboradores. El lado derecho es un parametro mutable, de modo que
+    cambiar epsilon no reconstruye la restriccion.
+    '''
+    from pyomo.environ import Block, Param, Constraint
+
+    if _bloque_existente(model, 'epsilon') is not None:
+        model.epsilon.valor.set_value(epsilon)
+        return model.epsilon
+
+    T = inst.T
+
+    model.epsilon = Block()
+    model.epsilon.valor = Param(initialize=epsilon, mutable=True)
+
+    def epsilon_restriccion(b):
+        return sum(model.X[e, d, t, z] for (e, d, z) in inst.EDZ for t in T if inst.prefiere(e, t)) >= b.valor
+    model.epsilon.epsilon_restriccion = Constraint(rule=epsilon_restriccion)
+
+    return model.epsilon
+
+def retirar_bloque(model, nombre):
+    '''
+    Desactiva el bloque nombre ('F1', 'F2' o 'epsilon') sin eliminarlo, para
+    poder agregarlo de nuevo sin volver a construirlo.
+    '''
+    bloque = model.component(nombre)
+    if bloque is not None:
+        bloque.deactivate()
+
+def extraer_asignacion(model):
+    '''
+    Retorna la asignación del núcleo del modelo resuelto: diccionario con las
+    listas de índices de X, Y y Z que toman valor 1.
+    '''
+    return {
+        nombre: [indice for indice, var in model.component(nombre).items() if var.value is not None and var.value > 0.5]
+        for nombre in ('X', 'Y', 'Z')
+    }
+
+def cumple_epsilon(inst, asignacion, epsilon):
+    '''
+    Indica si la asignación (ver extraer_asignacion) cumple la epsilon
+    restriccion: asignaciones de puesto en días preferidos >= epsilon.
+    '''
+    return sum(1 for (e, d, t, z) in asignacion['X'] if inst.prefiere(e, t)) >= epsilon
+
+def cargar_asignacion(model, inst, asignacion):
+    '''
+    Carga una asignación de X, Y y Z (ver extraer_asignacion) como valores
+    iniciales del modelo. Si el bloque F1 está activo, completa P, J,
+    Penalizacion y Penalizacion2 con los valores consistentes con X, de modo
+    que la asignación es una solución inicial completa para el solver.
+    '''
+    for nombre in ('X', 'Y', 'Z'):
+        var = model.component(nombre)
+        activos = set(asignacion[nombre])
+        for indice in var:
+            var[indice].set_value(1 if indice in activos else 0)
+
+    bloque = model.component('F1')
+    if bloque is None or not bloque.active:
+        return
+
+    E, T, G, Z = inst.E, inst.T, inst.G, inst.Z
+
+    # Colaboradores de cada grupo en cada zona y día
+    conteo = {}
+    for (e, d, t, z) in asignacion['X']:
+        g = inst.grupo(e)
+        if g is not None:
+            conteo[g, z, t] = conteo.get((g, z, t), 0) + 1
+
+    dias = {e: 0 for e in E}
+    for (e, t) in asignacion['Y']:
+        dias[e] += 1
+
+    for g in G:
+        for t in T:
+            zonas = 0
+            for z in Z:
+                n = conteo.get((g, z, t), 0)
+                if not bloque.P[g, z, t].fixed:
+                    bloque.P[g, z, t].set_value(1 if n > 0 else 0)
+                if not bloque.Penalizacion2[g, z, t].fixed:
+                    bloque.Penalizacion2[g, z, t].set_value(1 if n == 1 else 0)
+                zonas += 1 if n > 0 else 0
+            bloque.J[g, t].set_value(zonas)
+    for e in E:
+        bloque.Penalizacion[e].set_value(1 if dias[e] < inst.min else 0)
+
+def _gap(incumbente, cota):
+    '''Gap relativo entre incumbente y cota (None si falta alguno).'''
+    if incumbente is None or cota is None:
+        return None
+    return abs(incumbente - cota) / max(abs(incumbente), abs(cota), 1e-9)
+
+def leer_log_cbc(ruta):
+    '''
+    Lee el log de CBC y retorna un diccionario con el tiempo (segundos) hasta
+    la primera solución entera, el costo de la solución inicial aceptada
+    (MIPStart) y el tiempo total reportado por CBC. Los valores que no
+    aparecen en el log quedan en None. 'curva' es la lista de tuplas
+    (segundos, incumbente, cota) reportadas durante la búsqueda.
+
+    Además retorna la telemetría de la corrida:
+        telemetria: lista de puntos con segundos, incumbente, cota, gap,
+            nodos, en_arbol y cortes (cortes acumulados en la raíz), uno por
+            cada línea de progreso o solución entera nueva;
+        cortes: generador de cortes -> cortes de fila agregados;
+        estado: resultado final ('Optimal solution found', 'Stopped on
+            time limit', ...);
+        objetivo, cota_final, gap_final, nodos e iteraciones: resumen final;
+        cota_raiz, cortes_raiz y gap_raiz: cota, cortes agregados y gap al
+            terminar los cortes en el nodo raíz (Cbc0013I).
+    '''
+    import re
+
+    numero = r'(-?[\d.]+(?:[eE][+-]?\d+)?)'
+    resumen = _resumen_log()
+    incumbente, cota, nodos, en_arbol = None, None, 0, 0
+    ultimo_segundo = 0.0
+
+    def punto(segundos):
+        resumen['telemetria'].append({
+            'segundos': segundos,
+            'incumbente': incumbente,
+            'cota': cota,
+            'gap': _gap(incumbente, cota),
+            'nodos': nodos,
+            'en_arbol': en_arbol,
+            'cortes': sum(resumen['cortes'].values()),
+        })
+
+    with open(ruta, 'r', errors='ignore') as f:
+        for linea in f:
+            progreso = re.search(r'Cbc0010I After (\d+) nodes, (\d+) on tree, ' + numero + r' best solution, best possible ' + numero + r' \(([\d.]+) seconds\)', linea)
+            if progreso:
+                segundos = ultimo_segundo = float(progreso.group(5))
+                valor, posible = float(progreso.group(3)), float(progreso.group(4))
+                resumen['curva'].append((segundos, valor, posible))
+                nodos, en_arbol = int(progreso.group(1)), int(progreso.group(2))
+                incumbente = valor if abs(valor) < 1e49 else None
+                cota = posible if abs(posible) < 1e49 else None
+                punto(segundos)
+                continue
+
+            solucion = re.search(r'(Cbc0012I|Cbc0004I) Integer solution of ' + numero + r'.*?(?:and (\d+) nodes )?\(([\d.]+) seconds\)', linea)
+            if solucion:
+                segundos = ultimo_segundo = float(solucion.group(4))
+                incumbente = float(solucion.group(2))
+                if solucion.group(3) is not None:
+                    nodos = int(solucion.group(3))
+                if resumen['tiempo_primera_solucion'] is None:
+                    resumen['tiempo_primera_solucion'] = segundos
+                punto(segundos)
+                continue
+
+            # CBC escribe "cuts changed objective" o "cuts changing N objective"
+            # según la versión, y no siempre agrega los segundos
+            raiz = re.search(r'Cbc0013I At root node, (\d+) cuts chang\w+ (?:\d+ )?objective from ' + numero + r' to ' + numero + r'(?:.*?([\d.]+) seconds)?', linea)
+            if raiz:
+                cota = float(raiz.group(3))
+                if raiz.group(4) is not None:
+                    ultimo_segundo = float(raiz.group(4))
+                resumen['cota_raiz'] = cota
+                resumen['cortes_raiz'] = int(raiz.group(1))
+                resumen['gap_raiz'] = _gap(incumbente, cota)
+                punto(ultimo_segundo)
+                continue
+
+            generador = re.search(r'Cbc0014I Cut generator \d+ \(([^)]+)\) - (\d+) row cuts', linea)
+            if generador:
+                resumen['cortes'][generador.group(1)] = resumen['cortes'].get(generador.group(1), 0) + int(generador.group(2))
+                continue
+
+            if re.search(r'mipstart.*solution with cost', linea, re.IGNORECASE):
+                costo = re.search(r'cost\s+' + numero, linea)
+                if costo:
+                    resumen['mipstart'] = float(costo.group(1))
+                    incumbente = resumen['mipstart']
+                    if resumen['tiempo_primera_solucion'] is None:
+                        resumen['tiempo_primera_solucion'] = 0.0
+            elif linea.startswith('Result - '):
+                resumen['estado'] = linea[len('Result - '):].strip()
+            elif linea.startswith('Objective value:'):
+                resumen['objetivo'] = float(linea.split(':')[1])
+            elif linea.startswith('Lower bound:'):
+                resumen['cota_final'] = float(linea.split(':')[1])
+            elif linea.startswith('Gap:'):
+                resumen['gap_final'] = float(linea.split(':')[1])
+            elif linea.startswith('Enumerated nodes:'):
+                resumen['nodos'] = int(linea.split(':')[1])
+            elif linea.startswith('Total iterations:'):
+                resumen['iteraciones'] = int(linea.split(':')[1])
+            elif 'Wallclock seconds' in linea:
+                tiempo = re.search(r'Wallclock seconds\):\s+([\d.]+)', linea)
+                if tiempo:
+                    resumen['tiempo_total'] = float(tiempo.group(1))
+    return resumen
+
+def _resumen_log():
+    '''Resumen vacío de leer_log_cbc y leer_log_highs.'''
+    return {
+        'mipstart': None, 'tiempo_primera_solucion': None, 'tiempo_total': None, 'curva': [],
+        'telemetria': [], 'cortes': {}, 'estado': None,
+        'objetivo': None, 'cota_final': None, 'gap_final': None, 'nodos': None, 'iteraciones': None,
+        'cota_raiz': None, 'cortes_raiz': None, 'gap_raiz': None,
+    }
+
+def leer_log_highs(ruta):
+    '''
+    Lee el log de HiGHS (ver SesionSolver) y retorna el mismo resumen de
+    leer_log_cbc, de modo que guardar_telemetria sirve para ambos solvers.
+    La telemetría sale de la tabla de progreso del branch and bound (nodos,
+    en cola, cota, incumbente, cortes y segundos) y el resumen final del
+    reporte "Solving report". HiGHS no reporta los cortes por generador, así
+    que cortes queda vacío; la cota y los cortes en la raíz son los de la
+    última fila con 0 nodos procesados. Si el archivo tiene varias
+    corridas (HiGHS agrega al final), se lee solo la última.
+    '''
+    import re
+
+    def valor(texto):
+        texto = texto.rstrip('%')
+        if texto in ('inf', '-inf', 'Large', '-'):
+            return None
+        return float(texto)
+
+    fila = re.compile(r'^\s*[A-Za-z]?\s+(\d+)\s+(\d+)\s+\d+\s+[\d.]+%\s+(\S+)\s+(\S+)\s+\S+\s+(\d+)\s+\d+\s+\d+\s+\d+\s+([\d.]+)s\s*$')
+    with open(ruta, 'r', errors='ignore') as f:
+        lineas = f.read().splitlines()
+    inicios = [i for i, linea in enumerate(lineas) if re.match(r'(MIP|LP) has \d+ rows', linea)]
+    lineas = lineas[inicios[-1]:] if inicios else lineas
+
+    resumen = _resumen_log()
+    en_reporte = False
+    for linea in lineas:
+        progreso = fila.match(linea)
+        if progreso and not en_reporte:
+            segundos = float(progreso.group(6))
+            incumbente, cota = valor(progreso.group(4)), valor(progreso.group(3))
+            nodos, cortes = int(progreso.group(1)), int(progreso.group(5))
+            resumen['curva'].append((segundos, incumbente, cota))
+            resumen['telemetria'].append({
+                'segundos': segundos,
+                'incumbente': incumbente,
+                'cota': cota,
+                'gap': _gap(incumbente, cota),
+                'nodos': nodos,
+                'en_arbol': int(progreso.group(2)),
+                'cortes': cortes,
+            })
+            if incumbente is not None and resumen['tiempo_primera_solucion'] is None:
+                resumen['tiempo_primera_solucion'] = segundos
+            if nodos == 0:
+                resumen['cota_raiz'], resumen['cortes_raiz'], resumen['gap_raiz'] = cota, cortes, _gap(incumbente, cota)
+            continue
+
+        if linea.startswith('Solving report'):
+            en_reporte = True
+            continue
+        if not en_reporte:
+            continue
+        campo = linea.strip()
+        for prefijo, clave in (('Primal bound', 'objetivo'), ('Dual bound', 'cota_final'), ('Gap', 'gap_final'),
+                               ('Nodes', 'nodos'), ('LP iterations', 'iteraciones'), ('Timing', 'tiempo_total'), ('Status', 'estado')):
+            if campo.startswith(prefijo + ' '):
+                texto = campo[len(prefijo):].strip()
+                if clave == 'estado':
+                    resumen[clave] = texto
+                elif clave in ('nodos', 'iteraciones'):
+                    resumen[clave] = int(texto)
+                elif clave == 'gap_final':
+                    gap = valor(texto.split()[0])
+                    resumen[clave] = gap / 100 if gap is not None and texto.split()[0].endswith('%') else gap
+                else:
+                    resumen[clave] = valor(texto.split()[0])
+                break
+    return resumen
+
+def combinar_logs_cbc(logs):
+    '''
+    Combina los resúmenes de leer_log_cbc de varias corridas consecutivas
+    (por ejemplo, los tramos de una corrida con puntos de control).
+    logs: list
+        Pares (segundos de inicio, resumen) en orden.
+    Los tiempos de la telemetría se desplazan a su inicio, los cortes, nodos
+    e iteraciones se suman y el estado y el resumen final son los del último.
+    '''
+    combinado = _resumen_log()
+    for inicio, log in logs:
+        if combinado['mipstart'] is None:
+            combinado['mipstart'] = log['mipstart']
+        if combinado['cota_raiz'] is None:
+            for clave in ('cota_raiz', 'cortes_raiz', 'gap_raiz'):
+                combinado[clave] = log[clave]
+        if combinado['tiempo_primera_solucion'] is None and log['tiempo_primera_solucion'] is not None:
+            combinado['tiempo_primera_solucion'] = inicio + log['tiempo_primera_solucion']
+        if log['tiempo_total'] is not None:
+            combinado['tiempo_total'] = inicio + log['tiempo_total']
+        combinado['curva'] += [(inicio + segundos, valor, cota) for (segundos, valor, cota) in log['curva']]
+        combinado['telemetria'] += [dict(p, segundos=inicio + p['segundos']) for p in log['telemetria']]
+        for generador, cortes in log['cortes'].items():
+            combinado['cortes'][generador] = combinado['cortes'].get(generador, 0) + cortes
+        for clave in ('nodos', 'iteraciones'):
+            if log[clave] is not None:
+                combinado[clave] = (combinado[clave] or 0) + log[clave]
+        for clave in ('estado', 'objetivo', 'cota_final', 'gap_final'):
+            combinado[clave] = log[clave]
+    return combinado
+
+def guardar_telemetria(log, carpeta, nombre):
+    '''
+    Guarda la telemetría de una corrida (resumen de leer_log_cbc o de
+    combinar_logs_cbc) en la carpeta, junto a hora_finalizacion_<nombre>.txt:
+        telemetria_<nombre>.csv: serie de tiempo (segundos, incumbente,
+            cota, gap, nodos, en_arbol, cortes);
+        telemetria_<nombre>.json: estado final, resumen, cortes por
+            generador y la misma serie de tiempo.
+    Retorna las rutas (csv, json).
+    '''
+    import os
+    import csv
+    import json
+
+    os.makedirs(carpeta, exist_ok=True)
+    ruta_csv = os.path.join(carpeta, f'telemetria_{nombre}.csv')
+    with open(ruta_csv, 'w', newline='') as f:
+        escritor = csv.DictWriter(f, fieldnames=['segundos', 'incumbente', 'cota', 'gap', 'nodos', 'en_arbol', 'cortes'])
+        escritor.writeheader()
+        escritor.writerows(log['telemetria'])
+
+    ruta_json = os.path.join(carpeta, f'telemetria_{nombre}.json')
+    with open(ruta_json, 'w') as f:
+        json.dump({clave: valor for clave, valor in log.items() if clave != 'curva'}, f, indent=2)
+    return ruta_csv, ruta_json
+
+def solucion_entera(resultado):
+    '''
+    True si el resultado de solver.solve (con load_solutions=False) trae una
+    solución entera que se puede cargar: óptima, factible o el incumbente al
+    llegar al límite de tiempo. Cuando CBC se detiene sin solución entera
+    ("no integer solution - continuous used") Pyomo igual guarda los valores
+    fraccionarios del LP, que no deben cargarse.
+    '''
+    from pyomo.opt import SolutionStatus, TerminationCondition
+
+    if len(resultado.solution) == 0:
+        return False
+    if resultado.solver.termination_condition in (TerminationCondition.intermediateNonInteger, TerminationCondition.infeasible,
+                                                  TerminationCondition.unbounded, TerminationCondition.solverFailure):
+        return False
+    return resultado.solution(0).status in (SolutionStatus.optimal, SolutionStatus.feasible,
+                                            SolutionStatus.bestSoFar, SolutionStatus.stoppedByLimit)
+
+def agoto_tiempo(resultado):
+    '''
+    True si el solver se detuvo por el límite de tiempo, con o sin solución
+    entera. resultado puede ser el de solver.solve (CBC), el de
+    SesionSolver.resolver (APPSI) o el resumen de carrera_solvers.
+    '''
+    from pyomo.opt import SolverResults, TerminationCondition
+
+    # SolverResults también es un dict: se revisa antes que el resumen de la carrera
+    if isinstance(resultado, SolverResults):
+        # CBC sin solución entera al límite de tiempo termina en intermediateNonInteger
+        return resultado.solver.termination_condition in (TerminationCondition.maxTimeLimit, TerminationCondition.intermediateNonInteger)
+    if isinstance(resultado, dict):
+        return any((c['resultado'] or '').startswith('Stopped on time') for c in resultado['configuraciones'].values())
+    from pyomo.contrib.appsi.base import TerminationCondition as CondicionAppsi
+    return resultado.termination_condition == CondicionAppsi.maxTimeLimit
+
+def usar_respaldo_heuristico(model, inst, epsilon=None):
+    '''
+    Carga en el modelo la programación de la heurística constructiva, para
+    cuando el solver agota el tiempo límite sin una solución entera.
+    epsilon: float
+        Si se entrega, la programación debe cumplir la epsilon restriccion.
+    Lanza RuntimeError si la heurística deja asistencias sin escritorio o no
+    cumple epsilon, porque no sería una programación factible.
+    '''
+    from Funciones_heuristica import heuristica_constructiva
+
+    asignacion = heuristica_constructiva(inst, imprimir=True)
+    if asignacion['sin_escritorio']:
+        raise RuntimeError(f"Sin solución entera del solver y la heurística deja {len(asignacion['sin_escritorio'])} asistencias sin escritorio")
+    if epsilon is not None and not cumple_epsilon(inst, asignacion, epsilon):
+        raise RuntimeError(f'Sin solución entera del solver y la heurística no cumple epsilon = {epsilon:.0f}')
+    print('El solver no encontró una solución entera en el tiempo límite: se usa la heurística constructiva')
+    cargar_asignacion(model, inst, asignacion)
+
+class SesionSolver:
+    '''
+    Sesión de solver persistente en memoria (Pyomo APPSI con HiGHS). El modelo
+    se carga en el solver en la primera llamada a resolver y en las siguientes
+    solo se envían los cambios: valores de parámetros mutables (por ejemplo el
+    lado derecho de la epsilon restriccion), bloques activados o desactivados
+    (cambio de objetivo) y variables fijadas o liberadas. No se escriben
+    archivos LP ni se lanza un proceso externo por cada solución.
+    tiempo_limite: float
+        Límite de tiempo por llamada en segundos.
+    tolerancia: float
+        Gap relativo de optimalidad.
+    mostrar_log: bool
+        Si es True, muestra el log del solver.
+    '''
+    def __init__(self, tiempo_limite, tolerancia=0.01, mostrar_log=True):
+        from pyomo.contrib.appsi.solvers import Highs
+
+        self.solver = Highs()
+        self.solver.config.time_limit = tiempo_limite
+        self.solver.config.mip_gap = tolerancia
+        self.solver.config.stream_solver = mostrar_log
+        self.solver.config.load_solution = False
+        self.model = None
+        self.log = None
+
+    def resolver(self, model, tiempo_limite=None, ruta_log=None):
+        '''
+        Resuelve el modelo y carga la mejor solución encontrada en sus
+        variables. Si model es el mismo de la llamada anterior, solo se
+        actualizan los cambios. Retorna los resultados de APPSI
+        (termination_condition, best_feasible_objective, best_objective_bound).
+        ruta_log: str
+            Si se entrega, HiGHS escribe su log en ese archivo y su resumen
+            (ver leer_log_highs) queda en self.log para guardar_telemetria.
+        '''
+        if tiempo_limite is not None:
+            self.solver.config.time_limit = tiempo_limite
+        if model is not self.model:
+            self.solver.set_instance(model)
+            self.model = model
+        # HiGHS mantiene el archivo de log entre llamadas: se cierra si no se pide
+        self.solver.highs_options['log_file'] = ruta_log if ruta_log is not None else ''
+        resultado = self.solver.solve(model)
+        self.log = leer_log_highs(ruta_log) if ruta_log is not None else None
+        if resultado.best_feasible_objective is not None:
+            resultado.solution_loader.load_vars()
+        return resultado
+
+def resolver_modelo_F2(instance, tiempo_limite, tolerancia=0.01, solver_path ='Optimizer\\Cbc-releases.2.10.12-windows-2022-msvs-v17-Release-x64\\bin\\cbc.exe', model=None, sesion=None, asignacion=None, carrera=None, carpeta_telemetria=None):
+    '''
+    Resuelve el modelo que optimiza los intereses de los colaboradores.
+    Retorna las preferencias satisfechas, el porcentaje de coincidencia, el
+    modelo construido, que puede reutilizarse en resolver_modelo_F1, y la
+    asignación de X, Y y Z (ver extraer_asignacion) para iniciar F1.
+    sesion: SesionSolver
+        Si se entrega, se resuelve en la sesión persistente en lugar de CBC.
+    asignacion: dict
+        Solución inicial para CBC (por ejemplo, la de heuristica_constructiva).
+    carrera: dict, list o int
+        Si se entrega, resuelve en modo carrera con varias configuraciones
+        de CBC en paralelo (ver carrera_solvers en Funciones_portafolio).
+    carpeta_telemetria: str
+        Si se entrega, guarda la telemetría del log de CBC en
+        telemetria_<instance>_F2.csv/.json (ver guardar_telemetria).
+    Si el solver no encuentra una solución entera en el tiempo límite, se
+    usa la heurística constructiva (ver usar_respaldo_heuristico); si
+    termina sin solución por otra causa, lanza RuntimeError.
+    '''
+    import os
+    import tempfile
+    from Funciones import importar_data
+    # Desde pyomo.environ para que el plugin de CBC quede registrado
+    from pyomo.environ import SolverFactory
+
+    solver = SolverFactory('cbc', executable=solver_path)
+    instancia = os.path.join('instances', f'{instance}.json')
+
+    inst = importar_data(instancia, imprimir=False)
+    E, D, T, G, Z, dz, dr, e_g, di, max, min = inst
+
+    if model is None:
+        model = construir_modelo(inst, nombre='Colaboradores')
+    retirar_bloque(model, 'F1')
+    retirar_bloque(model, 'epsilon')
+    agregar_F2(model, inst)
+
+    if asignacion is not None:
+        cargar_asignacion(model, inst, asignacion)
+
+    if sesion is not None:
+        resultado = sesion.resolver(model, tiempo_limite=tiempo_limite)
+        solucion = resultado.best_feasible_objective is not None
+    elif carrera is not None:
+        from Funciones_portafolio import carrera_solvers
+        resultado = carrera_solvers(model, tiempo_limite, tolerancia, carrera, solver_path, warmstart=asignacion is not None)
+        solucion = resultado['objetivo'] is not None
+    else:
+        solver.options['seconds'] = tiempo_limite
+        solver.options['ratio'] = tolerancia
+
+        descriptor, ruta_log = tempfile.mkstemp(suffix='.log')
+        os.close(descriptor)
+        resultado = solver.solve(model, tee=True, warmstart=asignacion is not None, logfile=ruta_log, load_solutions=False)
+        solucion = solucion_entera(resultado)
+        if solucion:
+            model.solutions.load_from(resultado)
+        if carpeta_telemetria is not None:
+            guardar_telemetria(leer_log_cbc(ruta_log), carpeta_telemetria, f'{instance}_F2')
+        os.remove(ruta_log)
+
+    if not solucion:
+        if not agoto_tiempo(resultado):
+            raise RuntimeError(f'F2 de {instance} terminó sin solución entera antes del límite de tiempo (infactible o interrumpido)')
+        usar_respaldo_heuristico(model, inst)
 
-    def epsilon_restriccion(model):
-        return sum(model.X[e,d,t,z] * int(t in di[e]) for e in E for d in D for t in T for z in Z) >= epsilon
-    model.epsilon_restriccion = Constraint(rule=epsilon_restriccion)
+    total_presencialidad = 0 # Asignaciones totales de presencialidad
+    preferencias_satisfechas = 0 # Maximo preferencias satisfechas
 
-    # Establecer límite de tiempo en segundos
-    solver.options['seconds'] = tiempo_limite
+    for e in E:
+        for t in T:
+            if model.Y[e, t].value == 1:
+                total_presencialidad += 1
+                if inst.prefiere(e, t):  # Si el día asignado está dentro de sus días preferidos
+                    preferencias_satisfechas += 1
 
-    # Establecer tolerancia de optimalidad
-    solver.options['ratio'] = tolerancia
-    # Criterios de parada: tiempo máximo (en segundos) y tolerancia de optimalidad
-    solver.solve(
-        model,
-        tee=True,  # Muestra el log del solver
-    )
+    # Porcentaje de coincidencia
+    if total_presencialidad > 0:
+        porcentaje = 100 * preferencias_satisfechas / total_presencialidad
+    else:
+        porcentaje = 0
+
+    return preferencias_satisfechas, porcentaje, model, extraer_asignacion(model)
+
+def resolver_modelo_F1(instance, satisfaccion_deseada, porcentaje, preferencias_satisfechas, tiempo_limite, tolerancia=0.01, solver_path='Optimizer\\Cbc-releases.2.10.12-windows-2022-msvs-v17-Release-x64\\bin\\cbc.exe', model=None, formulacion_fuerte=False, sesion=None, asignacion=None, carrera=None, carpeta_telemetria=None):
+    '''
+    Resuelve el modelo que optimiza los intereses de la Universidad con epsilon restriccion de
+    satisfaccion de los colaboradores.
+    Si se entrega el modelo ya construido por resolver_modelo_F2, se retira el
+    bloque F2 y se agregan los bloques F1 y epsilon sobre el mismo núcleo.
+    formulacion_fuerte: bool
+        Si es True, usa la formulación fuerte de F1 (ver agregar_F1).
+    sesion: SesionSolver
+        Si se entrega, se resuelve en la sesión persistente en lugar de CBC;
+        con el mismo modelo de F2 solo se envían al solver los bloques nuevos.
+    asignacion: dict
+        Asignación de X, Y y Z retornada por resolver_modelo_F2. Se completa
+        con P, J y penalizaciones consistentes y se entrega a CBC como
+        solución inicial (MIP start). La solución de F2 solo cumple la
+        epsilon restriccion si satisfaccion_deseada <= porcentaje/100 (y el
+        redondeo de epsilon puede exigir una preferencia más): si no la
+        cumple, se descarta y F1 parte sin solución inicial.
+    carrera: dict, list o int
+        Si se entrega, resuelve en modo carrera con varias configuraciones
+        de CBC en paralelo (ver carrera_solvers en Funciones_portafolio).
+    carpeta_telemetria: str
+        Si se entrega, guarda la telemetría del log de CBC en
+        telemetria_<instance>_F1.csv/.json (ver guardar_telemetria).
+    Si el solver no encuentra una solución entera en el tiempo límite, se
+    usa la heurística constructiva si cumple epsilon (ver
+    usar_respaldo_heuristico); si termina sin solución por otra causa, lanza
+    RuntimeError.
+    '''
+    import os
+    import tempfile
+    import time
+    from Funciones import importar_data, programacion
+    # Desde pyomo.environ para que el plugin de CBC quede registrado
+    from pyomo.environ import SolverFactory
+
+    # Calculo del epsilon
+    epsilon = round((preferencias_satisfechas / (porcentaje/100)) * satisfaccion_deseada, 0)
+
+    # Configuracion de solver
+    solver = SolverFactory('cbc', executable=solver_path)
+    instancia = os.path.join('instances', f'{instance}.json')
+
+    # Llamar a la función para importar datos
+    inst = importar_data(instancia, imprimir=False)
+    E, D, T, G, Z, dz, dr, e_g, di, max, min = inst
+
+    if model is None:
+        model = construir_modelo(inst, nombre='Universidad')
+    retirar_bloque(model, 'F2')
+    agregar_F1(model, inst, formulacion_fuerte=formulacion_fuerte)
+    agregar_epsilon(model, inst, epsilon)
+
+    if asignacion is not None and not cumple_epsilon(inst, asignacion, epsilon):
+        print(f'La solución de F2 no cumple epsilon = {epsilon:.0f}: F1 se resuelve sin solución inicial')
+        asignacion = None
+    if asignacion is not None:
+        cargar_asignacion(model, inst, asignacion)
+
+    inicio = time.perf_counter()
+    if sesion is not None:
+        resultado = sesion.resolver(model, tiempo_limite=tiempo_limite)
+        solucion = resultado.best_feasible_objective is not None
+        print(f'Tiempo total F1: {time.perf_counter() - inicio:.2f} s')
+    elif carrera is not None:
+        from Funciones_portafolio import carrera_solvers
+        resultado = carrera_solvers(model, tiempo_limite, tolerancia, carrera, solver_path, warmstart=asignacion is not None)
+        solucion = resultado['objetivo'] is not None
+        print(f'Tiempo total F1: {time.perf_counter() - inicio:.2f} s')
+    else:
+        # Establecer límite de tiempo en segundos
+        solver.options['seconds'] = tiempo_limite
+
+        # Establecer tolerancia de optimalidad
+        solver.options['ratio'] = tolerancia
+        # Log de CBC para medir el tiempo hasta la primera solución
+        descriptor, ruta_log = tempfile.mkstemp(suffix='.log')
+        os.close(descriptor)
+        # Criterios de parada: tiempo máximo (en segundos) y tolerancia de optimalidad
+        resultado = solver.solve(
+            model,
+            tee=True,  # Muestra el log del solver
+            warmstart=asignacion is not None,  # Solución inicial a partir de F2
+            logfile=ruta_log,
+            load_solutions=False,
+        )
+        solucion = solucion_entera(resultado)
+        if solucion:
+            model.solutions.load_from(resultado)
+        tiempo_total = time.perf_counter() - inicio
+        log = leer_log_cbc(ruta_log)
+        os.remove(ruta_log)
+        if carpeta_telemetria is not None:
+            guardar_telemetria(log, carpeta_telemetria, f'{instance}_F1')
+
+        if log['mipstart'] is not None:
+            print(f'Solución inicial aceptada por CBC con FO: {log["mipstart"]}')
+        print(f'Tiempo hasta la primera solución: {log["tiempo_primera_solucion"]} s | Tiempo total F1: {tiempo_total:.2f} s | {log["estado"]}')
+
+    if not solucion:
+        if not agoto_tiempo(resultado):
+            raise RuntimeError(f'F1 de {instance} con epsilon = {epsilon:.0f} terminó sin solución entera antes del límite de tiempo (infactible o interrumpido)')
+        usar_respaldo_heuristico(model, inst, epsilon)
 
     df_programacion = programacion(model, E, D, T, Z, e_g)
 
-    return df_programacion
\ No newline at end of file
+    return df_programacion
@@ -0,0 +1,161 @@
+'''
+Frontera de Pareto entre la satisfacción de los colaboradores (F2) y la
+compacidad por zonas de la Universidad (F1) por el método de epsilon
+restriccion.
+
+F2 se resuelve una vez por instancia. Luego se recorre una grilla de niveles
+de satisfacción de mayor a menor: entre un punto y el siguiente solo cambia
+el lado derecho (parámetro mutable) de epsilon_restriccion y cada punto parte
+de la solución del anterior, que es factible porque la restricción se
+relaja. El primer punto de cada tramo parte de la solución de F2 solo si
+cumple su epsilon: epsilon cuenta todas las asistencias de F2 por el nivel,
+pero la restricción cuenta solo las de días preferidos, de modo que los
+niveles altos pueden exigir más de lo que F2 satisface. Los tramos de la
+grilla se pueden repartir entre procesos.
+
+En Windows, el código que llama a frontera_pareto con procesos > 1 debe estar
+dentro de un bloque if __name__ == '__main__' (requisito de multiprocessing).
+'''
+
+SOLVER_PATH = 'Optimizer\\Cbc-releases.2.10.12-windows-2022-msvs-v17-Release-x64\\bin\\cbc.exe'
+
+def resolver_tramo(inst, epsilons, asignacion, tiempo_limite, tolerancia=0.01, solver_path=SOLVER_PATH):
+    '''
+    Resuelve F1 con epsilon restriccion para cada valor de epsilons (en orden
+    decreciente) sobre un mismo modelo, cambiando solo el lado derecho de la
+    restricción y usando la solución del punto anterior como solución
+    inicial (el primero parte de asignacion). Una solución inicial que no
+    cumple la epsilon restriccion del punto no se entrega a CBC.
+
+    Retorna una lista de diccionarios con Epsilon, Preferencias, FO, Cota,
+    Gap y Tiempo por punto.
+    '''
+    import time
+    from pyomo.environ import value
+    from pyomo.opt import SolverFactory
+    from Funciones_modelos import construir_modelo, agregar_F1, agregar_epsilon, extraer_asignacion, cargar_asignacion, solucion_entera, cumple_epsilon
+
+    model = construir_modelo(inst, nombre='Universidad')
+    agregar_F1(model, inst)
+    agregar_epsilon(model, inst, epsilons[0])
+
+    solver = SolverFactory('cbc', executable=solver_path)
+    solver.options['seconds'] = tiempo_limite
+    solver.options['ratio'] = tolerancia
+
+    puntos = []
+    for epsilon in sorted(epsilons, reverse=True):
+        agregar_epsilon(model, inst, epsilon)
+        warmstart = cumple_epsilon(inst, asignacion, epsilon)
+        if warmstart:
+            cargar_asignacion(model, inst, asignacion)
+
+        inicio = time.perf_counter()
+        resultado = solver.solve(model, tee=False, warmstart=warmstart, load_solutions=False)
+        tiempo = time.perf_counter() - inicio
+
+        if solucion_entera(resultado):
+            model.solutions.load_from(resultado)
+            asignacion = extraer_asignacion(model)
+            fo = value(model.F1.distribucion_rule)
+            cota = resultado.problem.lower_bound
+            gap = (fo - cota) / fo if fo and cota is not None else 0
+            preferencias = sum(1 for (e, t) in asignacion['Y'] if inst.prefiere(e, t))
+        else:
+            fo, cota, gap, preferencias = None, None, None, None
+
+        puntos.append({
+            'Epsilon': epsilon,
+            'Preferencias': preferencias,
+            'FO': fo,
+            'Cota': cota,
+            'Gap': gap,
+            'Tiempo': round(tiempo, 2),
+        })
+        print(f'Epsilon {epsilon}: FO = {fo} | gap = {gap} | {tiempo:.2f} s')
+
+    return puntos
+
+def marcar_pareto(df):
+    '''
+    Agrega la columna Pareto: True si ningún otro punto tiene al menos las
+    mismas preferencias satisfechas con menor FO (o más preferencias con la
+    misma FO).
+    '''
+    validos = df.dropna(subset=['FO', 'Preferencias'])
+    pareto = []
+    for i, fila in df.iterrows():
+        if i not in validos.index:
+            pareto.append(False)
+            continue
+        dominado = (
+            (validos['Preferencias'] >= fila['Preferencias']) & (validos['FO'] <= fila['FO']) &
+            ((validos['Preferencias'] > fila['Preferencias']) | (validos['FO'] < fila['FO']))
+        ).any()
+        pareto.append(not dominado)
+    df['Pareto'] = pareto
+    return df
+
+def frontera_pareto(instancia, niveles, tiempo_F2, tiempo_punto, tolerancia=0.01, procesos=1, solver_path=SOLVER_PATH):
+    '''
+    Calcula la tabla de Pareto de una instancia.
+    instancia: str
+        Nombre de la instancia (archivo instances/<nombre>.json).
+    niveles: list
+        Niveles de satisfacción deseada (como satisfaccion_deseada en
+        Despliegue_epsilon): epsilon = asistencias de F2 x nivel.
+    tiempo_F2: float
+        Límite de tiempo de F2 en segundos.
+    tiempo_punto: float
+        Límite de tiempo de cada punto de la frontera en segundos.
+    procesos: int
+        Cantidad de procesos; la grilla se divide en tramos contiguos y
+        cada tramo parte de la solución de F2.
+
+    Retorna un DataFrame con Instancia, Nivel, Epsilon, Preferencias, FO,
+    Cota, Gap, Tiempo y Pareto, ordenado de mayor a menor epsilon.
+    '''
+    import os
+    import pandas as pd
+    from pyomo.opt import SolverFactory
+    from Funciones import importar_data
+    from Funciones_modelos import construir_modelo, agregar_F2, extraer_asignacion, solucion_entera
+    from Funciones_heuristica import heuristica_constructiva
+
+    inst = importar_data(os.path.join('instances', f'{instancia}.json'), imprimir=False)
+
+    # F2 una sola vez: define las asistencias de la grilla y la solución
+    # inicial de cada tramo (si cumple su epsilon, ver resolver_tramo)
+    model = construir_modelo(inst, nombre='Colaboradores')
+    agregar_F2(model, inst)
+    solver = SolverFactory('cbc', executable=solver_path)
+    solver.options['seconds'] = tiempo_F2
+    solver.options['ratio'] = tolerancia
+    resultado = solver.solve(model, tee=False, load_solutions=False)
+    if solucion_entera(resultado):
+        model.solutions.load_from(resultado)
+        asignacion = extraer_asignacion(model)
+    else:
+        print(f'{instancia}: F2 sin solución entera en {tiempo_F2} s, se usa la heurística constructiva')
+        asignacion = heuristica_constructiva(inst, imprimir=True)
+    del model
+
+    total_presencialidad = len(asignacion['Y'])
+    nivel_epsilon = {round(total_presencialidad * nivel, 0): nivel for nivel in niveles}
+    epsilons = sorted(nivel_epsilon, reverse=True)
+
+    if procesos <= 1:
+        puntos = resolver_tramo(inst, epsilons, asignacion, tiempo_punto, tolerancia, solver_path)
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+
+        tamano = -(-len(epsilons) // procesos)
+        tramos = [epsilons[i:i + tamano] for i in range(0, len(epsilons), tamano)]
+        with ProcessPoolExecutor(max_workers=len(tramos)) as pool:
+            futuros = [pool.submit(resolver_tramo, inst, tramo, asignacion, tiempo_punto, tolerancia, solver_path) for tramo in tramos]
+            puntos = [punto for futuro in futuros for punto in futuro.result()]
+
+    df_pareto = pd.DataFrame(puntos)
+    df_pareto.insert(0, 'Instancia', instancia)
+    df_pareto.insert(1, 'Nivel', df_pareto['Epsilon'].map(nivel_epsilon))
+    return marcar_pareto(df_pareto)
@@ -0,0 +1,287 @@
+'''
+Modo carrera (portafolio de solvers): el mismo modelo se escribe una vez en
+formato LP y se resuelve en paralelo con varios procesos de CBC configurados
+de forma distinta (semillas, cortes, heurísticas). Se sigue el mejor
+incumbente de cada proceso; cuando uno demuestra el gap objetivo (ratio) se
+detienen los demás. La configuración ganadora se registra para elegir
+valores por defecto por tipo de instancia.
+'''
+
+SOLVER_PATH = 'Optimizer\\Cbc-releases.2.10.12-windows-2022-msvs-v17-Release-x64\\bin\\cbc.exe'
+
+# Portafolio por defecto: nombre -> opciones de línea de comandos de CBC
+CONFIGURACIONES = {
+    'base': {},
+    'semilla_2': {'randomSeed': 2, 'randomCbcSeed': 2},
+    'semilla_3': {'randomSeed': 3, 'randomCbcSeed': 3},
+    'cortes_raiz': {'cuts': 'root'},
+    'cortes_fuertes': {'cuts': 'forceOn', 'gomoryCuts': 'ifmove', 'cliqueCuts': 'forceOn'},
+    'sin_heuristicas': {'heuristicsOnOff': 'off'},
+    'factibilidad': {'feasibilityPump': 'on', 'proximitySearch': 'on', 'RINS': 'on'},
+    'profundidad': {'nodeStrategy': 'depth', 'strategy': 2},
+}
+
+def _leer_salida(proceso, nombre, estado):
+    '''
+    Lee la salida de un proceso de CBC (en un hilo) y actualiza en estado su
+    mejor incumbente y el resultado final.
+    '''
+    import re
+
+    for linea in proceso.stdout:
+        incumbente = re.search(r'(Cbc0012I|Cbc0004I) Integer solution of (-?[\d.eE+-]+)', linea) or \
+            re.search(r'(Cbc0045I) MIPStart provided solution with cost (-?[\d.eE+-]+)', linea)
+        if incumbente:
+            estado[nombre]['incumbentes'].append(float(incumbente.group(2)))
+        elif linea.startswith('Result - '):
+            estado[nombre]['resultado'] = linea[len('Result - '):].strip()
+
+def _leer_solucion(ruta, model, simbolos):
+    '''
+    Carga en las variables del modelo la solución de CBC escrita con -solu.
+    Retorna False si el archivo no existe o no tiene solución entera.
+    '''
+    import os
+
+    if not os.path.exists(ruta):
+        return False
+    with open(ruta, 'r') as f:
+        encabezado = f.readline()
+        if 'Infeasible' in encabezado or 'infeasible' in encabezado or 'no integer' in encabezado.lower():
+            return False
+        valores = {}
+        for linea in f:
+            partes = linea.replace('**', ' ').split()
+            if len(partes) >= 3:
+                valores[partes[1]] = float(partes[2])
+    for nombre, var in simbolos.items():
+        if not var.fixed:
+            var.set_value(round(valores.get(nombre, 0)))
+    return True
+
+def _escribir_inicio(ruta, simbolos):
+    '''
+    Escribe la solución inicial (MIP start) de CBC con los valores actuales
+    de las variables enteras del modelo, en el formato de -mipstart: una
+    línea "índice nombre valor" por variable no nula (CBC ignora el índice).
+    Retorna la cantidad de variables escritas.
+    '''
+    escritas = 0
+    with open(ruta, 'w') as f:
+        for nombre, var in simbolos.items():
+            if var.value and (var.is_integer() or var.is_binary()):
+                f.write(f'{escritas} {nombre} {var.value}\n')
+                escritas += 1
+    return escritas
+
+def _escribir_lp(model, carpeta, warmstart=False):
+    '''
+    Escribe el modelo en <carpeta>/modelo.lp con nombres simbólicos y, con
+    warmstart, la solución inicial en <carpeta>/inicio.soln (ver
+    _escribir_inicio). Retorna la ruta del LP, el diccionario nombre ->
+    variable y la ruta de la solución inicial (None sin warmstart).
+    '''
+    import os
+
+    ruta_lp = os.path.join(carpeta, 'modelo.lp')
+    _, simbolos_id = model.write(ruta_lp, format='lp', io_options={'symbolic_solver_labels': True})
+    simbolo_var = model.solutions.symbol_map[simbolos_id].bySymbol
+    simbolos = {nombre: var for nombre, var in simbolo_var.items() if hasattr(var, 'fixed')}
+    ruta_inicio = None
+    if warmstart:
+        ruta_inicio = os.path.join(carpeta, 'inicio.soln')
+        _escribir_inicio(ruta_inicio, simbolos)
+    return ruta_lp, simbolos, ruta_inicio
+
+def _copiar_salida(comando, log):
+    '''
+    Corre el comando y copia su salida en el archivo log (binario) a medida
+    que se produce. CBC acumula su salida en bloques cuando no escribe a una
+    terminal, por lo que en POSIX corre en una pseudoterminal para que cada
+    línea llegue al log apenas se imprime; en otros sistemas se lee de una
+    tubería y el log avanza por bloques.
+    '''
+    import os
+    import subprocess
+
+    if os.name != 'posix':
+        proceso = subprocess.Popen(comando, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+        for linea in proceso.stdout:
+            log.write(linea)
+            log.flush()
+        return proceso.wait()
+
+    import pty
+
+    maestro, esclavo = pty.openpty()
+    proceso = subprocess.Popen(comando, stdin=subprocess.DEVNULL, stdout=esclavo, stderr=esclavo)
+    os.close(esclavo)
+    try:
+        while True:
+            try:
+                datos = os.read(maestro, 4096)
+            except OSError: # EIO: el proceso cerró la terminal
+                break
+            if not datos:
+                break
+            log.write(datos.replace(b'\r', b''))
+            log.flush()
+    finally:
+        os.close(maestro)
+    return proceso.wait()
+
+def resolver_cbc(model, tiempo_limite, tolerancia=0.01, ruta_log=None, solver_path=SOLVER_PATH, warmstart=False, opciones=None):
+    '''
+    Resuelve el modelo con un proceso de CBC cuya salida se escribe en
+    ruta_log mientras corre, de modo que otro proceso puede leer el progreso
+    (incumbente, cota, gap) con leer_log_cbc antes de que CBC termine. El
+    plugin de Pyomo, en cambio, escribe el log solo al final.
+    opciones: dict
+        Opciones adicionales de línea de comandos de CBC.
+
+    Retorna True si se cargó en el modelo una solución entera.
+    '''
+    import os
+    import shutil
+    import tempfile
+
+    carpeta = tempfile.mkdtemp(prefix='cbc_')
+    ruta_lp, simbolos, ruta_inicio = _escribir_lp(model, carpeta, warmstart)
+    ruta_solucion = os.path.join(carpeta, 'modelo.sol')
+
+    comando = [solver_path, ruta_lp, '-sec', str(tiempo_limite), '-ratio', str(tolerancia)]
+    for opcion, valor in (opciones or {}).items():
+        comando += [f'-{opcion}', str(valor)]
+    if ruta_inicio is not None:
+        comando += ['-mipstart', ruta_inicio]
+    comando += ['-solve', '-solu', ruta_solucion]
+
+    with open(ruta_log or os.devnull, 'wb') as log:
+        _copiar_salida(comando, log)
+    solucion = _leer_solucion(ruta_solucion, model, simbolos)
+    shutil.rmtree(carpeta, ignore_errors=True)
+    return solucion
+
+def carrera_solvers(model, tiempo_limite, tolerancia=0.01, configuraciones=None, solver_path=SOLVER_PATH, registro=None, imprimir=True, warmstart=False):
+    '''
+    Resuelve el modelo (con sus bloques activos) con varios procesos de CBC
+    en paralelo y carga en el modelo la mejor solución encontrada.
+    configuraciones: dict, list o int
+        Configuraciones a correr: diccionario nombre -> opciones de CBC,
+        lista de nombres de CONFIGURACIONES o cantidad de configuraciones
+        (las primeras del portafolio). Por defecto, todo el portafolio.
+    registro: str
+        Ruta de un CSV al que se agrega una fila por carrera (modelo,
+        ganador, objetivo, tiempo, mejor incumbente de cada configuración).
+    warmstart: bool
+        Si es True, los valores actuales de las variables (por ejemplo, los
+        de cargar_asignacion) se entregan a cada proceso como solución
+        inicial (-mipstart).
+
+    Retorna un diccionario con 'ganador' (configuración que demostró el gap
+    o, si ninguna lo hizo, la de mejor solución), 'gap_demostrado', 'objetivo',
+    'tiempo' y 'configuraciones' (incumbentes y resultado de cada una).
+    '''
+    import os
+    import csv
+    import time
+    import shutil
+    import tempfile
+    import threading
+    import subprocess
+    from pyomo.environ import value, maximize, Objective
+
+    if configuraciones is None:
+        configuraciones = CONFIGURACIONES
+    elif isinstance(configuraciones, int):
+        configuraciones = dict(list(CONFIGURACIONES.items())[:configuraciones])
+    elif isinstance(configuraciones, list):
+        configuraciones = {nombre: CONFIGURACIONES[nombre] for nombre in configuraciones}
+
+    objetivo = next(model.component_data_objects(Objective, active=True))
+    maximizar = objetivo.sense == maximize
+
+    carpeta = tempfile.mkdtemp(prefix='carrera_')
+    ruta_lp, simbolos, ruta_inicio = _escribir_lp(model, carpeta, warmstart)
+
+    inicio = time.perf_counter()
+    procesos = {}
+    lectores = {}
+    estado = {}
+    for nombre, opciones in configuraciones.items():
+        comando = [solver_path, ruta_lp, '-sec', str(tiempo_limite), '-ratio', str(tolerancia)]
+        for opcion, valor in opciones.items():
+            comando += [f'-{opcion}', str(valor)]
+        if ruta_inicio is not None:
+            comando += ['-mipstart', ruta_inicio]
+        comando += ['-solve', '-solu', os.path.join(carpeta, f'{nombre}.sol')]
+
+        estado[nombre] = {'incumbentes': [], 'resultado': None}
+        procesos[nombre] = subprocess.Popen(comando, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+        lectores[nombre] = threading.Thread(target=_leer_salida, args=(procesos[nombre], nombre, estado), daemon=True)
+        lectores[nombre].start()
+
+    # Esperar a que uno demuestre el gap (termina con solución óptima dentro
+    # de la tolerancia) o a que todos terminen
+    ganador = None
+    while ganador is None and any(p.poll() is None for p in procesos.values()):
+        time.sleep(0.5)
+        for nombre, proceso in procesos.items():
+            if proceso.poll() is not None and ganador is None:
+                lectores[nombre].join()
+                if estado[nombre]['resultado'] and estado[nombre]['resultado'].startswith('Optimal'):
+                    ganador = nombre
+    for nombre, proceso in procesos.items():
+        if proceso.poll() is None:
+            proceso.terminate()
+    for proceso in procesos.values():
+        proceso.wait()
+    for lector in lectores.values():
+        lector.join()
+    tiempo = time.perf_counter() - inicio
+
+    # Un proceso que terminó entre la última revisión y la condición del
+    # while no alcanzó a revisarse: con todas las salidas leídas se revisan de nuevo
+    if ganador is None:
+        ganador = next((nombre for nombre in configuraciones
+                        if estado[nombre]['resultado'] and estado[nombre]['resultado'].startswith('Optimal')), None)
+
+    # Mejor solución: la del ganador o, si ninguno demostró el gap, la mejor de todas
+    candidatos = [ganador] if ganador is not None else list(configuraciones)
+    mejor, mejor_valor, cargada = None, None, None
+    for nombre in candidatos:
+        if _leer_solucion(os.path.join(carpeta, f'{nombre}.sol'), model, simbolos):
+            cargada = nombre
+            valor = value(objetivo)
+            if mejor is None or (valor > mejor_valor if maximizar else valor < mejor_valor):
+                mejor, mejor_valor = nombre, valor
+    if mejor is not None and mejor != cargada:
+        _leer_solucion(os.path.join(carpeta, f'{mejor}.sol'), model, simbolos)
+    shutil.rmtree(carpeta, ignore_errors=True)
+
+    resumen = {
+        'ganador': mejor,
+        'gap_demostrado': ganador is not None,
+        'objetivo': mejor_valor,
+        'tiempo': round(tiempo, 2),
+        'configuraciones': estado,
+    }
+    if imprimir:
+        print(f'Carrera: ganador {mejor} | objetivo {mejor_valor} | gap demostrado: {ganador is not None} | {tiempo:.2f} s')
+        for nombre in configuraciones:
+            incumbentes = estado[nombre]['incumbentes']
+            print(f'  {nombre}: {len(incumbentes)} incumbentes | {estado[nombre]["resultado"]}')
+
+    if registro is not None:
+        nuevo = not os.path.exists(registro)
+        with open(registro, 'a', newline='') as f:
+            escritor = csv.writer(f)
+            if nuevo:
+                escritor.writerow(['Modelo', 'Ganador', 'Gap_demostrado', 'Objetivo', 'Tiempo'] + list(configuraciones))
+            mejores = []
+            for nombre in configuraciones:
+                incumbentes = estado[nombre]['incumbentes']
+                mejores.append((max(incumbentes) if maximizar else min(incumbentes)) if incumbentes else None)
+            escritor.writerow([model.name, mejor, ganador is not None, mejor_valor, round(tiempo, 2)] + mejores)
+
+    return resumen
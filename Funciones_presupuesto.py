@@ -0,0 +1,232 @@
+'''
+Presupuesto adaptativo de tiempo a partir del historial de corridas.
+
+Cada corrida registra en un historial (JSON, una corrida por línea) la
+variante del modelo (F1, F2 o epsilon), las características de la instancia
+(|E|, |D|, |Z|, |G| y densidad de escritorios permitidos) y la curva gap vs
+tiempo leída del log de CBC. Con ese historial se ajusta, por variante, un
+predictor log-lineal del tiempo necesario para alcanzar un gap objetivo y se
+proponen límites de tiempo por instancia que respetan un presupuesto total
+del lote.
+'''
+
+def caracteristicas_instancia(inst):
+    '''
+    Características de la instancia usadas por el predictor.
+    densidad: fracción promedio de escritorios permitidos por colaborador.
+    '''
+    E, D, Z, G = len(inst.E), len(inst.D), len(inst.Z), len(inst.G)
+    return {
+        'E': E,
+        'D': D,
+        'Z': Z,
+        'G': G,
+        'densidad': sum(len(inst.dr[e]) for e in inst.E) / (E * D) if E and D else 0,
+    }
+
+def curva_gap(curva, tiempo_inicial=0):
+    '''
+    Convierte la curva (segundos, incumbente, cota) de leer_log_cbc en una
+    lista de (segundos, gap), desplazada en tiempo_inicial segundos. Omite los
+    puntos sin incumbente.
+    '''
+    puntos = []
+    for segundos, incumbente, cota in curva:
+        if abs(incumbente) >= 1e49:
+            continue
+        puntos.append((tiempo_inicial + segundos, abs(incumbente - cota) / max(abs(incumbente), abs(cota), 1e-9)))
+    return puntos
+
+def tiempo_para_gap(curva, gap_objetivo):
+    '''
+    Primer tiempo de la curva (segundos, gap) con gap <= gap_objetivo, o None.
+    '''
+    for segundos, gap in curva:
+        if gap <= gap_objetivo:
+            return segundos
+    return None
+
+def registrar_corrida(historial, instancia, variante, caracteristicas, curva, tiempo_limite, gap_final, tiempo_total):
+    '''
+    Agrega una corrida al historial (JSON, una corrida por línea).
+    variante: str
+        Variante del modelo resuelto: 'F1', 'F2' o 'epsilon'.
+    curva: list
+        Puntos (segundos, gap) de la corrida (ver curva_gap).
+    '''
+    import os
+    import json
+
+    if gap_final is not None:
+        curva = list(curva) + [(tiempo_total, gap_final)]
+    corrida = {
+        'instancia': instancia,
+        'variante': variante,
+        'caracteristicas': caracteristicas,
+        'curva': curva,
+        'tiempo_limite': tiempo_limite,
+        'gap_final': gap_final,
+        'tiempo_total': tiempo_total,
+    }
+    carpeta = os.path.dirname(historial)
+    if carpeta:
+        os.makedirs(carpeta, exist_ok=True)
+    with open(historial, 'a') as f:
+        f.write(json.dumps(corrida) + '\n')
+
+def leer_historial(historial):
+    '''
+    Lee el historial de corridas. Retorna una lista vacía si no existe.
+    '''
+    import os
+    import json
+
+    if not os.path.exists(historial):
+        return []
+    with open(historial, 'r') as f:
+        return [json.loads(linea) for linea in f if linea.strip()]
+
+def _vector(caracteristicas):
+    '''Variables del predictor: 1, log(E x D x Z), log(G + 1) y densidad.'''
+    import math
+
+    c = caracteristicas
+    return [1.0, math.log(max(c['E'] * c['D'] * c['Z'], 1)), math.log(c['G'] + 1), c['densidad']]
+
+class PredictorTiempo:
+    '''
+    Predictor log-lineal del tiempo (segundos) para que una variante del
+    modelo alcance gap_objetivo:
+        log(t) = w0 + w1 log(E x D x Z) + w2 log(G + 1) + w3 densidad
+    ajustado por mínimos cuadrados con las corridas de esa variante en el
+    historial. F1, F2 y epsilon resuelven modelos distintos, por lo que cada
+    una tiene su propio ajuste.
+
+    Las corridas que no alcanzaron el gap están censuradas: solo se sabe que
+    el tiempo real supera su tiempo total. No entran al ajuste; se guardan
+    como cota inferior del tiempo de su instancia (ver predecir). Con menos
+    corridas que variables se usa un modelo proporcional al tamaño E x D x Z
+    ajustado con el promedio.
+    '''
+    __slots__ = ('gap_objetivo', 'variante', 'pesos', 'censuradas')
+
+    def __init__(self, gap_objetivo=0.01, variante='F1'):
+        self.gap_objetivo = gap_objetivo
+        self.variante = variante
+        self.pesos = None
+        self.censuradas = {}
+
+    def ajustar(self, corridas):
+        import math
+        import numpy as np
+
+        filas, tiempos = [], []
+        self.censuradas = {}
+        for corrida in corridas:
+            instancia = corrida['instancia']
+            if corrida['variante'] != self.variante:
+                continue
+            tiempo = tiempo_para_gap([tuple(p) for p in corrida['curva']], self.gap_objetivo)
+            if tiempo is None:
+                self.censuradas[instancia] = max(self.censuradas.get(instancia, 0), corrida['tiempo_total'])
+                continue
+            filas.append(_vector(corrida['caracteristicas']))
+            tiempos.append(math.log(max(tiempo, 1.0)))
+        if not filas:
+            self.pesos = None
+            return self
+
+        A = np.array(filas)
+        b = np.array(tiempos)
+        if len(filas) >= A.shape[1]:
+            self.pesos = np.linalg.lstsq(A, b, rcond=None)[0]
+        else:
+            # t proporcional a E x D x Z: solo se ajusta el intercepto
+            intercepto = float(np.mean(b - A[:, 1]))
+            self.pesos = np.array([intercepto, 1.0, 0.0, 0.0])
+        return self
+
+    def predecir(self, caracteristicas, instancia=None):
+        '''
+        Tiempo predicho para las características. Si la instancia tiene
+        corridas censuradas de la variante, el tiempo es al menos el mayor de
+        sus tiempos totales. Retorna None sin corridas con qué predecir.
+        '''
+        import math
+
+        cota = self.censuradas.get(instancia)
+        if self.pesos is None:
+            return cota
+        prediccion = math.exp(float(sum(w * x for w, x in zip(self.pesos, _vector(caracteristicas)))))
+        return prediccion if cota is None else max(prediccion, cota)
+
+def repartir_presupuesto(presupuesto_total, variantes):
+    '''
+    Reparte presupuesto_total (segundos) entre las variantes que se van a
+    correr, para que la suma de los límites de todas no lo supere. La
+    variante epsilon resuelve dos modelos (F2 y F1) y recibe el doble.
+
+    Retorna el diccionario variante -> presupuesto en segundos.
+    '''
+    pesos = {variante: 2 if variante == 'epsilon' else 1 for variante in variantes}
+    total = sum(pesos.values())
+    return {variante: presupuesto_total * peso / total for variante, peso in pesos.items()}
+
+def proponer_tiempos(caracteristicas, historial, presupuesto_total, gap_objetivo=0.01, variante='F1', margen=1.5, minimo=60, maximo=None, defecto=3600):
+    '''
+    Propone el límite de tiempo de cada instancia para que la variante
+    alcance gap_objetivo sin superar presupuesto_total (suma de los límites,
+    en segundos):
+        - el tiempo de cada instancia es el predicho por PredictorTiempo por
+          margen, entre minimo y maximo (defecto si no hay historial);
+        - si la suma supera el presupuesto, se cubren completas las
+          instancias de menor tiempo (mientras las demás reciban al menos
+          minimo); las demás reciben minimo más una parte de lo que queda
+          del presupuesto proporcional a lo que les falta para su tiempo
+          predicho, de modo que la suma nunca supera el presupuesto.
+    caracteristicas: dict
+        Instancia -> características (ver caracteristicas_instancia).
+
+    Retorna el diccionario instancia -> límite de tiempo en segundos.
+    Lanza ValueError si el presupuesto no alcanza para dar minimo a cada
+    instancia.
+    '''
+    import math
+
+    if minimo * len(caracteristicas) > presupuesto_total:
+        raise ValueError(f'El presupuesto de {presupuesto_total} s no alcanza para {minimo} s en cada una de las {len(caracteristicas)} instancias')
+
+    predictor = PredictorTiempo(gap_objetivo, variante).ajustar(leer_historial(historial))
+
+    deseado = {}
+    for instancia, c in caracteristicas.items():
+        prediccion = predictor.predecir(c, instancia)
+        tiempo = defecto if prediccion is None else prediccion * margen
+        tiempo = max(minimo, tiempo)
+        if maximo is not None:
+            tiempo = min(maximo, tiempo)
+        deseado[instancia] = tiempo
+
+    if sum(deseado.values()) <= presupuesto_total:
+        return {instancia: round(tiempo) for instancia, tiempo in deseado.items()}
+
+    propuesta = {}
+    restante = presupuesto_total
+    pendientes = sorted(deseado, key=deseado.get)
+    while pendientes:
+        # Cubrir completa la instancia más rápida si las demás aún reciben el mínimo
+        instancia = pendientes[0]
+        if deseado[instancia] + minimo * (len(pendientes) - 1) <= restante:
+            propuesta[instancia] = deseado[instancia]
+            restante -= deseado[instancia]
+            pendientes.pop(0)
+        else:
+            break
+    # Cada pendiente recibe minimo y el sobrante se reparte según lo que le falta
+    sobrante = restante - minimo * len(pendientes)
+    faltante = sum(deseado[i] - minimo for i in pendientes)
+    for instancia in pendientes:
+        propuesta[instancia] = minimo + (sobrante * (deseado[instancia] - minimo) / faltante if faltante > 0 else 0)
+
+    # Hacia abajo para que el redondeo no supere el presupuesto
+    return {instancia: math.floor(propuesta[instancia]) for instancia in caracteristicas}
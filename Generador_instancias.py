@@ -0,0 +1,234 @@
+'''
+Generador de instancias sintéticas para pruebas de escala y estrés.
+
+Las estadísticas (escritorios por colaborador, escritorios por zona, tamaño
+de los grupos, fracción de escritorios permitidos por colaborador y
+cantidad y frecuencia de días preferidos) se ajustan con las instancias de
+instances/ y se reproducen para cualquier cantidad de colaboradores. Las
+instancias se escriben en el mismo esquema JSON que lee importar_data.
+
+Los escritorios permitidos de cada colaborador salen en su mayoría
+(concentracion) de las zonas de casa de su grupo: una zona o dos si una no
+alcanza para el grupo. Así los grupos pueden sentarse juntos, como en las
+instancias reales, en lugar de repartir sus escritorios por todo el piso.
+
+Con semanas > 1 los días se repiten por semana (L1, Ma1, ..., V2, ...) y se
+agregan Min_Days y Max_Days escalados por la cantidad de semanas; el grupo
+primario sigue siendo un único día del horizonte.
+'''
+import os
+
+CARPETA_INSTANCIAS = 'instances'
+CARPETA_SALIDA = 'instances_sinteticas'
+
+# Tamaños (colaboradores) y semillas a generar al correr el archivo
+TAMANOS = [100, 250, 500, 1000, 2500, 5000, 10000]
+SEMILLAS = [0]
+SEMANAS = 1
+CONCENTRACION = 0.8  # Fracción de los escritorios permitidos en las zonas de casa del grupo
+
+def ajustar_estadisticas(carpeta=CARPETA_INSTANCIAS, archivos=None):
+    '''
+    Estadísticas de las instancias JSON de la carpeta:
+        escasez: escritorios por colaborador;
+        escritorios_zona: escritorios por zona;
+        tamano_grupo: colaboradores por grupo;
+        densidad: fracciones de escritorios permitidos de cada colaborador
+            (muestra empírica);
+        dias_preferidos: cantidades de días preferidos de cada colaborador
+            (muestra empírica);
+        frecuencia_dias: frecuencia relativa de cada día de la semana entre
+            los días preferidos;
+        dias: días de la semana de las instancias.
+    archivos: list
+        Archivos de la carpeta a usar. Por defecto, solo las instancias base
+        instanceN.json (las variantes como instance1_semana2.json repetirían
+        los datos de su instancia).
+    '''
+    import re
+    import json
+
+    if archivos is None:
+        archivos = [archivo for archivo in os.listdir(carpeta) if re.fullmatch(r'instance\d+\.json', archivo)]
+
+    escasez, escritorios_zona, tamano_grupo = [], [], []
+    densidad, dias_preferidos = [], []
+    frecuencia_dias = {}
+    dias = None
+    for archivo in sorted(archivos):
+        with open(os.path.join(carpeta, archivo), 'r') as f:
+            data = json.load(f)
+
+        E, D = data['Employees'], data['Desks']
+        dias = data['Days']
+        escasez.append(len(D) / len(E))
+        escritorios_zona.append(len(D) / len(data['Zones']))
+        tamano_grupo.append(len(E) / len(data['Groups']))
+        for e in E:
+            densidad.append(len(data['Desks_E'][e]) / len(D))
+            dias_preferidos.append(len(data['Days_E'][e]))
+            for t in data['Days_E'][e]:
+                frecuencia_dias[t] = frecuencia_dias.get(t, 0) + 1
+
+    total = sum(frecuencia_dias.values())
+    return {
+        'escasez': sum(escasez) / len(escasez),
+        'escritorios_zona': sum(escritorios_zona) / len(escritorios_zona),
+        'tamano_grupo': sum(tamano_grupo) / len(tamano_grupo),
+        'densidad': densidad,
+        'dias_preferidos': dias_preferidos,
+        'frecuencia_dias': {t: frecuencia_dias.get(t, 0) / total for t in dias},
+        'dias': dias,
+    }
+
+def _repartir(elementos, partes):
+    '''Divide elementos en partes contiguas de tamaños lo más parecidos posible.'''
+    tamano, sobrante = divmod(len(elementos), partes)
+    resultado, inicio = [], 0
+    for i in range(partes):
+        fin = inicio + tamano + (1 if i < sobrante else 0)
+        resultado.append(elementos[inicio:fin])
+        inicio = fin
+    return resultado
+
+def _zonas_casa(aleatorio, Desks_Z, tamano):
+    '''
+    Zonas de casa de un grupo de tamano colaboradores: una zona al azar y,
+    si no tiene escritorios para todo el grupo, una segunda.
+    '''
+    zonas = aleatorio.sample(list(Desks_Z), min(2, len(Desks_Z)))
+    if len(Desks_Z[zonas[0]]) >= tamano:
+        return zonas[:1]
+    return zonas
+
+def generar_instancia(colaboradores, semilla=0, semanas=1, estadisticas=None, densidad=None, concentracion=CONCENTRACION):
+    '''
+    Genera una instancia sintética con el esquema de instances/*.json.
+    colaboradores: int
+        Cantidad de colaboradores.
+    semilla: int
+        Semilla del generador aleatorio (misma semilla, misma instancia).
+    semanas: int
+        Semanas del horizonte.
+    estadisticas: dict
+        Resultado de ajustar_estadisticas (por defecto, de instances/).
+    densidad: float
+        Fracción fija de escritorios permitidos por colaborador, en lugar de
+        la muestra ajustada (útil para limitar el tamaño en instancias
+        grandes, donde Desks_E crece con colaboradores x escritorios).
+    concentracion: float
+        Fracción de los escritorios permitidos de cada colaborador que se
+        toma de las zonas de casa de su grupo (el resto, de las demás zonas).
+        None reparte los escritorios permitidos al azar entre todas las
+        zonas.
+
+    Retorna el diccionario de la instancia.
+    '''
+    import random
+
+    if estadisticas is None:
+        estadisticas = ajustar_estadisticas()
+    aleatorio = random.Random(semilla)
+
+    n_escritorios = max(1, round(colaboradores * estadisticas['escasez']))
+    n_zonas = max(1, round(n_escritorios / estadisticas['escritorios_zona']))
+    n_grupos = max(1, round(colaboradores / estadisticas['tamano_grupo']))
+
+    E = [f'E{i}' for i in range(colaboradores)]
+    D = [f'D{i}' for i in range(n_escritorios)]
+    Z = [f'Z{i}' for i in range(n_zonas)]
+    G = [f'G{i}' for i in range(n_grupos)]
+
+    semana = estadisticas['dias']
+    pesos_dias = [estadisticas['frecuencia_dias'][t] for t in semana]
+    if semanas == 1:
+        T = list(semana)
+    else:
+        T = [f'{t}{s + 1}' for s in range(semanas) for t in semana]
+
+    Desks_Z = {z: escritorios for z, escritorios in zip(Z, _repartir(D, n_zonas))}
+    Employees_G = {g: integrantes for g, integrantes in zip(G, _repartir(E, n_grupos))}
+
+    # Escritorios de las zonas de casa de cada colaborador (los de su grupo)
+    casa = {}
+    for g, integrantes in Employees_G.items():
+        escritorios_casa = [d for z in _zonas_casa(aleatorio, Desks_Z, len(integrantes)) for d in Desks_Z[z]]
+        for e in integrantes:
+            casa[e] = escritorios_casa
+
+    Desks_E = {}
+    Days_E = {}
+    for e in E:
+        fraccion = densidad if densidad is not None else aleatorio.choice(estadisticas['densidad'])
+        cantidad = max(1, min(n_escritorios, round(fraccion * n_escritorios)))
+        if concentracion is None:
+            Desks_E[e] = aleatorio.sample(D, cantidad)
+        else:
+            propios = set(casa[e])
+            fuera = [d for d in D if d not in propios]
+            en_casa = min(len(casa[e]), max(1, round(concentracion * cantidad)), cantidad)
+            en_casa = max(en_casa, cantidad - len(fuera))
+            Desks_E[e] = aleatorio.sample(casa[e], en_casa) + aleatorio.sample(fuera, cantidad - en_casa)
+
+        # Días preferidos de cada semana, sin repetir y según la frecuencia ajustada
+        preferidos = []
+        for s in range(semanas):
+            cantidad = min(len(semana), aleatorio.choice(estadisticas['dias_preferidos']))
+            disponibles, pesos = list(semana), list(pesos_dias)
+            elegidos = []
+            for _ in range(cantidad):
+                t = aleatorio.choices(disponibles, weights=pesos)[0]
+                i = disponibles.index(t)
+                disponibles.pop(i)
+                pesos.pop(i)
+                elegidos.append(t)
+            elegidos.sort(key=semana.index)
+            preferidos += elegidos if semanas == 1 else [f'{t}{s + 1}' for t in elegidos]
+        Days_E[e] = preferidos
+
+    data = {
+        'Employees': E,
+        'Desks': D,
+        'Days': T,
+        'Groups': G,
+        'Zones': Z,
+        'Desks_Z': Desks_Z,
+        'Desks_E': Desks_E,
+        'Employees_G': Employees_G,
+        'Days_E': Days_E,
+    }
+    if semanas > 1:
+        data['Min_Days'] = 2 * semanas
+        data['Max_Days'] = 3 * semanas
+    return data
+
+def guardar_instancia(data, nombre, carpeta=CARPETA_SALIDA):
+    '''
+    Escribe la instancia en <carpeta>/<nombre>.json y retorna la ruta.
+    '''
+    import json
+
+    os.makedirs(carpeta, exist_ok=True)
+    ruta = os.path.join(carpeta, f'{nombre}.json')
+    with open(ruta, 'w') as f:
+        json.dump(data, f)
+    return ruta
+
+def generar_lote(tamanos=TAMANOS, semillas=SEMILLAS, semanas=SEMANAS, carpeta=CARPETA_SALIDA, densidad=None, concentracion=CONCENTRACION):
+    '''
+    Genera y guarda una instancia por tamaño y semilla, con nombre
+    sintetica_<colaboradores>_s<semilla> (y _w<semanas> si semanas > 1).
+    Retorna la lista de rutas escritas.
+    '''
+    estadisticas = ajustar_estadisticas()
+    rutas = []
+    for colaboradores in tamanos:
+        for semilla in semillas:
+            nombre = f'sintetica_{colaboradores}_s{semilla}' + (f'_w{semanas}' if semanas > 1 else '')
+            data = generar_instancia(colaboradores, semilla, semanas, estadisticas, densidad, concentracion)
+            rutas.append(guardar_instancia(data, nombre, carpeta))
+            print(f'{nombre}: {len(data["Employees"])} colaboradores, {len(data["Desks"])} escritorios, {len(data["Zones"])} zonas, {len(data["Groups"])} grupos, {len(data["Days"])} días')
+    return rutas
+
+if __name__ == '__main__':
+    generar_lote()
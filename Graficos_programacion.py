@@ -0,0 +1,11 @@
+from Funciones_graficos import renderizar_todo
+
+# Genera el Excel (una hoja por día) y los mapas de calor por día de todas las
+# soluciones guardadas en las carpetas Model_outputs* (solucion_<instancia>.npz)
+
+patron = 'Model_outputs*' # Carpetas con soluciones
+carpeta_salida = 'graficos_programacion'
+procesos = None # Procesos para dibujar (None: uno por núcleo)
+
+if __name__ == '__main__':
+    renderizar_todo(patron, carpeta_salida, procesos)
@@ -1,8 +1,9 @@
 from Funciones_modelos import *
 
-preferencias_satisfechas, porcentaje = resolver_modelo_F2('instance1', 300)
+preferencias_satisfechas, porcentaje, model, asignacion = resolver_modelo_F2('instance1', 300)
 
-df_programacion = resolver_modelo_F1('instance1', (porcentaje/100), porcentaje, preferencias_satisfechas, 300)
+# El modelo F1 reutiliza el núcleo construido para F2 y parte de su solución
+df_programacion = resolver_modelo_F1('instance1', (porcentaje/100), porcentaje, preferencias_satisfechas, 300, model=model, asignacion=asignacion)
 
 import pandas as pd
 import seaborn as sns
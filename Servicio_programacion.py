@@ -0,0 +1,242 @@
+'''
+Servicio local (HTTP) de programación de colaboradores.
+
+Operaciones:
+    POST /trabajos
+        Cuerpo: instancia en el esquema de instances/*.json. Parámetros
+        opcionales en la URL: tiempo_limite (segundos) y tolerancia. Encola el
+        trabajo en el pool de procesos y retorna su id; una instancia
+        infactible se rechaza con 400 sin encolarse. Una instancia idéntica
+        (mismo contenido y parámetros) ya enviada retorna el mismo id sin
+        volver a resolverse.
+    GET /trabajos/<id>
+        Estado del trabajo (en_cola, resolviendo, completado, error) y
+        progreso: incumbente, cota y gap leídos del log de CBC, que se
+        escribe mientras CBC corre.
+    GET /trabajos/<id>/programacion
+        Tabla de programacion() en JSON (lista de filas) cuando el trabajo
+        terminó.
+
+Cada solicitud se atiende en su propio hilo y los modelos se resuelven en
+procesos separados, de modo que los envíos simultáneos no se bloquean.
+'''
+import os
+import json
+import time
+import hashlib
+import threading
+from multiprocessing import Manager
+from concurrent.futures import ProcessPoolExecutor
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+
+SOLVER_PATH = 'Optimizer\\Cbc-releases.2.10.12-windows-2022-msvs-v17-Release-x64\\bin\\cbc.exe'
+
+HOST = '127.0.0.1'
+PUERTO = 8000
+PROCESOS = 2 # Trabajos resueltos en simultáneo
+CARPETA_TRABAJOS = 'Servicio_trabajos' # Logs de CBC de cada trabajo
+TIEMPO_LIMITE = 300 # Tiempo máximo por defecto en segundos
+TOLERANCIA = 0.01 # 1% de tolerancia de optimalidad
+
+def resolver_trabajo(data, tiempo_limite, tolerancia, ruta_log, solver_path=SOLVER_PATH, estados=None, id_trabajo=None):
+    '''
+    Resuelve el modelo F1 de la instancia data en un proceso del pool,
+    partiendo de la heurística constructiva, y retorna la tabla de
+    programacion() como lista de filas. La salida de CBC se escribe en
+    ruta_log mientras corre (ver resolver_cbc) para que el servicio lea el
+    progreso.
+    estados: dict
+        Diccionario compartido id -> estado; al empezar, el trabajo se marca
+        como 'resolviendo'.
+    '''
+    from Funciones import importar_data, programacion
+    from Funciones_modelos import construir_modelo, agregar_F1, cargar_asignacion, usar_respaldo_heuristico
+    from Funciones_heuristica import heuristica_constructiva
+    from Funciones_portafolio import resolver_cbc
+
+    if estados is not None:
+        estados[id_trabajo] = 'resolviendo'
+
+    inst = importar_data(data, imprimir=False)
+    model = construir_modelo(inst, nombre='Universidad')
+    agregar_F1(model, inst)
+    cargar_asignacion(model, inst, heuristica_constructiva(inst))
+
+    if not resolver_cbc(model, tiempo_limite, tolerancia, ruta_log, solver_path, warmstart=True):
+        usar_respaldo_heuristico(model, inst)
+
+    df_programacion = programacion(model, inst.E, inst.D, inst.T, inst.Z, inst.e_g)
+    return json.loads(df_programacion.to_json(orient='records', force_ascii=False))
+
+class Servicio:
+    '''
+    Cola de trabajos del servicio: pool de procesos, estado de cada trabajo
+    y deduplicación por hash (sha256) del contenido de la instancia y sus
+    parámetros.
+    '''
+    def __init__(self, procesos=PROCESOS, carpeta=CARPETA_TRABAJOS, solver_path=SOLVER_PATH):
+        os.makedirs(carpeta, exist_ok=True)
+        self.carpeta = carpeta
+        self.solver_path = solver_path
+        self.pool = ProcessPoolExecutor(max_workers=procesos)
+        # Estado que marcan los procesos del pool al tomar cada trabajo
+        self.gestor = Manager()
+        self.estados = self.gestor.dict()
+        self.trabajos = {}
+        self.candado = threading.Lock()
+
+    def cerrar(self):
+        '''Detiene el pool (cancelando los trabajos en cola) y el gestor de estados.'''
+        self.pool.shutdown(cancel_futures=True)
+        self.gestor.shutdown()
+
+    def enviar(self, data, tiempo_limite=TIEMPO_LIMITE, tolerancia=TOLERANCIA):
+        '''
+        Encola la instancia y retorna (id, nuevo). Si ya existe un trabajo con
+        el mismo contenido y parámetros, retorna su id con nuevo = False.
+        Lanza ValueError si la instancia está mal formada o es infactible.
+        '''
+        for clave in ('Employees', 'Desks', 'Days', 'Groups', 'Zones', 'Desks_Z', 'Desks_E', 'Employees_G', 'Days_E'):
+            if clave not in data:
+                raise ValueError(f'Falta la clave {clave} en la instancia')
+
+        # Rechazar de inmediato las instancias infactibles (ver analizar_instancia)
+        from Funciones import importar_data
+        try:
+            importar_data(data, imprimir=False, verificar=True)
+        except KeyError as error:
+            raise ValueError(f'Referencia inexistente en la instancia: {error}')
+
+        contenido = json.dumps({'instancia': data, 'tiempo_limite': tiempo_limite, 'tolerancia': tolerancia}, sort_keys=True)
+        id_trabajo = hashlib.sha256(contenido.encode('utf-8')).hexdigest()[:16]
+
+        with self.candado:
+            # Un envío idéntico reutiliza el trabajo existente, salvo que haya fallado
+            existente = self.trabajos.get(id_trabajo)
+            if existente is not None and not (existente['futuro'].done() and existente['futuro'].exception() is not None):
+                return id_trabajo, False
+
+            ruta_log = os.path.join(self.carpeta, f'{id_trabajo}.log')
+            if os.path.exists(ruta_log):
+                os.remove(ruta_log)
+            self.estados[id_trabajo] = 'en_cola'
+            futuro = self.pool.submit(resolver_trabajo, data, tiempo_limite, tolerancia, ruta_log,
+                                      self.solver_path, self.estados, id_trabajo)
+            self.trabajos[id_trabajo] = {
+                'futuro': futuro,
+                'ruta_log': ruta_log,
+                'enviado': time.time(),
+                'tiempo_limite': tiempo_limite,
+                'tolerancia': tolerancia,
+            }
+        return id_trabajo, True
+
+    def estado(self, id_trabajo):
+        '''
+        Estado y progreso del trabajo, o None si no existe.
+        '''
+        from Funciones_modelos import leer_log_cbc, _gap
+
+        with self.candado:
+            trabajo = self.trabajos.get(id_trabajo)
+        if trabajo is None:
+            return None
+
+        futuro = trabajo['futuro']
+        if futuro.done():
+            estado = 'error' if futuro.exception() is not None else 'completado'
+        else:
+            estado = self.estados.get(id_trabajo, 'en_cola')
+
+        respuesta = {
+            'id': id_trabajo,
+            'estado': estado,
+            'segundos': round(time.time() - trabajo['enviado'], 1),
+            'tiempo_limite': trabajo['tiempo_limite'],
+            'incumbente': None,
+            'cota': None,
+            'gap': None,
+        }
+        if estado == 'error':
+            respuesta['error'] = str(futuro.exception())
+        if os.path.exists(trabajo['ruta_log']):
+            # Último punto de telemetría (solución inicial, raíz, progreso) o
+            # el resumen final cuando CBC terminó
+            log = leer_log_cbc(trabajo['ruta_log'])
+            if log['objetivo'] is not None:
+                respuesta.update({'incumbente': log['objetivo'], 'cota': log['cota_final'], 'gap': _gap(log['objetivo'], log['cota_final'])})
+            elif log['telemetria']:
+                punto = log['telemetria'][-1]
+                respuesta.update({'incumbente': punto['incumbente'], 'cota': punto['cota'], 'gap': punto['gap']})
+        return respuesta
+
+    def programacion(self, id_trabajo):
+        '''
+        Tabla de programación del trabajo terminado, o None si no existe o no
+        ha terminado.
+        '''
+        with self.candado:
+            trabajo = self.trabajos.get(id_trabajo)
+        if trabajo is None or not trabajo['futuro'].done() or trabajo['futuro'].exception() is not None:
+            return None
+        return trabajo['futuro'].result()
+
+class ManejadorServicio(BaseHTTPRequestHandler):
+    '''
+    Atiende las solicitudes HTTP del servicio (ver docstring del módulo).
+    '''
+    def _responder(self, codigo, cuerpo):
+        datos = json.dumps(cuerpo, ensure_ascii=False).encode('utf-8')
+        self.send_response(codigo)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(datos)))
+        self.end_headers()
+        self.wfile.write(datos)
+
+    def do_POST(self):
+        url = urlparse(self.path)
+        if url.path.rstrip('/') != '/trabajos':
+            return self._responder(404, {'error': 'Ruta no encontrada'})
+
+        parametros = parse_qs(url.query)
+        try:
+            longitud = int(self.headers.get('Content-Length', 0))
+            data = json.loads(self.rfile.read(longitud))
+            tiempo_limite = float(parametros.get('tiempo_limite', [TIEMPO_LIMITE])[0])
+            tolerancia = float(parametros.get('tolerancia', [TOLERANCIA])[0])
+            id_trabajo, nuevo = self.server.servicio.enviar(data, tiempo_limite, tolerancia)
+        except (ValueError, TypeError) as error:
+            return self._responder(400, {'error': str(error)})
+        self._responder(202 if nuevo else 200, {'id': id_trabajo, 'nuevo': nuevo})
+
+    def do_GET(self):
+        partes = [p for p in urlparse(self.path).path.split('/') if p]
+        if len(partes) < 2 or partes[0] != 'trabajos':
+            return self._responder(404, {'error': 'Ruta no encontrada'})
+
+        id_trabajo = partes[1]
+        estado = self.server.servicio.estado(id_trabajo)
+        if estado is None:
+            return self._responder(404, {'error': f'Trabajo {id_trabajo} no encontrado'})
+
+        if len(partes) == 2:
+            return self._responder(200, estado)
+        if len(partes) == 3 and partes[2] == 'programacion':
+            tabla = self.server.servicio.programacion(id_trabajo)
+            if tabla is None:
+                return self._responder(409, {'error': f'El trabajo está {estado["estado"]}', 'estado': estado})
+            return self._responder(200, tabla)
+        self._responder(404, {'error': 'Ruta no encontrada'})
+
+if __name__ == '__main__':
+    servidor = ThreadingHTTPServer((HOST, PUERTO), ManejadorServicio)
+    servidor.servicio = Servicio(PROCESOS)
+    print(f'Servicio de programación en http://{HOST}:{PUERTO} ({PROCESOS} procesos)')
+    try:
+        servidor.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        servidor.server_close()
+        servidor.servicio.cerrar()
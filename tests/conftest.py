@@ -0,0 +1,60 @@
+'''
+Configuración común de las pruebas: los módulos del reto se importan desde
+la raíz del repositorio y las rutas relativas (instances/, Model_outputs/)
+se resuelven desde ella.
+'''
+import os
+import sys
+
+import pytest
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+os.chdir(RAIZ)
+
+RUTA_INSTANCIA1 = os.path.join(RAIZ, 'instances', 'instance1.json')
+
+@pytest.fixture(scope='session')
+def data_instancia1():
+    '''Diccionario JSON de instances/instance1.json.'''
+    import json
+    with open(RUTA_INSTANCIA1, 'r') as f:
+        return json.load(f)
+
+@pytest.fixture(scope='session')
+def inst1():
+    '''Instancia de instances/instance1.json.'''
+    from Funciones import importar_data
+    return importar_data(RUTA_INSTANCIA1, imprimir=False)
+
+@pytest.fixture(scope='session')
+def violaciones():
+    '''
+    Función que retorna los nombres de las restricciones activas del modelo
+    que no cumplen los valores actuales de las variables.
+    '''
+    from pyomo.environ import Constraint, value
+
+    def restricciones_violadas(model, tolerancia=1e-6):
+        violadas = []
+        for c in model.component_data_objects(Constraint, active=True):
+            cuerpo = value(c.body)
+            if (c.has_lb() and cuerpo < value(c.lower) - tolerancia) or (c.has_ub() and cuerpo > value(c.upper) + tolerancia):
+                violadas.append(c.name)
+        return violadas
+    return restricciones_violadas
+
+@pytest.fixture(scope='session')
+def cbc():
+    '''Ruta de un ejecutable de CBC (el del PATH o el que trae PuLP); omite la prueba si no hay.'''
+    import shutil
+    ruta = shutil.which('cbc')
+    if ruta is None:
+        try:
+            import pulp
+            ruta = pulp.apis.PULP_CBC_CMD().path
+        except Exception:
+            ruta = None
+    if ruta is None or not os.path.exists(ruta):
+        pytest.skip('CBC no disponible')
+    return ruta
@@ -0,0 +1,58 @@
+'''
+Pruebas de la reoptimización delta con instance1_semana2.json, que cambia
+los días preferidos de E3 y E4 y los escritorios permitidos de E12.
+'''
+import os
+
+import pytest
+
+@pytest.fixture(scope='module')
+def semana2():
+    from Funciones import importar_data
+    return importar_data(os.path.join('instances', 'instance1_semana2.json'), imprimir=False)
+
+def test_diferencias_con_la_semana_anterior(inst1, semana2):
+    from Funciones_delta import diferencias_instancia
+
+    cambios = diferencias_instancia(inst1, semana2)
+    assert cambios['colaboradores'] == {'E3', 'E4', 'E12'}
+    assert cambios['grupos'] == {inst1.grupo(e) for e in ('E3', 'E4', 'E12')} - {None}
+    assert cambios['escritorios'] == set()
+    assert diferencias_instancia(inst1, inst1) == {'colaboradores': set(), 'grupos': set(), 'escritorios': set()}
+
+def test_fijar_solo_fuera_del_vecindario(inst1, semana2):
+    from Funciones_heuristica import heuristica_constructiva
+    from Funciones_modelos import construir_modelo, cargar_asignacion
+    from Funciones_delta import diferencias_instancia, vecindario_delta, fijar_no_afectados
+
+    asignacion = heuristica_constructiva(inst1)
+    libres, grupos_libres = vecindario_delta(semana2, asignacion, diferencias_instancia(inst1, semana2), vecindario=None)
+    assert {'E3', 'E4', 'E12'} <= libres
+
+    model = construir_modelo(semana2)
+    cargar_asignacion(model, semana2, asignacion)
+    dias = {semana2.T[0]}
+    fijar_no_afectados(model, libres, grupos_libres, dias)
+
+    for (e, d, t, z), var in model.X.items():
+        assert var.fixed is not (e in libres and t in dias)
+    for (e, t), var in model.Y.items():
+        assert var.fixed is not (e in libres and t in dias)
+    for (g, t), var in model.Z.items():
+        assert var.fixed is not (g in grupos_libres and t in dias)
+
+def test_reoptimizar_delta_consistente(inst1, semana2, cbc):
+    from pyomo.environ import value
+    from Funciones_heuristica import heuristica_constructiva
+    from Funciones_modelos import construir_modelo, agregar_F1, cargar_asignacion, extraer_asignacion
+    from Funciones_delta import reoptimizar_delta
+
+    model, cambios = reoptimizar_delta(inst1, semana2, heuristica_constructiva(inst1), tiempo_limite=20, solver_path=cbc, imprimir=False)
+
+    # La FO del modelo reducido es la de la asignación resultante sobre el modelo completo
+    asignacion = extraer_asignacion(model)
+    completo = construir_modelo(semana2)
+    agregar_F1(completo, semana2)
+    cargar_asignacion(completo, semana2, asignacion)
+    assert value(model.F1.distribucion_rule) == pytest.approx(value(completo.F1.distribucion_rule))
+    assert all(e in cambios['libres'] for (e, t) in set(asignacion['Y']) ^ set(heuristica_constructiva(inst1)['Y']) if e in semana2.id_E)
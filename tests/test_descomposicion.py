@@ -0,0 +1,24 @@
+'''
+Pruebas de la descomposición por días de F1 en instance1: la asignación de
+los subproblemas es consistente con el maestro y su FO no baja de la cota.
+'''
+
+def test_asignacion_consistente_y_sobre_la_cota(inst1, cbc):
+    from Funciones_descomposicion import resolver_descomposicion
+
+    resultado = resolver_descomposicion(inst1, 10, 10, procesos=2, solver_path=cbc, imprimir=False)
+    X, Y, Zr = resultado['X'], resultado['Y'], resultado['Z']
+
+    # Cada asistencia tiene exactamente un escritorio y cada escritorio un colaborador por día
+    assert sorted(Y) == sorted({(e, t) for (e, d, t, z) in X})
+    assert len({(d, t) for (e, d, t, z) in X}) == len(X)
+    assert all((d, z) in inst1.edz_colaborador[e] for (e, d, t, z) in X)
+
+    # El día de reunión asiste todo el grupo (salvo quien quedó sin escritorio)
+    asistencias = set(Y) | set(resultado['sin_escritorio'])
+    for (g, t) in Zr:
+        assert all((e, t) in asistencias for e in inst1.e_g[g])
+    assert resultado['sin_escritorio'] == []
+
+    assert resultado['cota'] is not None
+    assert resultado['FO'] >= resultado['cota']
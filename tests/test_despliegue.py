@@ -0,0 +1,35 @@
+'''
+Pruebas de la reanudación del lote: el registro (JSON atómico) decide qué
+trabajos se vuelven a correr y el punto de control conserva el incumbente.
+'''
+
+def test_solo_se_reanudan_los_trabajos_sin_terminar(tmp_path):
+    from Funciones_despliegue import crear_trabajos, clave_trabajo, guardar_registro, leer_registro, preparar_trabajos
+
+    trabajos = crear_trabajos(['instance1', 'instance2', 'instance3', 'instance4'], ['F1'], 100)
+    completado, en_curso, con_error, nuevo = trabajos
+    ruta = str(tmp_path / 'registro.json')
+    guardar_registro({
+        clave_trabajo(completado): {'estado': 'completado', 'gap': 0.05, 'parametros': completado},
+        clave_trabajo(en_curso): {'estado': 'en_curso', 'parametros': en_curso},
+        clave_trabajo(con_error): {'estado': 'error', 'error': 'interrumpido', 'parametros': con_error},
+    }, ruta)
+
+    preparados = preparar_trabajos(trabajos, leer_registro(ruta))
+    assert [(trabajo['instancia'], reanudar) for trabajo, reanudar in preparados] == [
+        ('instance2', True), ('instance3', True), ('instance4', False)]
+
+    # Con más tiempo que el de la corrida completada, esta continúa desde su incumbente
+    mas_tiempo = crear_trabajos(['instance1'], ['F1'], 200)
+    assert [(t['instancia'], r) for t, r in preparar_trabajos(mas_tiempo, leer_registro(ruta))] == [('instance1', True)]
+
+def test_punto_control_conserva_el_incumbente(tmp_path):
+    from Funciones_despliegue import guardar_punto_control, leer_punto_control
+
+    control = {'etapa': 'F1', 'tiempo': 12.5, 'gap': 0.2, 'epsilon': 25.0,
+               'asignacion': {'X': [('E0', 'D1', 'L', 'Z0')], 'Y': [('E0', 'L')], 'Z': [('G0', 'L')]}}
+    ruta = str(tmp_path / 'punto_control.json')
+    guardar_punto_control(control, ruta)
+    assert leer_punto_control(ruta) == control
+    # La escritura atómica no deja temporales en la carpeta
+    assert [p.name for p in tmp_path.iterdir()] == ['punto_control.json']
@@ -0,0 +1,101 @@
+'''
+Pruebas del análisis previo de factibilidad: emparejamiento bipartito,
+conjunto de Hall y analizar_instancia sobre variantes infactibles de
+instance1.
+'''
+import pytest
+
+def test_emparejamiento_maximo_y_preferencias():
+    from Funciones import emparejamiento_bipartito
+
+    # a solo puede usar 1; b prefiere 1 pero también puede usar 2
+    adyacencia = {'b': [1, 2], 'a': [1], 'c': [2, 3]}
+    pareja = emparejamiento_bipartito(adyacencia)
+    assert len(pareja) == 3
+    for v, u in pareja.items():
+        assert v in adyacencia[u]
+    assert pareja[1] == 'a'
+
+def test_emparejamiento_incremental():
+    from Funciones import emparejamiento_bipartito
+
+    pareja = emparejamiento_bipartito({'a': [1]})
+    # Llamada posterior con otra adyacencia: amplía el emparejamiento existente
+    emparejamiento_bipartito({'a': [1, 2], 'b': [1]}, pareja, nodos=['b'])
+    assert pareja == {1: 'b', 2: 'a'}
+
+def test_conjunto_hall():
+    from Funciones import emparejamiento_bipartito, conjunto_hall
+
+    # Tres colaboradores que comparten dos escritorios y uno con escritorio propio
+    adyacencia = {'a': [1, 2], 'b': [1, 2], 'c': [2, 1], 'd': [3]}
+    pareja = emparejamiento_bipartito(adyacencia)
+    libre = next(u for u in adyacencia if u not in pareja.values())
+    S, vecinos = conjunto_hall(adyacencia, pareja, libre)
+    assert S == {'a', 'b', 'c'}
+    assert vecinos == {1, 2}
+    assert len(vecinos) == len(S) - 1
+
+def modificar(data_instancia1, **cambios):
+    from Funciones import importar_data
+    return importar_data(dict(data_instancia1, **cambios), imprimir=False)
+
+def test_instance1_factible(inst1):
+    from Funciones import analizar_instancia
+
+    analisis = analizar_instancia(inst1)
+    assert analisis['errores'] == []
+    assert analisis['advertencias'] == []
+
+def test_colaborador_sin_escritorio(data_instancia1):
+    from Funciones import analizar_instancia
+
+    inst = modificar(data_instancia1, Desks_E=dict(data_instancia1['Desks_E'], E0=[]))
+    analisis = analizar_instancia(inst, estricto=False)
+    assert analisis['errores'] == ['Colaborador E0 sin escritorio utilizable (Desks_E vacío)']
+    with pytest.raises(ValueError, match='E0'):
+        analizar_instancia(inst)
+
+def test_grupo_viola_hall(data_instancia1):
+    from Funciones import analizar_instancia
+
+    g = data_instancia1['Groups'][0]
+    integrantes = data_instancia1['Employees_G'][g]
+    escritorios = dict(data_instancia1['Desks_E'])
+    for e in integrantes[:3]:
+        escritorios[e] = ['D0', 'D1']
+    inst = modificar(data_instancia1, Desks_E=escritorios)
+    errores = analizar_instancia(inst, estricto=False)['errores']
+    assert errores == [f"Grupo {g}: los colaboradores {sorted(integrantes[:3])} comparten solo 2 escritorios ['D0', 'D1'] para la reunión"]
+
+def test_rango_de_dias(data_instancia1):
+    from Funciones import analizar_instancia
+
+    inst = modificar(data_instancia1, Min_Days=4, Max_Days=3)
+    # F2 exige min; F1 admite min - 1 por la penalización
+    assert any('mayores que los máximos' in m for m in analizar_instancia(inst, 'F2', estricto=False)['errores'])
+    assert not any('mayores que los máximos' in m for m in analizar_instancia(inst, 'F1', estricto=False)['errores'])
+
+def test_capacidad_por_dia(data_instancia1):
+    from Funciones import analizar_instancia
+
+    # Dos escritorios para todos: no caben los días mínimos ni los grupos de 5
+    inst = modificar(data_instancia1, Desks_E={e: ['D0', 'D1'] for e in data_instancia1['Employees']})
+    errores = analizar_instancia(inst, 'F2', estricto=False)['errores']
+    assert 'Los días mínimos suman 40 asistencias y caben a lo sumo 10 (2 por día)' in errores
+    assert any(m.startswith('El grupo') and 'no cabe en un día (2 puestos simultáneos)' in m for m in errores)
+
+def test_grupo_no_cabe_en_una_zona(data_instancia1):
+    from Funciones import analizar_instancia
+
+    # Cada integrante de un grupo con un escritorio en cada zona distinta
+    g = data_instancia1['Groups'][0]
+    integrantes = data_instancia1['Employees_G'][g]
+    z0, z1 = data_instancia1['Zones'][:2]
+    escritorios = dict(data_instancia1['Desks_E'])
+    for i, e in enumerate(integrantes):
+        zona = data_instancia1['Desks_Z'][z0 if i % 2 == 0 else z1]
+        escritorios[e] = [zona[i // 2]]
+    analisis = analizar_instancia(modificar(data_instancia1, Desks_E=escritorios), estricto=False)
+    assert analisis['errores'] == []
+    assert analisis['advertencias'] == [f'El grupo {g} ({len(integrantes)} colaboradores) no cabe en una sola zona (máximo 3)']
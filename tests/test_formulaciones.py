@@ -0,0 +1,48 @@
+'''
+Pruebas de la formulación fuerte de F1: mismas soluciones enteras que la
+formulación débil y una relajación lineal más ajustada.
+'''
+import pytest
+
+@pytest.fixture(scope='module')
+def asignacion(inst1):
+    from Funciones_heuristica import heuristica_constructiva
+    return heuristica_constructiva(inst1, imprimir=False)
+
+def modelo_F1(inst, formulacion_fuerte):
+    from Funciones_modelos import construir_modelo, agregar_F1
+
+    model = construir_modelo(inst)
+    agregar_F1(model, inst, formulacion_fuerte=formulacion_fuerte)
+    return model
+
+def test_misma_solucion_entera_y_objetivo(inst1, asignacion, violaciones):
+    from pyomo.environ import value
+    from Funciones_modelos import cargar_asignacion
+
+    objetivos = []
+    for formulacion_fuerte in (False, True):
+        model = modelo_F1(inst1, formulacion_fuerte)
+        cargar_asignacion(model, inst1, asignacion)
+        assert violaciones(model) == []
+        objetivos.append(value(model.F1.distribucion_rule))
+    assert objetivos[0] == objetivos[1]
+
+def test_relajacion_lineal_mas_ajustada(inst1, asignacion):
+    pytest.importorskip('highspy')
+    from pyomo.contrib import appsi
+    from pyomo.environ import TransformationFactory, value
+    from Funciones_modelos import cargar_asignacion
+
+    cotas = []
+    for formulacion_fuerte in (False, True):
+        model = modelo_F1(inst1, formulacion_fuerte)
+        TransformationFactory('core.relax_integer_vars').apply_to(model)
+        resultado = appsi.solvers.Highs().solve(model)
+        assert resultado.termination_condition == appsi.base.TerminationCondition.optimal
+        cotas.append(value(model.F1.distribucion_rule))
+
+    # Ambas son cotas inferiores de la FO de la heurística y la fuerte es mayor
+    model = modelo_F1(inst1, False)
+    cargar_asignacion(model, inst1, asignacion)
+    assert cotas[0] < cotas[1] <= value(model.F1.distribucion_rule) + 1e-6
@@ -0,0 +1,56 @@
+'''
+Pruebas del generador de instancias sintéticas: zonas de casa por grupo.
+'''
+import pytest
+
+@pytest.fixture(scope='module')
+def estadisticas():
+    from Generador_instancias import ajustar_estadisticas
+
+    # Zonas con espacio para un grupo completo, para que la advertencia de
+    # analizar_instancia dependa de los escritorios permitidos
+    estadisticas = dict(ajustar_estadisticas())
+    estadisticas['escritorios_zona'] = 10
+    return estadisticas
+
+def analizar(data, tmp_path):
+    from Funciones import importar_data, analizar_instancia
+    from Generador_instancias import guardar_instancia
+
+    inst = importar_data(guardar_instancia(data, 'sintetica', str(tmp_path)), imprimir=False)
+    return inst, analizar_instancia(inst, estricto=False)
+
+def test_grupos_caben_en_su_zona_de_casa(estadisticas, tmp_path):
+    from Generador_instancias import generar_instancia
+
+    data = generar_instancia(150, semilla=1, estadisticas=estadisticas, densidad=0.05)
+    inst, analisis = analizar(data, tmp_path)
+    assert analisis['errores'] == []
+    assert analisis['advertencias'] == []
+
+    # La mayoría de los escritorios de cada colaborador están en una o dos zonas
+    zona = {d: z for z in inst.Z for d in inst.dz[z]}
+    for e in inst.E:
+        conteo = {}
+        for d in inst.dr[e]:
+            conteo[zona[d]] = conteo.get(zona[d], 0) + 1
+        assert sum(sorted(conteo.values(), reverse=True)[:2]) >= 0.8 * len(inst.dr[e]) - 1
+
+def test_sin_concentracion_los_grupos_se_dispersan(estadisticas, tmp_path):
+    from Generador_instancias import generar_instancia
+
+    data = generar_instancia(150, semilla=1, estadisticas=estadisticas, densidad=0.05, concentracion=None)
+    inst, analisis = analizar(data, tmp_path)
+    assert len(analisis['advertencias']) == len(inst.G)
+
+def test_misma_semilla_misma_instancia(estadisticas):
+    from Generador_instancias import generar_instancia
+
+    assert generar_instancia(60, semilla=3, estadisticas=estadisticas) == generar_instancia(60, semilla=3, estadisticas=estadisticas)
+
+def test_ajuste_solo_con_instancias_base():
+    from Generador_instancias import ajustar_estadisticas
+
+    base = [f'instance{i}.json' for i in range(1, 11)]
+    assert ajustar_estadisticas() == ajustar_estadisticas(archivos=base)
+    assert ajustar_estadisticas() != ajustar_estadisticas(archivos=base + ['instance1_semana2.json'])
@@ -0,0 +1,109 @@
+'''
+Pruebas de la heurística constructiva: la programación es factible para
+instance1 (revisada a mano y con las restricciones de F1 y F2).
+'''
+import pytest
+
+@pytest.fixture(scope='module')
+def asignacion(inst1):
+    from Funciones_heuristica import heuristica_constructiva
+    return heuristica_constructiva(inst1, imprimir=False)
+
+def test_programacion_factible(inst1, asignacion):
+    assert asignacion['sin_escritorio'] == []
+
+    # Escritorio permitido, en su zona, y a lo sumo uno por colaborador y día
+    usados = set()
+    dias = {e: set() for e in inst1.E}
+    for (e, d, t, z) in asignacion['X']:
+        assert d in inst1.dr[e] and d in inst1.dz[z]
+        assert (d, t) not in usados
+        assert t not in dias[e]
+        usados.add((d, t))
+        dias[e].add(t)
+    assert sorted(asignacion['Y']) == sorted((e, t) for e in inst1.E for t in dias[e])
+
+    # Días de asistencia dentro del rango
+    for e in inst1.E:
+        assert inst1.min <= len(dias[e]) <= inst1.max
+
+    # Un día de reunión por grupo, con todos sus integrantes presentes
+    reuniones = dict(asignacion['Z'])
+    assert sorted(reuniones) == sorted(inst1.G)
+    for g, t in reuniones.items():
+        assert all(t in dias[e] for e in inst1.e_g[g])
+
+@pytest.mark.parametrize('variante', ['F1', 'F2'])
+def test_cumple_restricciones_del_modelo(inst1, asignacion, violaciones, variante):
+    from Funciones_modelos import construir_modelo, agregar_F1, agregar_F2, cargar_asignacion
+
+    model = construir_modelo(inst1)
+    (agregar_F1 if variante == 'F1' else agregar_F2)(model, inst1)
+    cargar_asignacion(model, inst1, asignacion)
+    assert violaciones(model) == []
+
+def test_grupo_reunido_en_su_zona_preferida(inst1):
+    from Funciones import emparejamiento_bipartito
+    from Funciones_heuristica import zona_preferida_grupo, _emparejar_dia
+
+    zonas = zona_preferida_grupo(inst1)
+    completa = {e: [d for (d, z) in inst1.edz_colaborador[e]] for e in inst1.E}
+    for g in inst1.G:
+        integrantes = inst1.e_g[g]
+        # Solo el grupo: cabe completo en su zona preferida
+        pareja = _emparejar_dia(inst1, integrantes, zonas, reunidos=set(integrantes))
+        assert {inst1.zona(d) for d in pareja} == {zonas[g]}
+
+        # Con todos los colaboradores: nadie queda sin escritorio por fijar al grupo
+        pareja = _emparejar_dia(inst1, inst1.E, zonas, reunidos=set(integrantes))
+        assert len(pareja) == len(emparejamiento_bipartito(completa))
+
+def test_asistencia_sin_escritorio_se_reporta(data_instancia1):
+    from Funciones import importar_data
+    from Funciones_heuristica import heuristica_constructiva
+
+    # Un grupo de 5 con un solo escritorio permitido entre todos
+    data = dict(data_instancia1)
+    g = data['Groups'][0]
+    data['Desks_E'] = dict(data_instancia1['Desks_E'], **{e: ['D0'] for e in data['Employees_G'][g]})
+    inst = importar_data(data, imprimir=False)
+    asignacion = heuristica_constructiva(inst)
+    reunion = dict(asignacion['Z'])[g]
+
+    # Solo uno del grupo se sienta el día de reunión; los demás se reportan
+    sentados = [e for e in data['Employees_G'][g] if (e, reunion) in asignacion['Y']]
+    assert len(sentados) == 1
+    faltantes = {(e, reunion) for e in data['Employees_G'][g] if e not in sentados}
+    assert faltantes <= set(asignacion['sin_escritorio'])
+    # Lo reportado no aparece como asistencia con escritorio
+    assert not set(asignacion['sin_escritorio']) & set(asignacion['Y'])
+
+def libres(inst, asignacion, e, t):
+    '''Escritorios permitidos para e (en alguna zona) libres el día t.'''
+    ocupados = {d for (e2, d, t2, z) in asignacion['X'] if t2 == t}
+    return {d for (d, z) in inst.edz_colaborador[e]} - ocupados
+
+@pytest.mark.parametrize('semilla', range(20))
+def test_reubicacion_usa_cualquier_escritorio_libre(data_instancia1, semilla):
+    import json
+    import random
+    from Funciones import importar_data
+    from Funciones_heuristica import heuristica_constructiva
+
+    # instance1 con 1 a 3 escritorios permitidos por colaborador
+    aleatorio = random.Random(semilla)
+    data = json.loads(json.dumps(data_instancia1))
+    for e in data['Employees']:
+        data['Desks_E'][e] = aleatorio.sample(data['Desks'], aleatorio.randint(1, 3))
+    inst = importar_data(data, imprimir=False)
+    asignacion = heuristica_constructiva(inst)
+
+    reunion = dict(asignacion['Z'])
+    asiste = set(asignacion['Y'])
+    for (e, t) in asignacion['sin_escritorio']:
+        if reunion.get(inst.grupo(e)) == t:
+            continue
+        # Una asistencia que no es de reunión solo se pierde si no hay otro día con escritorio libre
+        for t2 in inst.T:
+            if (e, t2) not in asiste:
+                assert not libres(inst, asignacion, e, t2), (e, t, t2)
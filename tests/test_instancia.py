@@ -0,0 +1,71 @@
+'''
+Pruebas de importar_data y del índice precalculado de Instancia sobre
+instances/instance1.json.
+'''
+
+def test_desempaquetado_igual_al_json(inst1, data_instancia1):
+    E, D, T, G, Z, dz, dr, e_g, di, max, min = inst1
+    assert (E, D, T, G, Z) == (data_instancia1['Employees'], data_instancia1['Desks'], data_instancia1['Days'],
+                               data_instancia1['Groups'], data_instancia1['Zones'])
+    assert (dz, dr, e_g, di) == (data_instancia1['Desks_Z'], data_instancia1['Desks_E'],
+                                 data_instancia1['Employees_G'], data_instancia1['Days_E'])
+    # Sin Min_Days/Max_Days en el JSON: una semana de 2 a 3 días
+    assert (max, min) == (3, 2)
+
+def test_importar_desde_diccionario(data_instancia1):
+    from Funciones import importar_data
+
+    data = dict(data_instancia1, Min_Days=4, Max_Days=6)
+    inst = importar_data(data, imprimir=False)
+    assert (inst.min, inst.max) == (4, 6)
+    assert inst.E == data_instancia1['Employees']
+
+def test_mapas_inversos(inst1):
+    for g in inst1.G:
+        for e in inst1.e_g[g]:
+            assert inst1.grupo(e) == g
+    for z in inst1.Z:
+        for d in inst1.dz[z]:
+            assert inst1.zona(d) == z
+    for e in inst1.E:
+        assert {t for t in inst1.T if inst1.prefiere(e, t)} == set(inst1.di[e])
+        assert [inst1.D[j] for j in inst1.escritorios_colaborador[inst1.id_E[e]]] == inst1.dr[e]
+    for d in inst1.D:
+        usuarios = {inst1.E[i] for i in inst1.colaboradores_escritorio[inst1.id_D[d]]}
+        assert usuarios == {e for e in inst1.E if d in inst1.dr[e]}
+
+def test_combinaciones_factibles(inst1):
+    esperadas = {(e, d, z) for e in inst1.E for z in inst1.Z for d in inst1.dz[z] if d in inst1.dr[e]}
+    assert set(inst1.EDZ) == esperadas
+    assert len(inst1.EDZ) == len(esperadas)
+    for (g, z), pares in inst1.edz_grupo_zona.items():
+        assert set(pares) == {(e, d) for (e, d, zona) in esperadas if zona == z and inst1.grupo(e) == g}
+
+def test_colaborador_sin_grupo_ni_zona(data_instancia1):
+    from Funciones import importar_data
+
+    data = dict(data_instancia1)
+    data['Employees'] = data_instancia1['Employees'] + ['E_nuevo']
+    data['Desks'] = data_instancia1['Desks'] + ['D_nuevo']
+    data['Desks_E'] = dict(data_instancia1['Desks_E'], E_nuevo=['D_nuevo'])
+    data['Days_E'] = dict(data_instancia1['Days_E'], E_nuevo=[])
+    inst = importar_data(data, imprimir=False)
+    assert inst.grupo('E_nuevo') is None
+    assert inst.zona('D_nuevo') is None
+    assert inst.edz_colaborador['E_nuevo'] == []
+
+def test_horizonte_de_mas_de_63_dias():
+    from Funciones import importar_data
+    from Generador_instancias import generar_instancia
+    from Funciones_matriciales import construir_matrices
+
+    # 14 semanas = 70 días: la máscara de días preferidos no cabe en 64 bits
+    inst = importar_data(generar_instancia(10, semilla=0, semanas=14), imprimir=False)
+    assert len(inst.T) == 70
+    for e in inst.E:
+        assert {t for t in inst.T if inst.prefiere(e, t)} == set(inst.di[e])
+
+    # La fila de epsilon tiene un coeficiente por combinación factible en un día preferido
+    modelo = construir_matrices(inst, 'F1', epsilon=1)
+    preferidas = sum(1 for (e, d, z) in inst.EDZ for t in inst.T if t in inst.di[e])
+    assert modelo.A.getrow(modelo.A.shape[0] - 1).nnz == preferidas
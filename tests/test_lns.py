@@ -0,0 +1,49 @@
+'''
+Pruebas de la búsqueda en vecindarios grandes sobre una instancia sintética:
+la mejor FO nunca empeora y la programación cumple la epsilon restriccion.
+'''
+import pytest
+
+@pytest.fixture(scope='module')
+def inst_sintetica(tmp_path_factory):
+    from Funciones import importar_data
+    from Generador_instancias import generar_instancia, guardar_instancia
+
+    ruta = guardar_instancia(generar_instancia(40, semilla=2), 'sintetica', str(tmp_path_factory.mktemp('lns')))
+    return importar_data(ruta, imprimir=False)
+
+@pytest.fixture(scope='module')
+def inicial(inst_sintetica):
+    from Funciones_heuristica import heuristica_constructiva
+
+    asignacion = heuristica_constructiva(inst_sintetica)
+    assert asignacion['sin_escritorio'] == []
+    return asignacion
+
+def test_fo_no_empeora_y_cumple_epsilon(inst_sintetica, inicial, cbc):
+    from pyomo.environ import value
+    from Funciones_modelos import cumple_epsilon, extraer_asignacion
+    from Funciones_lns import busqueda_lns
+
+    epsilon = sum(1 for (e, d, t, z) in inicial['X'] if inst_sintetica.prefiere(e, t))
+    model, iteraciones = busqueda_lns(inst_sintetica, 10, epsilon=epsilon, tiempo_iteracion=5, tamano=10, solver_path=cbc, imprimir=False)
+
+    assert iteraciones
+    mejores = [iteracion['Mejor_FO'] for iteracion in iteraciones]
+    assert all(b <= a + 1e-6 for a, b in zip(mejores, mejores[1:]))
+    assert value(model.F1.distribucion_rule) == pytest.approx(mejores[-1])
+    assert cumple_epsilon(inst_sintetica, extraer_asignacion(model), epsilon)
+
+def test_inicio_que_no_cumple_epsilon(inst_sintetica, inicial):
+    from Funciones_lns import busqueda_lns
+
+    epsilon = sum(1 for (e, d, t, z) in inicial['X'] if inst_sintetica.prefiere(e, t)) + 1
+    with pytest.raises(ValueError):
+        busqueda_lns(inst_sintetica, 1, asignacion=inicial, epsilon=epsilon, imprimir=False)
+
+def test_inicio_con_asistencias_sin_escritorio(inst_sintetica, inicial):
+    from Funciones_lns import busqueda_lns
+
+    asignacion = dict(inicial, sin_escritorio=[inicial['Y'][0]])
+    with pytest.raises(ValueError):
+        busqueda_lns(inst_sintetica, 1, asignacion=asignacion, imprimir=False)
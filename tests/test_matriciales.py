@@ -0,0 +1,67 @@
+'''
+Pruebas del generador matricial: el modelo construido con NumPy/SciPy debe
+tener las mismas filas, columnas y coeficientes no nulos que el de Pyomo, y
+el mismo óptimo.
+'''
+import pytest
+
+def dimensiones_pyomo(model):
+    '''Filas, columnas y coeficientes no nulos del modelo de Pyomo.'''
+    from pyomo.environ import Constraint, Var
+    from pyomo.repn import generate_standard_repn
+
+    restricciones = list(model.component_data_objects(Constraint, active=True))
+    columnas = sum(1 for _ in model.component_data_objects(Var))
+    no_nulos = sum(len(generate_standard_repn(c.body).linear_vars) for c in restricciones)
+    return len(restricciones), columnas, no_nulos
+
+@pytest.mark.parametrize('variante, formulacion_fuerte', [('F2', False), ('F1', False), ('F1', True)])
+def test_dimensiones_iguales_a_pyomo(inst1, variante, formulacion_fuerte):
+    from Funciones_modelos import construir_modelo, agregar_F1, agregar_F2
+    from Funciones_matriciales import construir_matrices
+
+    model = construir_modelo(inst1)
+    if variante == 'F2':
+        agregar_F2(model, inst1)
+    else:
+        agregar_F1(model, inst1, formulacion_fuerte=formulacion_fuerte)
+
+    modelo = construir_matrices(inst1, variante, formulacion_fuerte=formulacion_fuerte)
+    assert (modelo.A.shape[0], modelo.A.shape[1], modelo.A.nnz) == dimensiones_pyomo(model)
+
+def test_formulacion_fuerte_agrega_filas(inst1):
+    from Funciones_matriciales import construir_matrices
+
+    debil = construir_matrices(inst1, 'F1')
+    fuerte = construir_matrices(inst1, 'F1', formulacion_fuerte=True)
+    assert fuerte.A.shape[1] == debil.A.shape[1]
+    assert fuerte.A.shape[0] > debil.A.shape[0]
+
+def test_epsilon_agrega_una_fila(inst1):
+    from Funciones_matriciales import construir_matrices
+
+    base = construir_matrices(inst1, 'F1')
+    con_epsilon = construir_matrices(inst1, 'F1', epsilon=10)
+    assert con_epsilon.A.shape[0] == base.A.shape[0] + 1
+    assert con_epsilon.fila_lb[-1] == 10
+
+def test_mismo_optimo_que_pyomo(inst1):
+    pytest.importorskip('highspy')
+    from pyomo.contrib import appsi
+    from pyomo.environ import value
+    from Funciones_modelos import construir_modelo, agregar_F1, agregar_epsilon
+    from Funciones_matriciales import construir_matrices, resolver_matricial
+
+    model = construir_modelo(inst1)
+    agregar_F1(model, inst1)
+    agregar_epsilon(model, inst1, 25)
+    solver = appsi.solvers.Highs()
+    solver.config.mip_gap = 0
+    resultado = solver.solve(model)
+    assert resultado.termination_condition == appsi.base.TerminationCondition.optimal
+
+    # Un coeficiente o lado derecho distinto cambiaría el óptimo
+    modelo = construir_matrices(inst1, 'F1', epsilon=25)
+    resultado_matricial = resolver_matricial(modelo, tiempo_limite=300, tolerancia=0)
+    assert resultado_matricial.status == 0
+    assert resultado_matricial.fun == pytest.approx(value(model.F1.distribucion_rule))
@@ -0,0 +1,77 @@
+'''
+Pruebas de las utilidades de Funciones_modelos que no necesitan un solver.
+'''
+import pytest
+
+def resultado_cbc(condicion, estado=None):
+    '''SolverResults como los que arma el plugin de CBC de Pyomo.'''
+    from pyomo.opt import SolverResults
+
+    resultado = SolverResults()
+    resultado.solver.termination_condition = condicion
+    if estado is not None:
+        solucion = resultado.solution.add()
+        solucion.status = estado
+    return resultado
+
+@pytest.mark.parametrize('condicion, estado, esperado', [
+    ('optimal', 'optimal', True),
+    ('maxTimeLimit', 'stoppedByLimit', True),
+    ('maxTimeLimit', 'feasible', True),
+    ('intermediateNonInteger', 'other', False),
+    ('infeasible', 'infeasible', False),
+    ('maxTimeLimit', None, False),
+])
+def test_solucion_entera(condicion, estado, esperado):
+    from pyomo.opt import SolutionStatus, TerminationCondition
+    from Funciones_modelos import solucion_entera
+
+    resultado = resultado_cbc(getattr(TerminationCondition, condicion),
+                              getattr(SolutionStatus, estado) if estado is not None else None)
+    assert solucion_entera(resultado) is esperado
+
+def test_cumple_epsilon_coincide_con_la_restriccion(inst1):
+    from pyomo.environ import value
+    from Funciones_heuristica import heuristica_constructiva
+    from Funciones_modelos import construir_modelo, agregar_F1, agregar_epsilon, cargar_asignacion, cumple_epsilon
+
+    asignacion = heuristica_constructiva(inst1, imprimir=False)
+    satisfechas = sum(1 for (e, d, t, z) in asignacion['X'] if inst1.prefiere(e, t))
+
+    model = construir_modelo(inst1)
+    agregar_F1(model, inst1)
+    cargar_asignacion(model, inst1, asignacion)
+    for epsilon in (satisfechas, satisfechas + 1):
+        agregar_epsilon(model, inst1, epsilon)
+        restriccion = model.epsilon.epsilon_restriccion
+        assert cumple_epsilon(inst1, asignacion, epsilon) is (value(restriccion.body) >= value(restriccion.lower))
+    assert cumple_epsilon(inst1, asignacion, satisfechas)
+    assert not cumple_epsilon(inst1, asignacion, satisfechas + 1)
+
+@pytest.mark.parametrize('condicion, esperado', [
+    ('maxTimeLimit', True),
+    ('intermediateNonInteger', True),
+    ('infeasible', False),
+    ('optimal', False),
+])
+def test_agoto_tiempo(condicion, esperado):
+    from pyomo.opt import TerminationCondition
+    from Funciones_modelos import agoto_tiempo
+
+    assert agoto_tiempo(resultado_cbc(getattr(TerminationCondition, condicion))) is esperado
+    carrera = {'configuraciones': {'a': {'resultado': 'Stopped on time limit' if esperado else 'Problem proven infeasible'}}}
+    assert agoto_tiempo(carrera) is esperado
+
+def test_respaldo_heuristico_respeta_epsilon(inst1):
+    from pyomo.environ import value
+    from Funciones_modelos import construir_modelo, agregar_F1, usar_respaldo_heuristico
+
+    model = construir_modelo(inst1)
+    agregar_F1(model, inst1)
+    with pytest.raises(RuntimeError):
+        usar_respaldo_heuristico(model, inst1, epsilon=len(inst1.E) * len(inst1.T) + 1)
+    # Sin cargar nada: Y conserva su valor inicial
+    assert all(value(var) == 0 for var in model.Y.values())
+
+    usar_respaldo_heuristico(model, inst1)
+    assert any(value(var) == 1 for var in model.Y.values())
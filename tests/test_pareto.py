@@ -0,0 +1,22 @@
+'''
+Pruebas del barrido de la frontera de Pareto con CBC sobre instance1.
+'''
+
+def test_tramo_sin_solucion_inicial_infactible(inst1, cbc):
+    from Funciones_heuristica import heuristica_constructiva
+    from Funciones_modelos import cumple_epsilon
+    from Funciones_pareto import resolver_tramo
+
+    asignacion = heuristica_constructiva(inst1)
+    satisfechas = sum(1 for (e, t) in asignacion['Y'] if inst1.prefiere(e, t))
+    # El primer punto exige más de lo que satisface la solución inicial
+    epsilons = [satisfechas + 2, satisfechas - 5]
+    assert not cumple_epsilon(inst1, asignacion, epsilons[0])
+
+    puntos = resolver_tramo(inst1, epsilons, asignacion, tiempo_limite=5, solver_path=cbc)
+    assert [p['Epsilon'] for p in puntos] == sorted(epsilons, reverse=True)
+    for punto in puntos:
+        if punto['FO'] is not None:
+            assert punto['Preferencias'] >= punto['Epsilon']
+    # El punto más holgado siempre tiene solución (al menos la del punto anterior o la inicial)
+    assert puntos[-1]['FO'] is not None
@@ -0,0 +1,40 @@
+'''
+Pruebas del modo carrera que no necesitan CBC: la solución inicial escrita
+para -mipstart y la lectura de incumbentes de la salida de cada proceso.
+'''
+
+def test_escribir_inicio_con_nombres_del_lp(inst1, tmp_path):
+    from Funciones_heuristica import heuristica_constructiva
+    from Funciones_modelos import construir_modelo, agregar_F1, cargar_asignacion
+    from Funciones_portafolio import _escribir_inicio
+
+    model = construir_modelo(inst1)
+    agregar_F1(model, inst1)
+    asignacion = heuristica_constructiva(inst1, imprimir=False)
+    cargar_asignacion(model, inst1, asignacion)
+
+    _, simbolos_id = model.write(str(tmp_path / 'modelo.lp'), format='lp', io_options={'symbolic_solver_labels': True})
+    simbolos = {nombre: var for nombre, var in model.solutions.symbol_map[simbolos_id].bySymbol.items() if hasattr(var, 'fixed')}
+    ruta = tmp_path / 'inicio.soln'
+    escritas = _escribir_inicio(str(ruta), simbolos)
+
+    with open(ruta, 'r') as f:
+        filas = [linea.split() for linea in f]
+    assert len(filas) == escritas
+    nombres = {fila[1] for fila in filas}
+    # Toda variable X de la asignación está en el archivo con valor 1
+    for indice in asignacion['X']:
+        assert model.solutions.symbol_map[simbolos_id].getSymbol(model.X[indice]) in nombres
+    assert all(float(fila[2]) != 0 for fila in filas)
+
+def test_incumbente_del_mipstart():
+    from Funciones_portafolio import _leer_salida
+
+    class Proceso:
+        stdout = ['Cbc0045I MIPStart provided solution with cost 39\n',
+                  'Cbc0012I Integer solution of 12 found by DiveCoefficient after 10 iterations\n',
+                  'Result - Stopped on time limit\n']
+
+    estado = {'base': {'incumbentes': [], 'resultado': None}}
+    _leer_salida(Proceso, 'base', estado)
+    assert estado['base'] == {'incumbentes': [39.0, 12.0], 'resultado': 'Stopped on time limit'}
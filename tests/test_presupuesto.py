@@ -0,0 +1,68 @@
+'''
+Pruebas del predictor de tiempos: ajuste por variante y tratamiento de las
+corridas que no alcanzaron el gap objetivo (censuradas).
+'''
+import pytest
+
+def caracteristicas(E):
+    return {'E': E, 'D': E, 'Z': 4, 'G': E // 5, 'densidad': 0.5}
+
+def corrida(instancia, variante, E, tiempo, alcanza=True, tiempo_total=None):
+    '''Corrida cuya curva llega a gap 0 en tiempo (o se queda en 0.2 si no alcanza).'''
+    curva = [(1, 0.5), (tiempo, 0.0 if alcanza else 0.2)]
+    return {'instancia': instancia, 'variante': variante, 'caracteristicas': caracteristicas(E),
+            'curva': curva, 'tiempo_limite': tiempo_total or tiempo, 'gap_final': curva[-1][1],
+            'tiempo_total': tiempo_total or tiempo}
+
+def test_ajuste_por_variante():
+    from Funciones_presupuesto import PredictorTiempo
+
+    corridas = [corrida('instance1', 'F1', 20, 100), corrida('instance1', 'F2', 20, 5)]
+    f1 = PredictorTiempo(0.01, 'F1').ajustar(corridas)
+    f2 = PredictorTiempo(0.01, 'F2').ajustar(corridas)
+    assert f1.predecir(caracteristicas(20)) == pytest.approx(100)
+    assert f2.predecir(caracteristicas(20)) == pytest.approx(5)
+    assert PredictorTiempo(0.01, 'epsilon').ajustar(corridas).predecir(caracteristicas(20)) is None
+
+def test_corridas_censuradas_fuera_del_ajuste():
+    from Funciones_presupuesto import PredictorTiempo
+
+    corridas = [corrida('instance1', 'F1', 20, 100),
+                corrida('instance2', 'F1', 20, 30, alcanza=False, tiempo_total=30)]
+    predictor = PredictorTiempo(0.01, 'F1').ajustar(corridas)
+    # La corrida censurada no baja la predicción de las demás instancias
+    assert predictor.predecir(caracteristicas(20), 'instance1') == pytest.approx(100)
+    assert predictor.censuradas == {'instance2': 30}
+
+    # Y es cota inferior del tiempo de su propia instancia
+    corridas.append(corrida('instance2', 'F1', 20, 500, alcanza=False, tiempo_total=500))
+    predictor = PredictorTiempo(0.01, 'F1').ajustar(corridas)
+    assert predictor.predecir(caracteristicas(20), 'instance2') == pytest.approx(500)
+
+def test_crear_trabajos_tiempo_por_variante():
+    from Funciones_despliegue import crear_trabajos
+
+    trabajos = crear_trabajos(['instance1'], ['F1', 'F2'], {('instance1', 'F1'): 100, ('instance1', 'F2'): 10})
+    assert [t['tiempo_limite'] for t in trabajos] == [100, 10]
+    assert crear_trabajos(['instance1'], ['F1'], {'instance1': 50})[0]['tiempo_limite'] == 50
+
+def test_presupuesto_repartido_entre_variantes():
+    from Funciones_presupuesto import repartir_presupuesto
+
+    assert repartir_presupuesto(1000, ['F1']) == {'F1': 1000}
+    reparto = repartir_presupuesto(1000, ['F1', 'F2', 'epsilon'])
+    assert reparto == {'F1': 250, 'F2': 250, 'epsilon': 500}
+    assert sum(reparto.values()) == 1000
+
+def test_propuesta_no_supera_el_presupuesto(tmp_path):
+    from Funciones_presupuesto import proponer_tiempos
+
+    historial = str(tmp_path / 'historial.jsonl')
+    caracteristicas_instancias = {'instance1': caracteristicas(20), 'instance2': caracteristicas(40), 'instance3': caracteristicas(80)}
+    propuesta = proponer_tiempos(caracteristicas_instancias, historial, 500, minimo=60, defecto=1000)
+    assert sum(propuesta.values()) <= 500
+    assert all(tiempo >= 60 for tiempo in propuesta.values())
+
+    # Sin presupuesto para el mínimo de cada instancia
+    with pytest.raises(ValueError):
+        proponer_tiempos({'instance1': caracteristicas(20), 'instance2': caracteristicas(40)}, historial, 100, minimo=60, defecto=1000)
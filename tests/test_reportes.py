@@ -0,0 +1,68 @@
+'''
+Pruebas del contenido de los reportes derivados de tablas_solucion,
+comparado con lo que se calcula directamente de la asignación de la
+heurística constructiva sobre instance1.
+'''
+import pytest
+
+@pytest.fixture(scope='module')
+def asignacion(inst1):
+    from Funciones_heuristica import heuristica_constructiva
+    return heuristica_constructiva(inst1, imprimir=False)
+
+@pytest.fixture(scope='module')
+def tablas(inst1, asignacion):
+    from Funciones import Solucion, tablas_solucion
+    return tablas_solucion(Solucion(asignacion['X'], asignacion['Y'], asignacion['Z']), inst1.e_g)
+
+def test_tablas_una_fila_por_variable_activa(tablas, asignacion):
+    assert len(tablas['asignaciones']) == len(asignacion['X'])
+    assert sorted(tablas['asistencias'].itertuples(index=False, name=None)) == sorted(asignacion['Y'])
+    assert sorted(tablas['reuniones'].itertuples(index=False, name=None)) == sorted(asignacion['Z'])
+
+def test_resumen(inst1, asignacion, tablas):
+    from Funciones import resumen
+
+    df = resumen(inst1.E, inst1.D, inst1.T, inst1.Z, tablas, inst1.di, inst1.e_g)
+    assert list(df['Empleado']) == inst1.E
+    for fila in df.itertuples(index=False):
+        dias = [t for t in inst1.T if (fila.Empleado, t) in asignacion['Y']]
+        assert fila.Días_Asignados == dias
+        assert fila.Eficiencia == round(sum(inst1.prefiere(fila.Empleado, t) for t in dias) / len(dias), 2)
+        assert fila.Grupo == inst1.grupo(fila.Empleado)
+        assert set(fila.Zonas_Asignadas) == {z for (e, d, t, z) in asignacion['X'] if e == fila.Empleado}
+
+def test_reuniones_y_programacion_primario(inst1, asignacion, tablas):
+    from Funciones import reuniones, programacion_primario
+
+    dia = dict(asignacion['Z'])
+    df = reuniones(inst1.G, inst1.T, tablas, inst1.e_g, inst1.D, inst1.Z)
+    assert list(df['Grupo']) == inst1.G
+    assert list(df['Día_Reunión']) == [dia[g] for g in inst1.G]
+    for fila in df.itertuples(index=False):
+        zonas = {z for (e, d, t, z) in asignacion['X'] if t == fila.Día_Reunión and inst1.grupo(e) == fila.Grupo}
+        assert set(fila.Zonas_Asignadas) == zonas
+        assert fila.Colaboradores_Grupo == inst1.e_g[fila.Grupo]
+
+    df = programacion_primario(tablas, inst1.G, inst1.T, inst1.e_g, inst1.D, inst1.Z)
+    # Una fila por integrante, en el orden de los grupos y sus integrantes
+    assert list(df['Empleado']) == [e for g in inst1.G for e in inst1.e_g[g]]
+    for fila in df.itertuples(index=False):
+        assert (fila.Empleado, fila.Escritorio, fila.Día_Reunión, fila.Zona) in asignacion['X']
+
+def test_preferencias(inst1, asignacion, tablas, capsys):
+    from Funciones import preferencias
+
+    satisfechas = sum(1 for (e, t) in asignacion['Y'] if inst1.prefiere(e, t))
+    preferencias(tablas, inst1.E, inst1.T, inst1.di)
+    salida = capsys.readouterr().out
+    assert f'Preferencias satisfechas: {satisfechas}' in salida
+    assert f'Total de días de presencialidad asignados: {len(asignacion["Y"])}' in salida
+    assert f'{100 * satisfechas / len(asignacion["Y"]):.2f}%' in salida
+
+def test_programacion_asignacion_igual_a_programacion(inst1, asignacion, tablas):
+    import pandas as pd
+    from Funciones import programacion, programacion_asignacion
+
+    pd.testing.assert_frame_equal(programacion(tablas, inst1.E, inst1.D, inst1.T, inst1.Z, inst1.e_g),
+                                  programacion_asignacion(asignacion['X'], inst1.e_g))
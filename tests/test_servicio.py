@@ -0,0 +1,57 @@
+'''
+Prueba del servicio de programación de punta a punta (HTTP, pool de
+procesos y CBC) con instance1. Necesita un ejecutable de CBC: el del PATH o
+el que trae PuLP.
+'''
+import json
+import time
+import threading
+from urllib.request import Request, urlopen
+
+import pytest
+
+@pytest.fixture
+def url_servicio(tmp_path, cbc):
+    from http.server import ThreadingHTTPServer
+    from Servicio_programacion import Servicio, ManejadorServicio
+
+    servidor = ThreadingHTTPServer(('127.0.0.1', 0), ManejadorServicio)
+    servidor.servicio = Servicio(procesos=1, carpeta=str(tmp_path), solver_path=cbc)
+    hilo = threading.Thread(target=servidor.serve_forever, daemon=True)
+    hilo.start()
+    yield f'http://127.0.0.1:{servidor.server_address[1]}'
+    servidor.shutdown()
+    servidor.server_close()
+    servidor.servicio.cerrar()
+
+def pedir(url, data=None):
+    solicitud = Request(url, data=None if data is None else json.dumps(data).encode('utf-8'), method='POST' if data is not None else 'GET')
+    with urlopen(solicitud) as respuesta:
+        return respuesta.status, json.loads(respuesta.read())
+
+def test_envio_deduplicado_y_progreso(url_servicio, data_instancia1, inst1):
+    codigo, primero = pedir(f'{url_servicio}/trabajos?tiempo_limite=5', data_instancia1)
+    assert codigo == 202 and primero['nuevo']
+    codigo, segundo = pedir(f'{url_servicio}/trabajos?tiempo_limite=5', data_instancia1)
+    assert codigo == 200 and not segundo['nuevo']
+    assert segundo['id'] == primero['id']
+
+    estados = []
+    limite = time.time() + 120
+    while time.time() < limite:
+        _, estado = pedir(f"{url_servicio}/trabajos/{primero['id']}")
+        estados.append(estado)
+        if estado['estado'] in ('completado', 'error'):
+            break
+        time.sleep(0.2)
+
+    final = estados[-1]
+    assert final['estado'] == 'completado', final
+    # El trabajo pasa por resolviendo y el log de CBC ya trae incumbente y gap
+    assert 'resolviendo' in [e['estado'] for e in estados]
+    assert final['incumbente'] is not None and final['gap'] is not None
+
+    _, tabla = pedir(f"{url_servicio}/trabajos/{primero['id']}/programacion")
+    assert {fila['Empleado'] for fila in tabla} == set(inst1.E)
+    for fila in tabla:
+        assert fila['Escritorio'] in inst1.dr[fila['Empleado']]
@@ -0,0 +1,72 @@
+'''
+Pruebas del almacenamiento compacto de soluciones (npz) y de los reportes
+derivados de una sola extracción, sobre instance1 con la programación de la
+heurística constructiva cargada en el modelo F1 (sin solver).
+'''
+import pytest
+
+@pytest.fixture(scope='module')
+def modelo_resuelto(inst1):
+    from Funciones_modelos import construir_modelo, agregar_F1, cargar_asignacion
+    from Funciones_heuristica import heuristica_constructiva
+
+    model = construir_modelo(inst1, nombre='Universidad')
+    agregar_F1(model, inst1)
+    cargar_asignacion(model, inst1, heuristica_constructiva(inst1, imprimir=False))
+    return model
+
+@pytest.fixture(scope='module')
+def solucion_cargada(modelo_resuelto, tmp_path_factory):
+    from Funciones import exportar_solucion, cargar_solucion
+
+    carpeta = str(tmp_path_factory.mktemp('Model_outputs'))
+    exportar_solucion(modelo_resuelto, 'instance1', carpeta, gap=0.5, metadatos={'variante': 'F1', 'tiempo_limite': 10})
+    return cargar_solucion('instance1', carpeta)
+
+def test_ida_y_vuelta_npz(modelo_resuelto, solucion_cargada):
+    from pyomo.environ import value
+    from Funciones import solucion_desde_modelo
+    from Funciones_modelos import extraer_asignacion
+
+    original = solucion_desde_modelo(modelo_resuelto)
+    asignacion = extraer_asignacion(modelo_resuelto)
+    for nombre in ('X', 'Y', 'Z'):
+        assert sorted(solucion_cargada.asignacion()[nombre]) == sorted(asignacion[nombre])
+    assert sorted(solucion_cargada.Penalizacion) == sorted(original.Penalizacion)
+    assert sorted(solucion_cargada.Penalizacion2) == sorted(original.Penalizacion2)
+    assert solucion_cargada.J == original.J
+    assert solucion_cargada.objetivo == pytest.approx(value(modelo_resuelto.F1.distribucion_rule))
+    assert solucion_cargada.gap == 0.5
+    assert solucion_cargada.metadatos == {'variante': 'F1', 'tiempo_limite': 10}
+
+def test_tablas_iguales(inst1, modelo_resuelto, solucion_cargada):
+    import pandas as pd
+    from Funciones import tablas_solucion
+
+    del_modelo = tablas_solucion(modelo_resuelto, inst1.e_g)
+    de_npz = tablas_solucion(solucion_cargada, inst1.e_g)
+    for nombre, columnas in (('asignaciones', ['Empleado', 'Día']), ('asistencias', ['Empleado', 'Día']), ('reuniones', ['Grupo', 'Día'])):
+        pd.testing.assert_frame_equal(del_modelo[nombre].sort_values(columnas).reset_index(drop=True),
+                                      de_npz[nombre].sort_values(columnas).reset_index(drop=True))
+
+def test_reportes_iguales(inst1, modelo_resuelto, solucion_cargada):
+    import pandas as pd
+    from Funciones import tablas_solucion, resumen, reuniones, programacion_primario, programacion
+
+    E, D, T, G, Z, dz, dr, e_g, di, max, min = inst1
+    tablas = tablas_solucion(modelo_resuelto, e_g)
+    for fuente in (modelo_resuelto, solucion_cargada):
+        pd.testing.assert_frame_equal(resumen(E, D, T, Z, fuente, di, e_g), resumen(E, D, T, Z, tablas, di, e_g))
+        pd.testing.assert_frame_equal(reuniones(G, T, fuente, e_g, D, Z), reuniones(G, T, tablas, e_g, D, Z))
+        pd.testing.assert_frame_equal(programacion_primario(fuente, G, T, e_g, D, Z), programacion_primario(tablas, G, T, e_g, D, Z))
+        pd.testing.assert_frame_equal(programacion(fuente, E, D, T, Z, e_g), programacion(tablas, E, D, T, Z, e_g))
+
+def test_programacion_consistente(inst1, solucion_cargada):
+    from Funciones import programacion
+
+    df = programacion(solucion_cargada, inst1.E, inst1.D, inst1.T, inst1.Z, inst1.e_g)
+    assert len(df) == len(solucion_cargada.X)
+    # Cada escritorio asignado pertenece a la zona reportada y es permitido para el colaborador
+    for fila in df.itertuples(index=False):
+        assert fila.Escritorio in inst1.dz[fila.Zona]
+        assert fila.Escritorio in inst1.dr[fila.Empleado]
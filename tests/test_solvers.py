@@ -0,0 +1,60 @@
+'''
+Pruebas que resuelven modelos con un solver real (CBC o HiGHS); se omiten si
+el solver no está disponible.
+'''
+import os
+import subprocess
+import sys
+
+import pytest
+
+def test_resolver_modelo_F2_en_proceso_nuevo(cbc):
+    # Un proceso que solo importa Funciones_modelos debe encontrar el plugin de CBC
+    codigo = (
+        'from Funciones_modelos import resolver_modelo_F2\n'
+        f"preferencias, porcentaje, model, asignacion = resolver_modelo_F2('instance1', 60, solver_path={cbc!r})\n"
+        'assert asignacion["Y"]\n'
+    )
+    resultado = subprocess.run([sys.executable, '-c', codigo], cwd=os.getcwd(), capture_output=True, text=True)
+    assert resultado.returncode == 0, resultado.stderr
+
+def test_sesion_persistente_entre_objetivos(inst1):
+    pytest.importorskip('highspy')
+    from pyomo.contrib.appsi.base import TerminationCondition
+    from pyomo.environ import value
+    from Funciones_modelos import SesionSolver, construir_modelo, agregar_F1, agregar_F2, agregar_epsilon, retirar_bloque, extraer_asignacion, cumple_epsilon
+
+    sesion = SesionSolver(tiempo_limite=60, tolerancia=0, mostrar_log=False)
+    model = construir_modelo(inst1)
+
+    # F2
+    agregar_F2(model, inst1)
+    resultado = sesion.resolver(model)
+    assert resultado.termination_condition == TerminationCondition.optimal
+    satisfaccion = value(model.F2.satisfaccion)
+    asistencias = len(extraer_asignacion(model)['Y'])
+
+    # F1 con epsilon sobre el mismo modelo: solo cambian los bloques activos
+    retirar_bloque(model, 'F2')
+    agregar_F1(model, inst1)
+    epsilon = round(asistencias * 0.65)
+    agregar_epsilon(model, inst1, epsilon)
+    resultado = sesion.resolver(model)
+    assert resultado.termination_condition == TerminationCondition.optimal
+    assert value(model.F1.distribucion_rule) == pytest.approx(resultado.best_feasible_objective)
+    assert cumple_epsilon(inst1, extraer_asignacion(model), epsilon)
+
+    # Epsilon imposible: solo cambia el parámetro mutable
+    agregar_epsilon(model, inst1, len(inst1.E) * len(inst1.T) + 1)
+    resultado = sesion.resolver(model)
+    assert resultado.termination_condition == TerminationCondition.infeasible
+    assert resultado.best_feasible_objective is None
+
+    # De vuelta a F2: mismo óptimo que al principio
+    retirar_bloque(model, 'F1')
+    retirar_bloque(model, 'epsilon')
+    agregar_F2(model, inst1)
+    resultado = sesion.resolver(model)
+    assert resultado.termination_condition == TerminationCondition.optimal
+    assert value(model.F2.satisfaccion) == pytest.approx(satisfaccion)
+    assert sesion.model is model
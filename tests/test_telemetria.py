@@ -0,0 +1,91 @@
+'''
+Pruebas de la lectura de logs de CBC y HiGHS (telemetría) con extractos de
+corridas reales de F1 sobre instance3 (límite de 15 y 10 segundos).
+'''
+import os
+
+import pytest
+
+DATOS = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'datos')
+
+def test_log_cbc_raiz_y_resumen():
+    from Funciones_modelos import leer_log_cbc
+
+    log = leer_log_cbc(os.path.join(DATOS, 'cbc_instance3_F1.log'))
+
+    assert log['cota_raiz'] == pytest.approx(15.383)
+    assert log['cortes_raiz'] == 754
+    assert log['gap_raiz'] == pytest.approx((53 - 15.383) / 53)
+    assert log['tiempo_primera_solucion'] == pytest.approx(0.62)
+    assert log['estado'] == 'Stopped on time limit'
+    assert log['objetivo'] == 53
+    assert log['cota_final'] == pytest.approx(15.383)
+    assert log['iteraciones'] == 82752
+    assert log['cortes']['Probing'] == 8462
+    assert log['cortes']['ZeroHalf'] == 704
+
+    # El punto de la raíz es el primero con cota y gap
+    raiz = log['telemetria'][-1]
+    assert raiz['cota'] == pytest.approx(15.383)
+    assert raiz['gap'] == pytest.approx(log['gap_raiz'])
+
+@pytest.mark.parametrize('linea, cota, cortes', [
+    ('Cbc0013I At root node, 754 cuts changed objective from 2.7689601 to 15.383 in 49 passes', 15.383, 754),
+    ('Cbc0013I At root node, 12 cuts changing 3 objective from 1.5 to 4.25 in 7 passes (0.31 seconds)', 4.25, 12),
+])
+def test_log_cbc_formatos_raiz(tmp_path, linea, cota, cortes):
+    from Funciones_modelos import leer_log_cbc
+
+    ruta = tmp_path / 'cbc.log'
+    ruta.write_text(linea + '\n')
+    log = leer_log_cbc(str(ruta))
+    assert log['cota_raiz'] == pytest.approx(cota)
+    assert log['cortes_raiz'] == cortes
+    assert len(log['telemetria']) == 1
+
+def test_combinar_conserva_raiz_del_primer_tramo():
+    from Funciones_modelos import leer_log_cbc, combinar_logs_cbc
+
+    log = leer_log_cbc(os.path.join(DATOS, 'cbc_instance3_F1.log'))
+    combinado = combinar_logs_cbc([(0, log), (15, log)])
+    assert combinado['cota_raiz'] == log['cota_raiz']
+    assert combinado['iteraciones'] == 2 * log['iteraciones']
+    assert combinado['telemetria'][-1]['segundos'] == pytest.approx(15 + log['telemetria'][-1]['segundos'])
+
+def test_log_highs():
+    from Funciones_modelos import leer_log_highs
+
+    log = leer_log_highs(os.path.join(DATOS, 'highs_instance3_F1.log'))
+
+    assert [p['segundos'] for p in log['telemetria']] == [0.0, 0.1, 5.1, 10.0]
+    assert log['telemetria'][0]['cota'] is None
+    assert log['telemetria'][-1]['cota'] == pytest.approx(11.8788432)
+    assert log['tiempo_primera_solucion'] == 0.0
+    assert log['estado'] == 'Time limit reached'
+    assert log['objetivo'] == 62
+    assert log['cota_final'] == 12
+    assert log['gap_final'] == pytest.approx(0.8065)
+    assert log['iteraciones'] == 67441
+
+def test_log_highs_lee_la_ultima_corrida(tmp_path):
+    from Funciones_modelos import leer_log_highs
+
+    with open(os.path.join(DATOS, 'highs_instance3_F1.log'), 'r') as f:
+        texto = f.read()
+    ruta = tmp_path / 'highs.log'
+    ruta.write_text(texto.replace('Primal bound      62', 'Primal bound      70') + texto)
+    log = leer_log_highs(str(ruta))
+    assert log['objetivo'] == 62
+    assert len(log['telemetria']) == 4
+
+def test_guardar_telemetria(tmp_path):
+    import csv
+    import json
+    from Funciones_modelos import leer_log_cbc, guardar_telemetria
+
+    log = leer_log_cbc(os.path.join(DATOS, 'cbc_instance3_F1.log'))
+    ruta_csv, ruta_json = guardar_telemetria(log, str(tmp_path), 'instance3')
+    with open(ruta_csv, 'r') as f:
+        assert len(list(csv.DictReader(f))) == len(log['telemetria'])
+    with open(ruta_json, 'r') as f:
+        assert json.load(f)['cota_raiz'] == pytest.approx(15.383)